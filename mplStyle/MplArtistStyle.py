@@ -43,6 +43,45 @@ from . import types as S
 
 __all__ = [ 'MplArtistStyle' ]
 
+# Map the style name to mpl property name
+ARTIST_PROPERTY_MAP = {
+   'alpha'   : 'alpha',
+   'clip'    : 'clip_on',
+   'snap'    : 'snap',
+   'visible' : 'visible',
+   'zOrder'  : 'zorder',
+}
+
+#===========================================================================
+def changedValues( obj, kw ):
+   """: Get the values that are different from the current values of an object.
+
+   The current values are found with the matplotlib getters.  Values without
+   a getter, or that cannot be compared, are treated as changed.
+
+   = INPUT VARIABLES
+   - obj   The matplotlib object.
+   - kw    A dictionary of matplotlib property names and values to set.
+
+   = RETURN VALUE
+   - Returns a dictionary with the values in 'kw' that need to be set.
+   """
+   changed = {}
+
+   for key, value in kw.iteritems():
+      getter = getattr( obj, 'get_' + key, None )
+
+      if getter is not None:
+         try:
+            if getter() == value:
+               continue
+         except Exception:
+            pass
+
+      changed[ key ] = value
+
+   return changed
+
 #===========================================================================
 class MplArtistStyle( S.SubStyle ):
    """: Style properties for matplotlib Artists.
@@ -84,28 +123,92 @@ best and there is no need to change this.
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      # Map the style name to mpl property name
-      properties = {
-         'alpha'   : 'alpha',
-         'clip'    : 'clip_on',
-         'snap'    : 'snap',
-         'visible' : 'visible',
-         'zOrder'  : 'zorder',
-      }
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
 
-      kw = {}
+   #-----------------------------------------------------------------------
+   def compile( self, defaults = {}, **kwargs ):
+      """: Compile this style into a plan that can be applied later.
+
+      The plan holds the final matplotlib property values and does not refer
+      back to this style, so it can be applied any number of times with
+      'applyPlan'.  The plan must not be modified.
+
+      The values of this style and of any sub-styles that apply to the same
+      artist (see '_compileValues') are set with a single 'update' call.
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
+
+      = RETURN VALUE
+      - Returns a list of matplotlib keyword-value dictionaries.  Each entry
+        is passed to a single 'update' call on the styled object.
+      """
+      kw = self._compileValues( defaults, **kwargs )
+
+      # Only keep an update if there is something to update
+      plan = []
+      if kw:
+         plan.append( kw )
+
+      return plan
+
+   #-----------------------------------------------------------------------
+   def _compileValues( self, defaults = {}, **kwargs ):
+      """: Get the matplotlib property values set by this style.
+
+      Derived classes add their values to the result of the base class, so
+      that all of the values are in one dictionary.
 
-      for p in properties:
-         mplProp = properties[ p ]
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
 
+      = RETURN VALUE
+      - Returns a dictionary of the matplotlib property names and values.
+      """
+      kw = {}
+      for p, mplProp in ARTIST_PROPERTY_MAP.iteritems():
          value = self.getValue( p, defaults, **kwargs )
 
          if value is not None:
             kw[ mplProp ] = value
 
-      # Only call update if there is something to update
-      if kw:
-         obj.update( kw )
+      return kw
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
+
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      MplArtistStyle.applyPlanToAll( [ obj ], plan )
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlanToAll( objs, plan ):
+      """: Apply a plan created by 'compile' to each of the given objects.
+
+      Only the values that are different from the current values of each
+      object are set, so applying the same plan again does not call any of
+      the matplotlib setters.
+
+      = INPUT VARIABLES
+      - objs   The list of objects to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      for obj in objs:
+         for kw in plan:
+            kw = changedValues( obj, kw )
+            if kw:
+               obj.update( kw )
 
    #-----------------------------------------------------------------------
 
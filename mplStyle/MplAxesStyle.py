@@ -40,16 +40,36 @@ __version__ = "$Revision: #1 $"
 #===========================================================================
 
 from . import types as S
+from .MplArtistStyle import changedValues
 from .MplAxisStyle import MplAxisStyle
 from .MplBasicLineStyle import MplBasicLineStyle
 from .MplPatchStyle import MplPatchStyle
 from .MplTextStyle import MplTextStyle
 
+from collections import OrderedDict
+
 import matplotlib.axes as mplaxes
 #===========================================================================
 
 __all__ = [ 'MplAxesStyle' ]
 
+# Maps the edge style names to the matplotlib spine names, in the order the
+# edges are styled.
+AXES_EDGE_MAP = OrderedDict( [
+   ( 'leftEdge', 'left' ),
+   ( 'rightEdge', 'right' ),
+   ( 'topEdge', 'top' ),
+   ( 'bottomEdge', 'bottom' ),
+] )
+
+# Maps the Axes values of a plan to the matplotlib Axes property names.
+AXES_PROPERTY_MAP = OrderedDict( [
+   ( 'zOrder', 'zorder' ),
+   ( 'axisBelow', 'axisbelow' ),
+   ( 'bgColor', 'axis_bgcolor' ),
+   ( 'showFrame', 'frame_on' ),
+] )
+
 #===========================================================================
 class MplAxesStyle( S.SubStyle ):
    """: Style properties for matplotlib Axes.
@@ -219,11 +239,23 @@ any sub-component's labels only if they do not have any property values set.
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      if not isinstance( obj, mplaxes.Axes ):
-         msg = "Unable to apply this sub-style to the given element." \
-               "Expected a matplotlib 'Axes' and instead received " \
-               "the following:\n%s" % (obj,)
-         raise Exception( msg )
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
+
+   #-----------------------------------------------------------------------
+   def compile( self, defaults = {}, **kwargs ):
+      """: Compile this style into a plan that can be applied later.
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
+
+      = RETURN VALUE
+      - Returns a dictionary of the compiled plans for each axes component
+        and the axes values to set.
+      """
+      plan = {}
 
       # First update the defaults for all children components
       defaults = S.lib.resolveDefaults( defaults,
@@ -232,65 +264,87 @@ any sub-component's labels only if they do not have any property values set.
                                         labels = self.labels )
 
       # Set the bg patch properties
-      self._patch.apply( obj.patch, defaults,
-                         alpha = kwargs.get( 'alpha', None ),
-                         color = kwargs.get( 'bgColor', None ),
-                         visible = kwargs.get( 'visible', None ),
-                         zOrder = kwargs.get( 'zOrder', None ) )
-      value = self.getValue( 'zOrder', defaults, **kwargs )
-      if value is not None:
-         obj.set_zorder( value )
-
-      # axisBelow
-      value = self.getValue( 'axisBelow', defaults, **kwargs )
-      if value is not None:
-         obj.set_axisbelow( value )
-
-      # bgColor
-      value = self.getValue( 'bgColor', defaults, **kwargs )
-      if value is not None:
-         obj.set_axis_bgcolor( value )
-
-      # showFrame
-      value = self.getValue( 'showFrame', defaults, **kwargs )
-      if value is not None:
-         obj.set_frame_on( value )
+      plan[ 'patch' ] = self._patch.compile( defaults,
+                                 alpha = kwargs.get( 'alpha', None ),
+                                 color = kwargs.get( 'bgColor', None ),
+                                 visible = kwargs.get( 'visible', None ),
+                                 zOrder = kwargs.get( 'zOrder', None ) )
+
+      # zOrder, axisBelow, bgColor and showFrame
+      for p in AXES_PROPERTY_MAP:
+         plan[ p ] = self.getValue( p, defaults, **kwargs )
 
       # X-Axis
       subKwargs = kwargs.get( 'xAxis', {} )
       subDefaults = S.lib.resolveDefaults( defaults, ['xAxis'] )
-      self.xAxis.apply( obj.get_xaxis(), subDefaults, **subKwargs )
+      plan[ 'xAxis' ] = self.xAxis.compile( subDefaults, **subKwargs )
 
       # Y-Axis
       subKwargs = kwargs.get( 'yAxis', {} )
       subDefaults = S.lib.resolveDefaults( defaults, ['yAxis'] )
-      self.yAxis.apply( obj.get_yaxis(), subDefaults, **subKwargs )
+      plan[ 'yAxis' ] = self.yAxis.compile( subDefaults, **subKwargs )
 
       # Title text
       subKwargs = kwargs.get( 'title', {} )
       subDefaults = S.lib.resolveDefaults( defaults,
                                            ['text', 'labels', 'title'] )
-      self.title.apply( obj.title, subDefaults, **subKwargs )
+      plan[ 'title' ] = self.title.compile( subDefaults, **subKwargs )
 
       # Edges
       defaults = S.lib.resolveDefaults( defaults, width = self.frameWidth,
                                                   alpha = self.alpha )
 
-      subKwargs = kwargs.get( 'leftEdge', {} )
-      subDefaults = S.lib.resolveDefaults( defaults, ['leftEdge'] )
-      self.leftEdge.apply( obj.spines[ 'left' ], subDefaults, **subKwargs )
+      for name in AXES_EDGE_MAP:
+         subKwargs = kwargs.get( name, {} )
+         subDefaults = S.lib.resolveDefaults( defaults, [ name ] )
+         plan[ name ] = getattr( self, name ).compile( subDefaults,
+                                                       **subKwargs )
 
-      subKwargs = kwargs.get( 'rightEdge', {} )
-      subDefaults = S.lib.resolveDefaults( defaults, ['rightEdge'] )
-      self.rightEdge.apply( obj.spines[ 'right' ], subDefaults, **subKwargs )
+      return plan
 
-      subKwargs = kwargs.get( 'topEdge', {} )
-      subDefaults = S.lib.resolveDefaults( defaults, ['topEdge'] )
-      self.topEdge.apply( obj.spines[ 'top' ], subDefaults, **subKwargs )
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
 
-      subKwargs = kwargs.get( 'bottomEdge', {} )
-      subDefaults = S.lib.resolveDefaults( defaults, ['bottomEdge'] )
-      self.bottomEdge.apply( obj.spines[ 'bottom' ], subDefaults, **subKwargs )
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      if not isinstance( obj, mplaxes.Axes ):
+         msg = "Unable to apply this sub-style to the given element." \
+               "Expected a matplotlib 'Axes' and instead received " \
+               "the following:\n%s" % (obj,)
+         raise Exception( msg )
+
+      # Set the bg patch properties
+      MplPatchStyle.applyPlan( obj.patch, plan[ 'patch' ] )
+
+      # zOrder, axisBelow, bgColor and showFrame.  Only the values that the
+      # axes does not already have are set.
+      kw = {}
+      for p, mplProp in AXES_PROPERTY_MAP.iteritems():
+         if plan[ p ] is not None:
+            kw[ mplProp ] = plan[ p ]
+
+      kw = changedValues( obj, kw )
+      for mplProp in AXES_PROPERTY_MAP.itervalues():
+         if mplProp in kw:
+            getattr( obj, 'set_' + mplProp )( kw[ mplProp ] )
+
+      # X-Axis
+      MplAxisStyle.applyPlan( obj.get_xaxis(), plan[ 'xAxis' ] )
+
+      # Y-Axis
+      MplAxisStyle.applyPlan( obj.get_yaxis(), plan[ 'yAxis' ] )
+
+      # Title text
+      MplTextStyle.applyPlan( obj.title, plan[ 'title' ] )
+
+      # Edges
+      for name in AXES_EDGE_MAP:
+         MplBasicLineStyle.applyPlan( obj.spines[ AXES_EDGE_MAP[ name ] ],
+                                      plan[ name ] )
 
    #-----------------------------------------------------------------------
 
@@ -41,6 +41,7 @@ __version__ = "$Revision: #1 $"
 
 from . import types as S
 
+from .MplStylePlan import MplStylePlan
 from .MplTickStyle import MplTickStyle
 from .MplTextStyle import MplTextStyle
 
@@ -50,6 +51,70 @@ import matplotlib.ticker as mticker
 
 __all__ = [ 'MplAxisStyle' ]
 
+#===========================================================================
+class _TickFactory( object ):
+   """: Create the ticks of an Axis with the tick plans applied.
+
+   matplotlib creates new ticks (using Axis._get_tick) whenever an axis
+   needs more ticks or resets them, for example when zooming or panning.
+   An instance of this class replaces '_get_tick' for a single Axis, so
+   that the ticks it creates are styled the same as the existing ticks.
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self, axis ):
+      """: Create a new _TickFactory object.
+
+      = INPUT VARIABLES
+      - axis   The matplotlib Axis to create ticks for.
+      """
+      self.axis = axis
+
+      # The tick plan to apply to new major and minor ticks.  This is all of
+      # the plans applied to the existing ticks merged together, so there is
+      # only one plan to apply however many times the axis is styled.
+      self.plans = { 'major' : None, 'minor' : None }
+
+   #-----------------------------------------------------------------------
+   def __call__( self, major ):
+      """: Create a new tick for the axis.
+
+      = INPUT VARIABLES
+      - major   True to create a major tick, False for a minor tick.
+
+      = RETURN VALUE
+      - Returns the new Tick.
+      """
+      # Use the class method, as the instance method is this object.
+      tick = self.axis.__class__._get_tick( self.axis, major )
+
+      which = 'minor'
+      if major:
+         which = 'major'
+
+      plan = self.plans[ which ]
+      if plan is not None:
+         MplTickStyle.applyPlan( tick, plan )
+
+      return tick
+
+   #-----------------------------------------------------------------------
+   def add( self, which, plan ):
+      """: Add a tick plan to apply to the new ticks.
+
+      The plan is merged into the current plan (see MplStylePlan.merge), so
+      the new ticks get the same values as the ticks the plan was applied
+      to, and styling an axis repeatedly does not increase the plans to
+      apply.
+
+      = INPUT VARIABLES
+      - which   Either 'major' or 'minor'.
+      - plan    The plan returned by MplTickStyle.compile, or a PlanChanges.
+      """
+      self.plans[ which ] = MplStylePlan.merge( self.plans[ which ], plan )
+
+   #-----------------------------------------------------------------------
+
 #===========================================================================
 class MplAxisStyle( S.SubStyle ):
    """: Style properties for matplotlib Axis objects.
@@ -117,30 +182,94 @@ value for all of the tick labels.
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
+
+   #-----------------------------------------------------------------------
+   def compile( self, defaults = {}, **kwargs ):
+      """: Compile this style into a plan that can be applied later.
+
+      The major and minor tick styles are each compiled once, and the
+      resulting plan is applied to all of the ticks of the axis together
+      (see MplTickStyle.applyPlanToAll).  The tick plans are also applied to
+      any ticks that the axis creates later, so the ticks keep their style
+      when matplotlib regenerates them.  So applying the plan does not need
+      to find the ticks the axis will use, only the ticks it has created.
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
+
+      = RETURN VALUE
+      - Returns a dictionary of the compiled plans for each axis component
+        and the axis values to set.
+      """
+      plan = {}
+
+      for which in [ 'major', 'minor' ]:
+         name = which + 'Ticks'
+         style = getattr( self, name )
+
+         subKwargs = kwargs.get( name, {} )
+         subDefaults = S.lib.resolveDefaults( defaults, [ name ] )
+
+         #MPL-HACK: Once tick stores 'major' or 'minor', we can remove this
+         #MPL-HACK: to MplTickStyle.
+         plan[ which + 'Grid' ] = style.grid.getValue( 'visible',
+                                                   subDefaults, **subKwargs )
+         plan[ which + 'On' ] = style.marks.getValue( 'visible',
+                                                   subDefaults, **subKwargs )
+         plan[ which + 'On2' ] = style.secondaryMarks.getValue( 'visible',
+                                                   subDefaults, **subKwargs )
+
+         plan[ name ] = style.compile( subDefaults, **subKwargs )
+
+      # Label
+      subKwargs = kwargs.get( 'label', {} )
+      subDefaults = S.lib.resolveDefaults( defaults,
+                                           ['text', 'labels', 'label'] )
+      plan[ 'label' ] = self.label.compile( subDefaults, **subKwargs )
+
+      # Offset Text
+      subKwargs = kwargs.get( 'offsetText', {} )
+      subDefaults = S.lib.resolveDefaults( defaults,
+                                           ['text', 'labels', 'offsetText'] )
+      plan[ 'offsetText' ] = self.offsetText.compile( subDefaults,
+                                                      **subKwargs )
+
+      # Autoscale and Margin
+      plan[ 'autoscale' ] = self.getValue( 'autoscale', defaults, **kwargs )
+      plan[ 'dataMargin' ] = self.getValue( 'dataMargin', defaults, **kwargs )
+
+      return plan
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
+
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
       if not isinstance( obj, mplaxis.Axis ):
          msg = "Unable to apply this sub-style to the given element." \
                "Expected a matplotlib 'Axis' and instead received the " \
                "following:\n%s" % (obj,)
          raise Exception( msg )
 
-
       # Major Ticks
-      subKwargs = kwargs.get( 'majorTicks', {} )
-      subDefaults = S.lib.resolveDefaults( defaults, ['majorTicks'] )
-
       #---
       #MPL-HACK: Once tick stores 'major', we can remove this to MplTickStyle.
       # Activate the grids as appropriate
-      value = self.majorTicks.grid.getValue( 'visible',
-                                              subDefaults, **subKwargs )
+      value = plan[ 'majorGrid' ]
       if value is not None:
          obj.grid( value, which = 'major' )
 
       # Activate the ticks as appropriate
-      majorOn = self.majorTicks.marks.getValue( 'visible',
-                                                subDefaults, **subKwargs )
-      majorOn2 = self.majorTicks.secondaryMarks.getValue( 'visible',
-                                                subDefaults, **subKwargs )
+      majorOn = plan[ 'majorOn' ]
+      majorOn2 = plan[ 'majorOn2' ]
 
       if majorOn or majorOn2:
          if isinstance(obj.get_major_locator(), mticker.NullLocator):
@@ -150,27 +279,22 @@ value for all of the tick labels.
             obj.set_major_locator( mticker.NullLocator() )
       #---
 
-      majorTicks = obj.get_major_ticks()
-      for tick in majorTicks:
-         self.majorTicks.apply( tick, subDefaults, **subKwargs )
-
+      # Only the ticks the axis has already created are styled.  Getting the
+      # ticks with 'get_major_ticks' runs the tick locator, and any ticks the
+      # axis needs later are styled when they are created (see _TickFactory).
+      MplTickStyle.applyPlanToAll( obj.majorTicks, plan[ 'majorTicks' ] )
 
       # Minor Ticks
-      subKwargs = kwargs.get( 'minorTicks', {} )
-      subDefaults = S.lib.resolveDefaults( defaults, ['minorTicks'] )
-
       #---
       #MPL-HACK: Once tick stores 'minor', we can remove this to MplTickStyle.
       # Activate the grids as appropriate
-      value = self.minorTicks.grid.getValue( 'visible',
-                                              subDefaults, **subKwargs )
+      value = plan[ 'minorGrid' ]
       if value is not None:
          obj.grid( value, which = 'minor' )
 
-      minorOn = self.minorTicks.marks.getValue( 'visible',
-                                                subDefaults, **subKwargs )
-      minorOn2 = self.minorTicks.secondaryMarks.getValue( 'visible',
-                                                subDefaults, **subKwargs )
+      minorOn = plan[ 'minorOn' ]
+      minorOn2 = plan[ 'minorOn2' ]
+
       if minorOn or minorOn2:
          if isinstance(obj.get_minor_locator(), mticker.NullLocator):
             obj.set_minor_locator( mticker.AutoMinorLocator() )
@@ -179,54 +303,65 @@ value for all of the tick labels.
             obj.set_minor_locator( mticker.NullLocator() )
       #---
 
-      minorTicks = obj.get_minor_ticks()
-      for tick in minorTicks:
-         self.minorTicks.apply( tick, subDefaults, **subKwargs )
+      MplTickStyle.applyPlanToAll( obj.minorTicks, plan[ 'minorTicks' ] )
+
+      # Style any ticks the axis creates later
+      factory = obj.__dict__.get( '_get_tick' )
+      if not isinstance( factory, _TickFactory ):
+         factory = _TickFactory( obj )
+         obj._get_tick = factory
 
+      factory.add( 'major', plan[ 'majorTicks' ] )
+      factory.add( 'minor', plan[ 'minorTicks' ] )
 
       # Label
-      subKwargs = kwargs.get( 'label', {} )
-      subDefaults = S.lib.resolveDefaults( defaults,
-                                           ['text', 'labels', 'label'] )
-      self.label.apply( obj.get_label(), subDefaults, **subKwargs )
+      MplTextStyle.applyPlan( obj.get_label(), plan[ 'label' ] )
 
       # Offset Text
-      subKwargs = kwargs.get( 'offsetText', {} )
-      subDefaults = S.lib.resolveDefaults( defaults,
-                                           ['text', 'labels', 'offsetText'] )
-      self.offsetText.apply( obj.get_offset_text(), subDefaults, **subKwargs )
+      MplTextStyle.applyPlan( obj.get_offset_text(), plan[ 'offsetText' ] )
 
       # Get the axes
       axes = obj.axes
 
+      autoOn = plan[ 'autoscale' ]
+      margin = plan[ 'dataMargin' ]
+
       if isinstance( obj, mplaxis.XAxis ):
          # This is the x-axis
          # Autoscale
-         autoOn = self.getValue( 'autoscale', defaults, **kwargs )
-         if autoOn is not None:
+         update = False
+         if ( autoOn is not None ) and \
+            ( autoOn != axes.get_autoscalex_on() ):
             axes.set_autoscalex_on( autoOn )
+            update = True
 
          # Margin
-         value = self.getValue( 'dataMargin', defaults, **kwargs )
-         if value is not None:
-            axes.set_xmargin( value )
+         if ( margin is not None ) and ( margin != axes.margins()[0] ):
+            axes.set_xmargin( margin )
+            update = True
+
+         # The axis needs to be told to update when the values change
+         if update:
+            axes.autoscale( enable = autoOn, axis='x' )
 
-         # The axis needs to be told to update
-         axes.autoscale( enable = autoOn, axis='x' )
       elif isinstance( obj, mplaxis.YAxis ):
          # This is the y-axis
          # Autoscale
-         autoOn = self.getValue( 'autoscale', defaults, **kwargs )
-         if autoOn is not None:
+         update = False
+         if ( autoOn is not None ) and \
+            ( autoOn != axes.get_autoscaley_on() ):
             axes.set_autoscaley_on( autoOn )
+            update = True
 
          # Margin
-         value = self.getValue( 'dataMargin', defaults, **kwargs )
-         if value is not None:
-            axes.set_ymargin( value )
+         if ( margin is not None ) and ( margin != axes.margins()[1] ):
+            axes.set_ymargin( margin )
+            update = True
+
+         # The axis needs to be told to update when the values change
+         if update:
+            axes.autoscale( enable = autoOn, axis='y' )
 
-         # The axis needs to be told to update
-         axes.autoscale( enable = autoOn, axis='y' )
       else:
          # Sanity check, we should never get here
          msg = "An error happened while applying Axis style properties " \
@@ -45,6 +45,16 @@ from .MplArtistStyle import MplArtistStyle
 
 __all__ = [ 'MplBasicLineStyle' ]
 
+# Map the style name to mpl property name
+BASIC_LINE_PROPERTY_MAP = {
+   'color'  : 'color',
+   'style'  : 'linestyle',
+   'width'  : 'linewidth',
+}
+
+# The property map used when styling a Patch
+BASIC_PATCH_PROPERTY_MAP = dict( BASIC_LINE_PROPERTY_MAP, color = 'edgecolor' )
+
 PATCH_STYLE_MAP = {
    '-' : 'solid',
    '--' : 'dashed',
@@ -130,24 +140,30 @@ The style value to use for the line.
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      # Map the style name to mpl property name
-      properties = {
-         'color'  : 'color',
-         'style'  : 'linestyle',
-         'width'  : 'linewidth',
-      }
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
 
-      if self._patchStyle:
-         properties[ 'color' ] = 'edgecolor'
+   #-----------------------------------------------------------------------
+   def _compileValues( self, defaults = {}, **kwargs ):
+      """: Get the matplotlib property values set by this style.
 
-      # Call the parent class method
-      MplArtistStyle.apply( self, obj, defaults, **kwargs )
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
 
-      kw = {}
+      = RETURN VALUE
+      - Returns a dictionary of the matplotlib property names and values.
+      """
+      # Map the style name to mpl property name
+      properties = BASIC_LINE_PROPERTY_MAP
+      if self._patchStyle:
+         properties = BASIC_PATCH_PROPERTY_MAP
 
-      for p in properties:
-         mplProp = properties[ p ]
+      # Call the parent class method
+      kw = MplArtistStyle._compileValues( self, defaults, **kwargs )
 
+      for p, mplProp in properties.iteritems():
          value = self.getValue( p, defaults, **kwargs )
 
          if value is not None:
@@ -159,9 +175,7 @@ The style value to use for the line.
       if ( 'linestyle' in kw ) and self._patchStyle:
          kw[ 'linestyle' ] = PATCH_STYLE_MAP[ kw['linestyle'] ]
 
-      # Only call update if there is something to update
-      if kw:
-         obj.update( kw )
+      return kw
 
    #-----------------------------------------------------------------------
 
@@ -50,6 +50,21 @@ import matplotlib.figure as mplfig
 
 __all__ = [ 'MplFigureStyle' ]
 
+# The subplot spacing properties of a figure style.
+FIGURE_MARGINS = [ 'leftMargin', 'rightMargin', 'topMargin', 'bottomMargin',
+                   'axesPadX', 'axesPadY' ]
+
+# The subplot parameter set by each margin, and whether the parameter is
+# measured from the opposite side of the figure from the margin.
+SUBPLOT_PARAMS = {
+   'leftMargin'   : ( 'left', False ),
+   'rightMargin'  : ( 'right', True ),
+   'topMargin'    : ( 'top', True ),
+   'bottomMargin' : ( 'bottom', False ),
+   'axesPadX'     : ( 'wspace', False ),
+   'axesPadY'     : ( 'hspace', False ),
+}
+
 #===========================================================================
 class MplFigureStyle( S.SubStyle ):
    """: Style properties for matplotlib Figure objects.
@@ -182,11 +197,27 @@ that they will be seperated by the width of the figure.
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      if not isinstance( obj, mplfig.Figure ):
-         msg = "Unable to apply this sub-style to the given element." \
-               "Expected a matplotlib 'Figure' and instead received " \
-               "the following:\n%s" % (obj,)
-         raise Exception( msg )
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
+
+   #-----------------------------------------------------------------------
+   def compile( self, defaults = {}, **kwargs ):
+      """: Compile this style into a plan that can be applied later.
+
+      The margins, padding, width and height are left as None when they are
+      not set by this style so that 'applyPlan' can keep the current values
+      of the Figure.
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
+
+      = RETURN VALUE
+      - Returns a dictionary of the compiled background patch plan and the
+        figure values to set.
+      """
+      plan = {}
 
       # First update the defaults for all children components
       defaults = S.lib.resolveDefaults( defaults, bgColor = self.bgColor )
@@ -200,44 +231,75 @@ that they will be seperated by the width of the figure.
            ('color' not in subKwargs):
          subKwargs[ 'color' ] = kwargs.get( 'bgColor', bgColor )
 
-      self._patch.apply( obj.patch, subDefaults, **subKwargs )
-
-      # Subplot spacing
-      subDefaults = S.lib.resolveDefaults( defaults,
-                                      leftMargin = obj.subplotpars.left,
-                                      rightMargin = 1.0 - obj.subplotpars.right,
-                                      topMargin = 1.0 - obj.subplotpars.top,
-                                      bottomMargin = obj.subplotpars.bottom,
-                                      axesPadX = obj.subplotpars.wspace,
-                                      axesPadY = obj.subplotpars.hspace )
-      l = self.getValue( 'leftMargin', subDefaults, **kwargs )
-      r = self.getValue( 'rightMargin', subDefaults, **kwargs )
-      t = self.getValue( 'topMargin', subDefaults, **kwargs )
-      b = self.getValue( 'bottomMargin', subDefaults, **kwargs )
-      x = self.getValue( 'axesPadX', subDefaults, **kwargs )
-      y = self.getValue( 'axesPadY', subDefaults, **kwargs )
-
-      obj.subplots_adjust( left = l, right = 1.0 - r,
-                           top = 1.0 - t, bottom = b,
-                           wspace = x, hspace = y )
-
-
-      # Width
-      width = self.getValue( 'width', defaults, **kwargs )
-      if width is None:
-         width = obj.get_figwidth()
-
-      # Height
-      height = self.getValue( 'height', defaults, **kwargs )
-      if height is None:
-         height = obj.get_figheight()
-
-      # Make sure to physically resize the canvas containing the figure
-      obj.set_size_inches( width, height, forward = True )
+      plan[ 'patch' ] = self._patch.compile( subDefaults, **subKwargs )
+
+      # Subplot spacing.  Any margin not set here falls back to the current
+      # figure value, so the defaults are not used.
+      for p in FIGURE_MARGINS:
+         plan[ p ] = self.getValue( p, {}, **kwargs )
+
+      # Width, Height and DPI
+      for p in [ 'width', 'height', 'dpi' ]:
+         plan[ p ] = self.getValue( p, defaults, **kwargs )
+
+      return plan
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
+
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      if not isinstance( obj, mplfig.Figure ):
+         msg = "Unable to apply this sub-style to the given element." \
+               "Expected a matplotlib 'Figure' and instead received " \
+               "the following:\n%s" % (obj,)
+         raise Exception( msg )
+
+      # Background patch
+      MplPatchStyle.applyPlan( obj.patch, plan[ 'patch' ] )
+
+      # Subplot spacing.  Adjusting the subplots lays out all of the axes
+      # again, so only do it when a value changes.
+      pars = obj.subplotpars
+      adjust = {}
+
+      for p in FIGURE_MARGINS:
+         value = plan[ p ]
+         if value is None:
+            continue
+
+         param, opposite = SUBPLOT_PARAMS[ p ]
+         if opposite:
+            value = 1.0 - value
+
+         if value != getattr( pars, param ):
+            adjust[ param ] = value
+
+      if adjust:
+         obj.subplots_adjust( **adjust )
+
+      # Width and Height.  Make sure to physically resize the canvas containing
+      # the figure, but only when the size changes.
+      width = plan[ 'width' ]
+      height = plan[ 'height' ]
+
+      if ( ( width is not None ) and ( width != obj.get_figwidth() ) ) or \
+         ( ( height is not None ) and ( height != obj.get_figheight() ) ):
+         if width is None:
+            width = obj.get_figwidth()
+
+         if height is None:
+            height = obj.get_figheight()
+
+         obj.set_size_inches( width, height, forward = True )
 
       # DPI
-      value = self.getValue( 'dpi', defaults, **kwargs )
-      if value is not None:
+      value = plan[ 'dpi' ]
+      if ( value is not None ) and ( value != obj.get_dpi() ):
          obj.set_dpi( value )
 
    #-----------------------------------------------------------------------
@@ -46,6 +46,30 @@ from matplotlib import font_manager as mplfont
 
 __all__ = [ 'MplFontStyle' ]
 
+# The FontProperties setters used by this style, in the order they are called.
+FONT_SETTERS = [ 'size', 'family', 'style', 'weight' ]
+
+#===========================================================================
+def _isCurrent( obj, name, value ):
+   """: Check if a FontProperties already has a value.
+
+   = INPUT VARIABLES
+   - obj     The FontProperties.
+   - name    The name of the value (one of FONT_SETTERS).
+   - value   The value to set.
+
+   = RETURN VALUE
+   - Returns True if the getter of the value returns the same value.
+   """
+   # FontProperties stores a single family name as a list
+   if ( name == 'family' ) and isinstance( value, basestring ):
+      value = [ value ]
+
+   try:
+      return getattr( obj, 'get_' + name )() == value
+   except Exception:
+      return False
+
 #===========================================================================
 class MplFontStyle( S.SubStyle ):
    """: Style properties for managing matplotlib fonts.
@@ -138,11 +162,27 @@ by the 'fontconfig' package.  Can also be a font family such as:
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      if not isinstance( obj, mplfont.FontProperties ):
-         msg = "Unable to apply this sub-style to the given element." \
-               "Expected a matplotlib 'FontProperties' and instead received " \
-               "the following:\n%s" % (obj,)
-         raise Exception( msg )
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
+
+   #-----------------------------------------------------------------------
+   def compile( self, defaults = {}, **kwargs ):
+      """: Compile this style into a plan that can be applied later.
+
+      The plan holds the final matplotlib property values and does not refer
+      back to this style, so it can be applied any number of times with
+      'applyPlan'.  The plan must not be modified.
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
+
+      = RETURN VALUE
+      - Returns a dictionary of FontProperties setter names ('size', 'family',
+        'style' and 'weight') and the values to pass to them.
+      """
+      plan = {}
 
       # Size
       size = self.getValue( 'size', defaults, **kwargs )
@@ -158,25 +198,56 @@ by the 'fontconfig' package.  Can also be a font family such as:
          size *= scale
 
       if size is not None:
-         obj.set_size( size )
+         plan[ 'size' ] = size
 
-      # Family
-      value = self.getValue( 'family', defaults, **kwargs )
+      # Family, Style and Weight
+      for p in FONT_SETTERS[ 1: ]:
+         value = self.getValue( p, defaults, **kwargs )
 
-      if value is not None:
-         obj.set_family( value )
+         if value is not None:
+            plan[ p ] = value
 
-      # Style
-      value = self.getValue( 'style', defaults, **kwargs )
+      return plan
 
-      if value is not None:
-         obj.set_style( value )
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
 
-      # Weight
-      value = self.getValue( 'weight', defaults, **kwargs )
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      MplFontStyle.applyPlanToAll( [ obj ], plan )
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlanToAll( objs, plan ):
+      """: Apply a plan created by 'compile' to each of the given objects.
 
-      if value is not None:
-         obj.set_weight( value )
+      The setters to call are only found once for all of the objects.
+      Values of None are skipped, so a plan of changes (see
+      MplStylePlan.changes) only calls the setters of the changed values.
+      Values that an object already has are not set again.
+
+      = INPUT VARIABLES
+      - objs   The list of objects to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      for obj in objs:
+         if not isinstance( obj, mplfont.FontProperties ):
+            msg = "Unable to apply this sub-style to the given element." \
+                  "Expected a matplotlib 'FontProperties' and instead " \
+                  "received the following:\n%s" % (obj,)
+            raise Exception( msg )
+
+      values = [ ( p, plan[ p ] ) for p in FONT_SETTERS
+                 if plan.get( p ) is not None ]
+
+      for obj in objs:
+         for p, value in values:
+            if not _isCurrent( obj, p, value ):
+               getattr( obj, 'set_' + p )( value )
 
    #-----------------------------------------------------------------------
 
@@ -49,6 +49,13 @@ import matplotlib.lines as mpllines
 
 __all__ = [ 'MplLineStyle' ]
 
+# Map the style name to mpl property name
+LINE_PROPERTY_MAP = {
+   'color' : 'color',
+   'style' : 'linestyle',
+   'width' : 'linewidth',
+}
+
 #===========================================================================
 class MplLineStyle( MplArtistStyle ):
    """: Style properties for matplotlib Lines
@@ -102,41 +109,53 @@ Controls the style of any markers on a matplotlib line.
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      if not isinstance( obj, mpllines.Line2D ):
-         msg = "Unable to apply this sub-style to the given element." \
-               "Expected a matplotlib 'Line2D' and instead received the " \
-               "following:\n%s" % (obj,)
-         raise Exception( msg )
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
 
+   #-----------------------------------------------------------------------
+   def _compileValues( self, defaults = {}, **kwargs ):
+      """: Get the matplotlib property values set by this style.
 
-      # Map the style name to mpl property name
-      properties = {
-         'color' : 'color',
-         'style' : 'linestyle',
-         'width' : 'linewidth',
-      }
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
 
+      = RETURN VALUE
+      - Returns a dictionary of the matplotlib property names and values.
+      """
       # Call the parent class method
-      MplArtistStyle.apply( self, obj, defaults, **kwargs )
+      kw = MplArtistStyle._compileValues( self, defaults, **kwargs )
 
-      # Apply the marker properties
+      # Add the marker properties
       subKwargs = kwargs.get( 'marker', {} )
       subDefaults = S.lib.resolveDefaults( defaults, ['marker'] )
-      self.marker.apply( obj, subDefaults, **subKwargs )
-
-      kw = {}
-
-      for p in properties:
-         mplProp = properties[ p ]
+      kw.update( self.marker._compileValues( subDefaults, **subKwargs ) )
 
+      for p, mplProp in LINE_PROPERTY_MAP.iteritems():
          value = self.getValue( p, defaults )
 
          if value is not None:
             kw[ mplProp ] = value
 
-      # Only call update if there is something to update
-      if kw:
-         obj.update( kw )
+      return kw
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
+
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      if not isinstance( obj, mpllines.Line2D ):
+         msg = "Unable to apply this sub-style to the given element." \
+               "Expected a matplotlib 'Line2D' and instead received the " \
+               "following:\n%s" % (obj,)
+         raise Exception( msg )
+
+      MplArtistStyle.applyPlan( obj, plan )
 
    #-----------------------------------------------------------------------
 
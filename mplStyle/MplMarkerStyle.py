@@ -41,6 +41,7 @@ __version__ = "$Revision: #1 $"
 
 from . import types as S
 
+from .MplArtistStyle import changedValues
 from .MplBasicLineStyle import MplBasicLineStyle
 
 from matplotlib import markers as mplmarker
@@ -50,6 +51,16 @@ import matplotlib.lines as mpllines
 
 __all__ = [ 'MplMarkerStyle' ]
 
+# Map the style name to mpl property name
+MARKER_PROPERTY_MAP = {
+   'color'     : 'markerfacecolor',
+   'edgeColor' : 'markeredgecolor',
+   'edgeWidth' : 'markeredgewidth',
+   'size'      : 'markersize',
+   'style'     : 'marker',
+   'fill'      : 'fillstyle',
+}
+
 MARKER_DICT = {}
 for key in mplmarker.MarkerStyle.markers:
    if key in [ None, ' ' ]:
@@ -183,32 +194,53 @@ can be filled.  Can be one of the following:
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      # Currently matplotlib only uses markers on Line2D objects and for
-      # scatter plots.  Scatter plots uses the marker properties only during
-      # the initiali scatter call, where the created markers are turned into
-      # paths and stuffed into a PathCollection.
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
 
-      if not isinstance( obj, mpllines.Line2D ):
-         msg = "Unable to apply this sub-style to the given element." \
-               "Expected a matplotlib 'Line2D' and instead received the " \
-               "following:\n%s" % (obj,)
-         raise Exception( msg )
+   #-----------------------------------------------------------------------
+   def compile( self, defaults = {}, **kwargs ):
+      """: Compile this style into a plan that can be applied later.
 
-      # Map the style name to mpl property name
-      properties = {
-         'color'     : 'markerfacecolor',
-         'edgeColor' : 'markeredgecolor',
-         'edgeWidth' : 'markeredgewidth',
-         'size'      : 'markersize',
-         'style'     : 'marker',
-         'fill'      : 'fillstyle',
-      }
+      The plan holds the final matplotlib property values and does not refer
+      back to this style, so it can be applied any number of times with
+      'applyPlan'.  The plan must not be modified.
 
-      kw = {}
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
 
-      for p in properties:
-         mplProp = properties[ p ]
+      = RETURN VALUE
+      - Returns a list of matplotlib keyword-value dictionaries.  Each entry
+        is passed to a single 'update' call on the styled object.
+      """
+      kw = self._compileValues( defaults, **kwargs )
 
+      # Only keep an update if there is something to update
+      plan = []
+      if kw:
+         plan.append( kw )
+
+      return plan
+
+   #-----------------------------------------------------------------------
+   def _compileValues( self, defaults = {}, **kwargs ):
+      """: Get the matplotlib property values set by this style.
+
+      The values are set on the Line2D the marker belongs to, so the line
+      style adds them to its own values (see MplLineStyle).
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
+
+      = RETURN VALUE
+      - Returns a dictionary of the matplotlib property names and values.
+      """
+      kw = {}
+      for p, mplProp in MARKER_PROPERTY_MAP.iteritems():
          value = self.getValue( p, defaults, **kwargs )
 
          if value is not None:
@@ -223,9 +255,32 @@ can be filled.  Can be one of the following:
       if ec:
          kw[ 'markeredgecolor' ] = ec
 
-      # Only call update if there is something to update
-      if kw:
-         obj.update( kw )
+      return kw
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
+
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      # Currently matplotlib only uses markers on Line2D objects and for
+      # scatter plots.  Scatter plots uses the marker properties only during
+      # the initiali scatter call, where the created markers are turned into
+      # paths and stuffed into a PathCollection.
+
+      if not isinstance( obj, mpllines.Line2D ):
+         msg = "Unable to apply this sub-style to the given element." \
+               "Expected a matplotlib 'Line2D' and instead received the " \
+               "following:\n%s" % (obj,)
+         raise Exception( msg )
+
+      for kw in plan:
+         kw = changedValues( obj, kw )
+         if kw:
+            obj.update( kw )
 
    #-----------------------------------------------------------------------
 
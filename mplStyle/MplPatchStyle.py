@@ -48,6 +48,16 @@ import matplotlib.patches as mplpatch
 
 __all__ = [ 'MplPatchStyle' ]
 
+# Map the style name to mpl property name
+PATCH_PROPERTY_MAP = {
+   'antialiased' : 'antialiased',
+   'color'       : 'facecolor',
+   'filled'      : 'fill',
+   'edgeColor'   : 'edgecolor',
+   'edgeWidth'   : 'linewidth',
+   'edgeStyle'   : 'linestyle',
+}
+
 EDGE_STYLE_MAP = {
    '-' : 'solid',
    '--' : 'dashed',
@@ -125,30 +135,25 @@ If set to True, then the patch element will be filled with the 'color' value.
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      if not isinstance( obj, mplpatch.Patch ):
-         msg = "Unable to apply this sub-style to the given element." \
-               "Expected a matplotlib 'Patch' and instead received the " \
-               "following:\n%s" % (obj,)
-         raise Exception( msg )
-
-      # Map the style name to mpl property name
-      properties = {
-         'antialiased' : 'antialiased',
-         'color'       : 'facecolor',
-         'filled'      : 'fill',
-         'edgeColor'   : 'edgecolor',
-         'edgeWidth'   : 'linewidth',
-         'edgeStyle'   : 'linestyle',
-      }
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
 
-      # Call the parent class method
-      MplArtistStyle.apply( self, obj, defaults, **kwargs )
+   #-----------------------------------------------------------------------
+   def _compileValues( self, defaults = {}, **kwargs ):
+      """: Get the matplotlib property values set by this style.
 
-      kw = {}
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
 
-      for p in properties:
-         mplProp = properties[ p ]
+      = RETURN VALUE
+      - Returns a dictionary of the matplotlib property names and values.
+      """
+      # Call the parent class method
+      kw = MplArtistStyle._compileValues( self, defaults, **kwargs )
 
+      for p, mplProp in PATCH_PROPERTY_MAP.iteritems():
          value = self.getValue( p, defaults, **kwargs )
 
          if value is not None:
@@ -169,9 +174,24 @@ If set to True, then the patch element will be filled with the 'color' value.
       if ( 'linestyle' in kw ):
          kw[ 'linestyle' ] = EDGE_STYLE_MAP[ kw['linestyle'] ]
 
-      # Only call update if there is something to update
-      if kw:
-         obj.update( kw )
+      return kw
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
+
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      if not isinstance( obj, mplpatch.Patch ):
+         msg = "Unable to apply this sub-style to the given element." \
+               "Expected a matplotlib 'Patch' and instead received the " \
+               "following:\n%s" % (obj,)
+         raise Exception( msg )
+
+      MplArtistStyle.applyPlan( obj, plan )
 
    #-----------------------------------------------------------------------
 
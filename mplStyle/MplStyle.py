@@ -41,9 +41,21 @@ __version__ = "$Revision: #1 $"
 
 from . import types as S
 from .MplSubStyle import MplSubStyle
+from .MplStylePlan import MplStylePlan
+from .MplAxesStyle import MplAxesStyle
+from .MplAxisStyle import MplAxisStyle
+from .MplFigureStyle import MplFigureStyle
+from .MplFontStyle import MplFontStyle
+from .MplLineStyle import MplLineStyle
+from .MplPatchStyle import MplPatchStyle
+from .MplTextStyle import MplTextStyle
 
 from collections import OrderedDict
 
+import contextlib
+import inspect
+import os.path
+import weakref
 import matplotlib
 import matplotlib.figure
 import matplotlib.axes
@@ -67,6 +79,230 @@ MPL_TYPE_MAP = OrderedDict( [
    ( matplotlib.patches.Patch, '_applyToPatch' ),
 ] )
 
+# The apply function found in MPL_TYPE_MAP for each type of object that a
+# style was applied to.  This is cleared whenever MPL_TYPE_MAP is changed by
+# MplStyle.registerType.
+_APPLY_FUNCS = {}
+
+# The attribute routes of each MplStyle class (see _attributeRoutes).
+_ATTRIBUTE_ROUTES = {}
+
+# The number of batches of applies that have been started and not ended, and
+# the figures to redraw when they end (see MplStyle.beginBatch).
+_BATCH = { 'depth' : 0, 'figures' : [] }
+
+# The number of _quietStale blocks that have been started and not ended, and
+# the stale callbacks that were removed from the figures and axes being
+# styled.
+#  Key: The id of the figure or axes.
+#  Value: A tuple of the figure or axes and its stale callback.
+_QUIET = { 'depth' : 0, 'callbacks' : {} }
+
+#---------------------------------------------------------------------------
+def _beginQuietStale( figures = [] ):
+   """: Stop propagating the stale state of the artists of some figures.
+
+   Every matplotlib setter marks the artist stale, which is passed up to its
+   axes and figure (and in interactive mode schedules a redraw).  While
+   styling this is done once per figure instead (see MplStyle._redraw).  The
+   stale callbacks of the figures and their axes are removed until the
+   outer block ends, so the artists of other figures are not affected.
+   Each call must be matched by a call to '_endQuietStale'.
+
+   = INPUT VARIABLES
+   - figures   The figures that are about to be styled.  Figures of None
+               are skipped.
+   """
+   _QUIET[ 'depth' ] += 1
+   _quietFigures( figures )
+
+#---------------------------------------------------------------------------
+def _quietFigures( figures ):
+   """: Remove the stale callbacks of some figures and their axes.
+
+   This is done for each figure once per outer '_beginQuietStale' block.
+
+   = INPUT VARIABLES
+   - figures   The figures to remove the callbacks of.
+   """
+   callbacks = _QUIET[ 'callbacks' ]
+
+   for fig in figures:
+      if ( fig is None ) or ( id( fig ) in callbacks ):
+         continue
+
+      for obj in [ fig ] + fig.axes:
+         if id( obj ) not in callbacks:
+            callbacks[ id( obj ) ] = ( obj, obj.stale_callback )
+            obj.stale_callback = None
+
+#---------------------------------------------------------------------------
+def _endQuietStale():
+   """: End a block started by '_beginQuietStale'.
+
+   When the outer block ends, the stale callbacks are restored.
+   """
+   _QUIET[ 'depth' ] -= 1
+
+   if _QUIET[ 'depth' ]:
+      return
+
+   callbacks = _QUIET[ 'callbacks' ]
+   _QUIET[ 'callbacks' ] = {}
+
+   for obj, callback in callbacks.itervalues():
+      # Keep any callback that was set while styling
+      if obj.stale_callback is None:
+         obj.stale_callback = callback
+
+#---------------------------------------------------------------------------
+@contextlib.contextmanager
+def _quietStale( figures ):
+   """: Don't propagate the stale state of artists in a 'with' statement.
+
+   = INPUT VARIABLES
+   - figures   The figures that are about to be styled.
+   """
+   _beginQuietStale( figures )
+   try:
+      yield
+   finally:
+      _endQuietStale()
+
+# The custom functions loaded from scripts by MplStyle._loadCustom.
+#  Key: The script file name and modification time.
+#  Value: The custom function.
+_CUSTOM_SCRIPTS = {}
+
+# The sub-style type that applies the plan of each type of plan target.
+TARGET_TYPES = {
+   'figure' : MplFigureStyle,
+   'axes'   : MplAxesStyle,
+   'xAxis'  : MplAxisStyle,
+   'yAxis'  : MplAxisStyle,
+   'font'   : MplFontStyle,
+   'line'   : MplLineStyle,
+   'patch'  : MplPatchStyle,
+   'text'   : MplTextStyle,
+}
+
+#===========================================================================
+def _attributeRoutes( cls, subStyle ):
+   """: Get where the attributes of an MplStyle class are found.
+
+   Finding this with 'dir' for every attribute access is slow, so it is only
+   done once for each class.
+
+   = INPUT VARIABLES
+   - cls        The MplStyle class.
+   - subStyle   The MplSubStyle of an instance of the class.
+
+   = RETURN VALUE
+   - Returns a dictionary of attribute names.  The value is True for an
+     attribute of the class or False for an attribute of the sub-style.
+     Attributes of an instance are not included.
+   """
+   key = ( cls, subStyle.__class__ )
+   routes = _ATTRIBUTE_ROUTES.get( key )
+
+   if routes is None:
+      routes = {}
+
+      for name in dir( subStyle.__class__ ):
+         routes[ name ] = False
+
+      for name in dir( cls ):
+         routes[ name ] = True
+
+      _ATTRIBUTE_ROUTES[ key ] = routes
+
+   return routes
+
+#===========================================================================
+class _StyleBinding( object ):
+   """: The elements bound to an MplStyle (see MplStyle.bind).
+
+   This is passed to the MplStyle apply methods in place of the MplStylePlan,
+   so that the plan target of each element that is styled can be recorded.
+   The apply methods get the plan of an element's target and then call the
+   post-process function with the element.
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self ):
+      """: Create a new _StyleBinding object.
+      """
+      # The MplStylePlan being applied.
+      self.plan = None
+
+      # The last target whose plan was requested.
+      self.target = None
+
+      # The plan that was last applied to each target.
+      self.plans = {}
+
+      # The weak reference and target of each element, by the element id.
+      self.elements = {}
+
+   #-----------------------------------------------------------------------
+   def __getitem__( self, target ):
+      """: Get the plan of a target and record it as the applied plan.
+      """
+      value = self.plan[ target ]
+      self.plans[ target ] = value
+      self.target = target
+      return value
+
+   #-----------------------------------------------------------------------
+   def record( self, obj ):
+      """: Record an element that the last requested plan was applied to.
+
+      Elements that are styled by a function given to
+      MplStyle.registerType are not recorded, as there is no plan type to
+      apply their changes with.
+      """
+      if isinstance( MplStyle._getApplyFunc( obj ), basestring ):
+         key = id( obj )
+         ref = weakref.ref( obj, lambda r: self.elements.pop( key, None ) )
+         self.elements[ key ] = ( ref, self.target )
+
+   #-----------------------------------------------------------------------
+   def push( self, plan ):
+      """: Apply the changes from the applied plans to the bound elements.
+
+      = INPUT VARIABLES
+      - plan   The new MplStylePlan.
+
+      = RETURN VALUE
+      - Returns the elements that were changed.
+      """
+      self.plan = plan
+
+      targets = {}
+      for ref, target in self.elements.values():
+         obj = ref()
+         if obj is not None:
+            targets.setdefault( target, [] ).append( obj )
+
+      changed = []
+      for target, objs in targets.iteritems():
+         new = plan[ target ]
+         changes = MplStylePlan.changes( self.plans[ target ], new )
+         self.plans[ target ] = new
+
+         if changes is None:
+            continue
+
+         applyPlan = TARGET_TYPES[ target.split( '.' )[-1] ].applyPlan
+         for obj in objs:
+            applyPlan( obj, changes )
+
+         changed.extend( objs )
+
+      return changed
+
+   #-----------------------------------------------------------------------
+
 #===========================================================================
 class MplStyle( S.Style ):
    """: An object used to contain matplotlib style properties.
@@ -75,6 +311,12 @@ class MplStyle( S.Style ):
    :ref:`MplSubStyle <mplStyle_MplSubStyle>`.
    """
 
+   # Every property change is reported by the MplSubStyle.
+   _trackChanges = True
+
+   # The elements bound to this style (see bind).
+   _binding = None
+
    #-----------------------------------------------------------------------
    def __init__( self, name, initialValues = {}, parent = None, custom = None ):
       """: Create a new matplotlib style object.
@@ -124,14 +366,13 @@ class MplStyle( S.Style ):
       subStyle = object.__getattribute__( self, "_subStyle" )
       selfdict = object.__getattribute__( self, "__dict__" )
       c = object.__getattribute__( self, "__class__" )
-      classdict = c.__dict__
-      classdir = dir( c )
+      route = _attributeRoutes( c, subStyle ).get( name )
 
-      if ( (name in selfdict) or (name in classdict) or (name in classdir) ):
+      if ( route is True ) or ( name in selfdict ):
          # If the requested attribute is part of the class
          # or the instance, then give it.
          return object.__getattribute__( self, name )
-      elif ( hasattr(subStyle, name) ):
+      elif ( route is False ) or hasattr( subStyle, name ):
          # If the requested attribute is part of the subStyle,
          # then give it.
          return getattr( subStyle, name )
@@ -151,16 +392,18 @@ class MplStyle( S.Style ):
       """
       if name.startswith( '_' ):
          subStyle = None
+         route = None
       else:
          subStyle = object.__getattribute__( self, "_subStyle" )
+         c = object.__getattribute__( self, "__class__" )
+         route = _attributeRoutes( c, subStyle ).get( name )
 
       if object.__getattribute__( self, '_completed_init' ):
          selfdict = object.__getattribute__( self, "__dict__" )
          c = object.__getattribute__( self, "__class__" )
-         classdict = c.__dict__
-         classdir = dir( c )
 
-         if ( (name in selfdict) or (name in classdict) or (name in classdir) ):
+         if ( route is True ) or ( name in selfdict ) or \
+            ( ( route is None ) and hasattr( c, name ) ):
             S.Style.__setattr__( self, name, value )
          elif subStyle:
             setattr( subStyle, name, value )
@@ -169,7 +412,8 @@ class MplStyle( S.Style ):
                   "No property with that name exists." % name
             raise Exception( msg )
       else:
-         if subStyle and hasattr( subStyle, name ):
+         if subStyle and ( ( route is False ) or
+                           ( ( route is None ) and hasattr( subStyle, name ) ) ):
             setattr( subStyle, name, value )
          else:
             S.Style.__setattr__( self, name, value )
@@ -256,6 +500,163 @@ class MplStyle( S.Style ):
 
       self._subStyle.update( style._subStyle )
 
+   #-----------------------------------------------------------------------
+   def _getProperties( self ):
+      """: Get the property values that are set in this style.
+
+      = RETURN VALUE
+      - Returns a dictionary of the property values.  Nested property names
+        are concatenated together with '.'  Eg 'a.b.property'
+      """
+      # Specialized from base class
+      result = {}
+
+      def flatten( kw, prefix ):
+         for name, value in kw.iteritems():
+            if isinstance( value, dict ):
+               flatten( value, prefix + name + '.' )
+            elif value is not None:
+               result[ prefix + name ] = value
+
+      flatten( self._subStyle.kwargs( recursive = True ), '' )
+      return result
+
+   #-----------------------------------------------------------------------
+   def compile( self ):
+      """: Compile the properties set by this style into a plan.
+
+      This does not include the parent styles.  To compile every property
+      that applies to an element, compile the result of 'resolve'.
+
+      = RETURN VALUE
+      - Returns an MplStylePlan for this style.  The same plan is returned
+        until this style is changed.
+      """
+      # Specialized from base class
+      cached = self._cache.get( 'compile' )
+      if cached and ( cached[0] == self._version ):
+         return cached[1]
+
+      plan = MplStylePlan( self )
+      self._cache[ 'compile' ] = ( self._version, plan )
+      return plan
+
+   #-----------------------------------------------------------------------
+   def bind( self, obj, recursive = True, filter = None ):
+      """: Apply this style to an object and keep it updated with changes.
+
+      This resolves and applies the style like 'apply'.  Afterwards, each
+      change to a property of this style is applied to the bound elements
+      right away.  Only the matplotlib setters of the values that changed are
+      called, and only on the elements the changed values apply to.  For
+      example, changing 'axes.xAxis.majorTicks.labels.font.size' only calls
+      'set_size' on the fonts of the x-axis major tick labels.
+
+      = NOTE
+      Only changes to this style are applied.  Changes to a parent style or
+      to the custom function are applied by the next 'bind' or 'apply'.
+      Elements that are styled by a function given to 'registerType' are
+      not kept updated.
+
+      = ERROR CONDITIONS
+      - Will throw an exception if this style cannot be applied to the object.
+
+      = INPUT VARIABLES
+      - obj          The object to apply the style to.
+      - recursive    If True, then the style is also applied to and bound to
+                     the child objects.
+      - filter       A filter function for determining what should have this
+                     style applied to it (see 'apply').
+      """
+      if filter is None:
+         filter = lambda x: (True, recursive)
+
+      func = self._getApplyFunc( obj )
+
+      if func is None:
+         msg = "Unable to bind a style to a given object:\n" \
+               "   Style: %s\n" \
+               "   Object: %s\n" % (self.name, obj)
+         raise Exception( msg )
+
+      if self._binding is None:
+         self._binding = _StyleBinding()
+
+      binding = self._binding
+      resolved = self._getResolved()
+      binding.plan = resolved.compile()
+
+      with _quietStale( [ self._getFigure( obj ) ] ):
+         resolved._callApplyFunc( func, obj, filter, binding.record,
+                                  binding, '' )
+
+         for custom in self._customChain():
+            custom( obj )
+
+      self._redraw( [ obj ] )
+
+   #-----------------------------------------------------------------------
+   def unbind( self ):
+      """: Stop applying the changes of this style to the bound elements.
+
+      This does not change the elements.
+      """
+      self._binding = None
+
+   #-----------------------------------------------------------------------
+   def _changed( self, name ):
+      """: Record that a property of this style has changed.
+
+      The change is applied to any elements bound to this style.
+
+      = INPUT VARIABLES
+      - name   The name of the property that changed.  Nested property names
+               are concatenated together with '.'  Eg 'a.b.property'
+      """
+      # Specialized from base class
+      S.Style._changed( self, name )
+
+      if self._binding is not None:
+         figures = []
+         for ref, target in self._binding.elements.values():
+            figures.append( self._getFigure( ref() ) )
+
+         with _quietStale( figures ):
+            changed = self._binding.push( self._getResolved().compile() )
+
+         self._redraw( changed )
+
+   #-----------------------------------------------------------------------
+   def _redraw( self, objs ):
+      """: Redraw the figures of the objects (if interactive).
+
+      The figures are redrawn in interactive mode and otherwise marked stale.
+      During a batch of applies (see beginBatch), this is done when the batch
+      ends.
+
+      = INPUT VARIABLES
+      - objs   The list of objects that were changed.
+      """
+      if _BATCH[ 'depth' ]:
+         figures = _BATCH[ 'figures' ]
+      else:
+         figures = []
+
+      for obj in objs:
+         fig = self._getFigure( obj )
+         if fig and ( fig not in figures ):
+            figures.append( fig )
+
+      if _BATCH[ 'depth' ]:
+         return
+
+      interactive = matplotlib.is_interactive()
+      for fig in figures:
+         if interactive and fig.canvas:
+            fig.canvas.draw()
+         else:
+            fig.stale = True
+
    #-----------------------------------------------------------------------
    def _getFigure( self, obj ):
       """: Determine the figure the object is associated with.
@@ -301,61 +702,53 @@ class MplStyle( S.Style ):
                "   Object: %s\n" % (self.name, obj)
          raise Exception( msg )
 
-      # Get a handle to the apply method
-      func = getattr( self, func )
-
       # call the appropriate apply method
-      func( obj, filter, postProcess,
-            bgColor = self.bgColor,
-            fgColor = self.fgColor,
-            text = self.text )
-
+      with _quietStale( [ self._getFigure( obj ) ] ):
+         self._callApplyFunc( func, obj, filter, postProcess, self.compile(),
+                              '' )
 
       # redraw the figure (if interactive and applicable)
-      if matplotlib.is_interactive():
-         fig = self._getFigure( obj )
-         if fig and fig.canvas:
-            fig.canvas.draw()
+      self._redraw( [ obj ] )
 
    #-----------------------------------------------------------------------
-   def _applyToAxes( self, obj, filter, postProcess, **defaults ):
+   def _applyToAxes( self, obj, filter, postProcess, plan, prefix ):
       """: Apply the style to a figure object.
       """
       process, recursive = filter( obj )
 
-      defaults = S.lib.resolveDefaults( defaults, [ 'axes' ] )
+      target = prefix + 'axes'
 
       if process:
-         self.axes.apply( obj, defaults )
+         self.axes.applyPlan( obj, plan[ target ] )
          if postProcess:
             postProcess( obj )
 
       if recursive:
-         defaults = S.lib.resolveDefaults( defaults,
-                                           bgColor = self.axes.bgColor,
-                                           fgColor = self.axes.fgColor,
-                                           labels = self.axes.labels )
+         prefix = target + '.'
 
          # Collections -- axes.collections
-         #FUTURE: Implement
+         self._applyToRegistered( obj.collections, filter, postProcess,
+                                  plan, prefix )
 
          # Patches -- axes.patches
          for item in obj.patches:
-            self._applyToPatch( item, filter, postProcess, **defaults )
+            self._applyToPatch( item, filter, postProcess, plan, prefix )
 
          # Lines -- axes.lines
          for item in obj.lines:
-            self._applyToLine( item, filter, postProcess, **defaults )
+            self._applyToLine( item, filter, postProcess, plan, prefix )
 
          # Text -- axes.texts
          for item in obj.texts:
-            self._applyToText( item, filter, postProcess, **defaults )
+            self._applyToText( item, filter, postProcess, plan, prefix )
 
          # Artists -- axes.artists
          #FUTURE: Implement
 
          # Legend -- axes.legend_
-         #FUTURE: Implement
+         if obj.legend_ is not None:
+            self._applyToRegistered( [ obj.legend_ ], filter, postProcess,
+                                     plan, prefix )
 
          # Tables -- axes.tables
          #FUTURE: Implement
@@ -364,49 +757,47 @@ class MplStyle( S.Style ):
          #FUTURE: Implement
 
    #-----------------------------------------------------------------------
-   def _applyToAxis( self, obj, filter, postProcess, **defaults ):
+   def _applyToAxis( self, obj, filter, postProcess, plan, prefix ):
       """: Apply the style to a figure object.
       """
       process, recursive = filter( obj )
 
-      defaults = S.lib.resolveDefaults( defaults, [ 'axis' ] )
-
       if process:
          if isinstance( obj, matplotlib.axis.XAxis ):
-            self.axes.xAxis.apply( obj, defaults )
+            self.axes.xAxis.applyPlan( obj, plan[ prefix + 'xAxis' ] )
          elif isinstance( obj, matplotlib.axis.YAxis ):
-            self.axes.yAxis.apply( obj, defaults )
+            self.axes.yAxis.applyPlan( obj, plan[ prefix + 'yAxis' ] )
 
          if postProcess:
             postProcess( obj )
 
    #-----------------------------------------------------------------------
-   def _applyToFigure( self, obj, filter, postProcess, **defaults ):
+   def _applyToFigure( self, obj, filter, postProcess, plan, prefix ):
       """: Apply the style to a figure object.
       """
       process, recursive = filter( obj )
 
-      defaults = S.lib.resolveDefaults( defaults, [ 'figure' ] )
+      target = prefix + 'figure'
 
       if process:
-         self.figure.apply( obj, defaults )
+         self.figure.applyPlan( obj, plan[ target ] )
          if postProcess:
             postProcess( obj )
 
       if recursive:
-         defaults = S.lib.resolveDefaults( defaults, bgColor = self.bgColor )
+         prefix = target + '.'
 
          # Axes -- figure axes
          for item in obj.axes:
-            self._applyToAxes( item, filter, postProcess, **defaults )
+            self._applyToAxes( item, filter, postProcess, plan, prefix )
 
          # Patches -- figure.patches
          for item in obj.patches:
-            self._applyToPatch( item, filter, postProcess, **defaults )
+            self._applyToPatch( item, filter, postProcess, plan, prefix )
 
          # Lines -- figure.lines
          for item in obj.lines:
-            self._applyToLine( item, filter, postProcess, **defaults )
+            self._applyToLine( item, filter, postProcess, plan, prefix )
 
          # Artists -- figure.artists
          #FUTURE: Implement
@@ -416,69 +807,85 @@ class MplStyle( S.Style ):
 
          # Text -- figure.texts
          for item in obj.texts:
-            self._applyToText( item, filter, postProcess, **defaults )
+            self._applyToText( item, filter, postProcess, plan, prefix )
 
          # Legends -- figure.legends
-         #FUTURE: Implement
+         self._applyToRegistered( obj.legends, filter, postProcess,
+                                  plan, prefix )
 
    #-----------------------------------------------------------------------
-   def _applyToFont( self, obj, filter, postProcess, **defaults ):
+   def _applyToFont( self, obj, filter, postProcess, plan, prefix ):
       """: Apply the style to a figure object.
       """
       process, recursive = filter( obj )
 
-      # This will pull up any 'text' values to the top, including any 'font'
-      # parameters
-      defaults = S.lib.resolveDefaults( defaults, [ 'text' ] )
-
-      # This will take any 'font' parameters and merge them into any that
-      # already exist at the top-level.
-      defaults = S.lib.resolveDefaults( defaults, [ 'font' ] )
-
       if process:
-         self.text.font.apply( obj, defaults )
+         self.text.font.applyPlan( obj, plan[ prefix + 'font' ] )
          if postProcess:
             postProcess( obj )
 
    #-----------------------------------------------------------------------
-   def _applyToLine( self, obj, filter, postProcess, **defaults ):
+   def _applyToLine( self, obj, filter, postProcess, plan, prefix ):
       """: Apply the style to a figure object.
       """
       process, recursive = filter( obj )
 
-      defaults = S.lib.resolveDefaults( defaults, [ 'line' ] )
-
       if process:
-         self.line.apply( obj, defaults )
+         self.line.applyPlan( obj, plan[ prefix + 'line' ] )
          if postProcess:
             postProcess( obj )
 
    #-----------------------------------------------------------------------
-   def _applyToPatch( self, obj, filter, postProcess, **defaults ):
+   def _applyToPatch( self, obj, filter, postProcess, plan, prefix ):
       """: Apply the style to a figure object.
       """
       process, recursive = filter( obj )
 
-      defaults = S.lib.resolveDefaults( defaults, [ 'patch' ] )
-
       if process:
-         self.patch.apply( obj, defaults )
+         self.patch.applyPlan( obj, plan[ prefix + 'patch' ] )
          if postProcess:
             postProcess( obj )
 
    #-----------------------------------------------------------------------
-   def _applyToText( self, obj, filter, postProcess, **defaults ):
+   def _applyToText( self, obj, filter, postProcess, plan, prefix ):
       """: Apply the style to a figure object.
       """
       process, recursive = filter( obj )
 
-      defaults = S.lib.resolveDefaults( defaults, [ 'text' ] )
-
       if process:
-         self.text.apply( obj, defaults )
+         self.text.applyPlan( obj, plan[ prefix + 'text' ] )
          if postProcess:
             postProcess( obj )
 
+   #-----------------------------------------------------------------------
+   def _applyToRegistered( self, objs, filter, postProcess, plan, prefix ):
+      """: Apply the style to each object with a type added by registerType.
+
+      Objects whose type has no apply function are skipped.
+      """
+      for item in objs:
+         func = self._getApplyFunc( item )
+         if func is not None:
+            self._callApplyFunc( func, item, filter, postProcess, plan, prefix )
+
+   #-----------------------------------------------------------------------
+   def _callApplyFunc( self, func, obj, filter, postProcess, plan, prefix ):
+      """: Call an apply function from MPL_TYPE_MAP.
+
+      = INPUT VARIABLES
+      - func         The name of an apply method of this style, or a function
+                     (see registerType).
+      - obj          The object to apply to.
+      - filter       The filter function (see _applyStyle).
+      - postProcess  The post-process function (see _applyStyle).
+      - plan         The MplStylePlan of this style.
+      - prefix       The prefix of the plan targets for the object.
+      """
+      if isinstance( func, basestring ):
+         getattr( self, func )( obj, filter, postProcess, plan, prefix )
+      else:
+         func( self, obj, filter, postProcess, plan, prefix )
+
    #-----------------------------------------------------------------------
    # Static Functions
 
@@ -487,21 +894,121 @@ class MplStyle( S.Style ):
    def _getApplyFunc( obj ):
       """: Get the apply function to use for the given type.
 
+      The most derived class of the object that is in MPL_TYPE_MAP is used.
+      The result is cached for each type.
+
       = INPUT VARIABLES
       - obj    The object to check if it can use this style.
 
       = RETURN VALUE
-      - Will return the name of the appropriate apply method to use, or None.
+      - Will return the name of the appropriate apply method to use (or the
+        function given to registerType), or None.
       """
       # Specialized from base class
-      if obj.__class__ in MPL_TYPE_MAP:
-         return MPL_TYPE_MAP[ obj.__class__ ]
+      objType = obj.__class__
+
+      try:
+         return _APPLY_FUNCS[ objType ]
+      except KeyError:
+         pass
+
+      func = None
+
+      for cls in inspect.getmro( objType ):
+         if cls in MPL_TYPE_MAP:
+            func = MPL_TYPE_MAP[ cls ]
+            break
+
+      _APPLY_FUNCS[ objType ] = func
+      return func
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def registerType( cls, func ):
+      """: Register how to apply a style to a type of matplotlib object.
+
+      This lets a style be applied to types of objects that it does not
+      support, such as collections or legends.  The function is used for
+      instances of the type and of its sub-classes (unless a sub-class is
+      registered as well).  When a style is applied to an axes or a figure,
+      it is also applied to any of their collections and legends whose type
+      has been registered.
+
+      = INPUT VARIABLES
+      - cls    The type of object.  If this type is already registered, then
+               the new function replaces the old one.
+      - func   The name of an MplStyle apply method, or a function to call
+               as 'func( style, obj, filter, postProcess, plan, prefix )'.
+               'style' is the MplStyle being applied and 'plan' is its
+               compiled MplStylePlan.  'prefix' is prepended to the target
+               names used to get plans from 'plan' (eg. plan[ prefix + 'text' ]
+               for the text plan).  See the MplStyle._applyTo* methods.
+      """
+      MPL_TYPE_MAP[ cls ] = func
+      _APPLY_FUNCS.clear()
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def _loadCustom( fname, name ):
+      """: Load the custom function of a style from a script.
+
+      Each script is only run once (until it changes), so styles that are
+      sent to a process many times do not run their scripts each time.
+
+      = INPUT VARIABLES
+      - fname   The name of the script file.
+      - name    The name of the style.
+
+      = RETURN VALUE
+      - Returns the custom function.
+      """
+      # Specialized from base class
+      # Delay load to avoid circular imports
+      from .MplStyleManager import loadCustomScript
+
+      key = ( fname, os.path.getmtime( fname ) )
+      if key not in _CUSTOM_SCRIPTS:
+         _CUSTOM_SCRIPTS[ key ] = loadCustomScript( fname, name )
+
+      return _CUSTOM_SCRIPTS[ key ]
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def beginBatch():
+      """: Start a batch of applies.
+
+      While a batch is started, the figures of the styled elements are not
+      redrawn after each apply, and the artists of those figures do not pass
+      their stale state up to their figures.  Other figures are not
+      affected.  When the outer batch ends, each styled figure is marked
+      stale and redrawn once with 'draw_idle'.  Each call must be matched by
+      a call to 'endBatch'.
+      """
+      # Specialized from base class
+      _beginQuietStale()
+      _BATCH[ 'depth' ] += 1
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def endBatch():
+      """: End a batch of applies started by 'beginBatch'.
+      """
+      # Specialized from base class
+      _BATCH[ 'depth' ] -= 1
+      _endQuietStale()
+
+      if _BATCH[ 'depth' ]:
+         return
 
-      for cls in MPL_TYPE_MAP:
-         if isinstance( obj, cls ):
-            return MPL_TYPE_MAP[ cls ]
+      figures = _BATCH[ 'figures' ]
+      _BATCH[ 'figures' ] = []
 
-      return None
+      # Figures that pyplot manages redraw themselves when marked stale
+      interactive = matplotlib.is_interactive()
+      for fig in figures:
+         fig.stale = True
+         if interactive and fig.canvas and fig.stale_callback is None:
+            fig.canvas.draw_idle()
 
    #-----------------------------------------------------------------------
    @staticmethod
@@ -40,6 +40,9 @@ __version__ = "$Revision: #1 $"
 #===========================================================================
 import os
 import os.path
+import re
+import ast
+from collections import OrderedDict
 from . import types as S
 from .MplStyle import MplStyle
 import matplotlib as MPL
@@ -54,6 +57,12 @@ MPLSTYLE_PREFIX = "MPL"
 
 MPLSTYLE_CUSTOM_FUNC = "applyStyle"
 
+# The statements of a style file that can be read without running it (see
+# MplStyleManager._parseFile).  These are the statements that are written by
+# MplStyleManager._saveToFile.
+MPLSTYLE_CREATE_LINE = re.compile( r"^style\s*=\s*MplStyle\(\s*(.*?)\s*\)$" )
+MPLSTYLE_PROPERTY_LINE = re.compile( r"^style((?:\.\w+)+)\s*=\s*(.*)$" )
+
 MPLSTYLE_HEADER = """
 #======================================================================
 #
@@ -66,6 +75,77 @@ MPLSTYLE_HEADER = """
 #======================================================================
 """
 
+# The values of the names that can be used in a style file that is parsed.
+MPLSTYLE_NAMES = { 'None' : None, 'True' : True, 'False' : False }
+
+#===========================================================================
+def parseLiteral( text ):
+   """: Get the value of a python literal.
+
+   This is the same as 'ast.literal_eval', except that the plain strings,
+   numbers and names written by MplStyleManager._saveToFile are converted
+   directly, which is many times faster.
+
+   = ERROR CONDITIONS
+   - Will throw a ValueError or SyntaxError if the text is not a literal.
+
+   = INPUT VARIABLES
+   - text    The text of the literal.
+
+   = RETURN VALUE
+   - Returns the value of the literal.
+   """
+   if text in MPLSTYLE_NAMES:
+      return MPLSTYLE_NAMES[ text ]
+
+   quote = text[-1:]
+   if ( quote in ( "'", '"' ) ) and ( '\\' not in text ):
+      body = text[:-1]
+      if body[:1] == quote and ( quote not in body[1:] ):
+         return str( body[1:] )
+      elif body[:2] == 'u' + quote and ( quote not in body[2:] ):
+         return unicode( body[2:] )
+
+   try:
+      return int( text )
+   except ValueError:
+      pass
+
+   try:
+      return float( text )
+   except ValueError:
+      pass
+
+   return ast.literal_eval( text )
+
+#===========================================================================
+def loadCustomScript( fname, name ):
+   """: Load the custom function of a style from a script.
+
+   = ERROR CONDITIONS
+   - Will throw an exception if the script does not define the custom
+     function (MPLSTYLE_CUSTOM_FUNC).
+
+   = INPUT VARIABLES
+   - fname   The name of the script file.
+   - name    The name of the style the script is for.
+
+   = RETURN VALUE
+   - Returns the custom function.
+   """
+   # Allow custom scripts to use some variables.
+   customData = { 'MplStyle' : MplStyle }
+   execfile( fname, customData )
+
+   if MPLSTYLE_CUSTOM_FUNC not in customData:
+      msg = "MplStyleManager encountered an error while loading the " \
+            "style '%s'.  A custom script was found, but the expected " \
+            "entry point '%s' was not found in the file.\nCustom File: " \
+            "'%s'" % (name, MPLSTYLE_CUSTOM_FUNC, fname)
+      raise Exception( msg )
+
+   return customData[MPLSTYLE_CUSTOM_FUNC]
+
 #===========================================================================
 class MplStyleManager( S.StyleManager ):
    """: An object used to manage one or more Style classes.
@@ -89,6 +169,148 @@ class MplStyleManager( S.StyleManager ):
       = RETURN VALUE
       - Returns the new style that results from loading from the specified file.
       """
+      # Use the cached style if the file has not changed since it was cached
+      style = self._readCache( fname )
+
+      if style is None:
+         style = self._parseFile( fname )
+
+         if style is None:
+            style = self._runFile( fname )
+
+         # Styles that refer to parents or to functions defined in the file
+         # are loaded from the file every time.
+         if style.parent is None and style.custom is None:
+            self._writeCache( fname, style.getState() )
+
+      # Load the custom file
+      custom = os.path.dirname( fname )
+      customBase, customExt = os.path.splitext( fname )
+      custom = os.path.join( custom, ( "%s_custom%s" % (customBase,
+                                                        customExt) ) )
+
+      if os.path.exists( custom ):
+         style.custom = loadCustomScript( custom, style.name )
+         style._customFile = custom
+
+      return style
+
+   #-----------------------------------------------------------------------
+   def _getCacheVersion( self ):
+      """: Get the version of the library that writes the style file cache.
+
+      = RETURN VALUE
+      - Returns the version string.
+      """
+      # Specialized from base class
+      # Delay load to avoid circular imports
+      import mplStyle
+      return mplStyle.__version__
+
+   #-----------------------------------------------------------------------
+   def _parseFile( self, fname ):
+      """: Load a style file without running it.
+
+      A style file written by 'save' only creates the style and sets its
+      property values.  Those statements are parsed and the literal values
+      are set on a new style directly, which is much faster than running
+      the file.  Custom code belongs in the '*_custom' script of the style.
+
+      = ERROR CONDITIONS
+      - Will throw an exception if a property value can not be set.
+
+      = INPUT VARIABLES
+      - fname    The path of the file to load.
+
+      = RETURN VALUE
+      - Returns the new style, or None if the file has any other statements
+        and needs to be run (see '_runFile').
+      """
+      name = None
+      properties = OrderedDict()
+
+      with open( fname ) as fin:
+         for line in fin:
+            line = line.strip()
+            if ( not line ) or line.startswith( '#' ):
+               continue
+
+            if name is None:
+               match = MPLSTYLE_CREATE_LINE.match( line )
+            else:
+               match = MPLSTYLE_PROPERTY_LINE.match( line )
+
+            if not match:
+               return None
+
+            try:
+               value = parseLiteral( match.groups()[-1] )
+            except ( ValueError, SyntaxError ):
+               return None
+
+            if name is None:
+               if not isinstance( value, basestring ):
+                  return None
+
+               name = value
+            else:
+               properties[ match.group( 1 )[1:] ] = value
+
+      if name is None:
+         return None
+
+      try:
+         return MplStyle( name, properties )
+      except Exception, e:
+         msg = "MplStyleManager had an error loading the file '%s'" % fname
+         raise S.util.mergeExceptions( e, msg )
+
+   #-----------------------------------------------------------------------
+   def _readStyleName( self, fname ):
+      """: Get the name of the style in a file without loading it.
+
+      The name is read from the statement that creates the style, which
+      must be the first statement in the file (as written by 'save').
+
+      = INPUT VARIABLES
+      - fname    The path of the style file.
+
+      = RETURN VALUE
+      - Returns the name of the style, or None if the file needs to be loaded
+        to know it.
+      """
+      with open( fname ) as fin:
+         for line in fin:
+            line = line.strip()
+            if ( not line ) or line.startswith( '#' ):
+               continue
+
+            match = MPLSTYLE_CREATE_LINE.match( line )
+            if not match:
+               return None
+
+            try:
+               name = parseLiteral( match.group( 1 ) )
+            except ( ValueError, SyntaxError ):
+               return None
+
+            if isinstance( name, basestring ):
+               return name
+
+            return None
+
+      return None
+
+   #-----------------------------------------------------------------------
+   def _runFile( self, fname ):
+      """: Load a style file by running it.
+
+      = INPUT VARIABLES
+      - fname    The path of the file to load.
+
+      = RETURN VALUE
+      - Returns the style created by the file.
+      """
       # Allow style files to use some variables.
       createData = lambda : {
          'MplStyle' : MplStyle,
@@ -116,25 +338,6 @@ class MplStyleManager( S.StyleManager ):
                (fname, style.__class__.__name__)
          raise Exception( msg )
 
-      # Load the custom file
-      custom = os.path.dirname( fname )
-      customBase, customExt = os.path.splitext( fname )
-      custom = os.path.join( custom, ( "%s_custom%s" % (customBase,
-                                                        customExt) ) )
-
-      if os.path.exists( custom ):
-         customData = createData()
-         execfile( custom, customData )
-
-         if MPLSTYLE_CUSTOM_FUNC in customData:
-            style.custom = customData[MPLSTYLE_CUSTOM_FUNC]
-         else:
-            msg = "MplStyleManager encountered an error while loading the " \
-                  "style '%s'.  A custom script was found, but the expected " \
-                  "entry point '%s' was not found in the file.\nCustom File: " \
-                  "'%s'" % (style.name, MPLSTYLE_CUSTOM_FUNC, custom)
-            raise Exception( msg )
-
       return style
 
    #-----------------------------------------------------------------------
@@ -155,7 +358,7 @@ class MplStyleManager( S.StyleManager ):
             continue
 
          if isinstance( value, str ) or isinstance( value, unicode ):
-            value = "'%s'" % value
+            value = repr( value )
 
          if isinstance( value, S.SubStyle ):
             self._writeSubStyle( fout, value, "%s.%s" % (prefix, name) )
@@ -175,7 +378,7 @@ class MplStyleManager( S.StyleManager ):
       """
       with open( fname, 'w' ) as fout:
          fout.write( MPLSTYLE_HEADER )
-         fout.write( "style = MplStyle( '%s' )\n" % (style.name,) )
+         fout.write( "style = MplStyle( %r )\n" % (style.name,) )
          self._writeSubStyle( fout, style, 'style' )
 
    #-----------------------------------------------------------------------
@@ -0,0 +1,316 @@
+#===========================================================================
+#
+# Copyright (c) 2014, California Institute of Technology.
+# U.S. Government Sponsorship under NASA Contract NAS7-03001 is
+# acknowledged.  All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# 1. Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#===========================================================================
+
+""": A compiled form of an MplStyle."""
+
+__version__ = "$Revision: #1 $"
+
+#===========================================================================
+
+from . import types as S
+#===========================================================================
+
+__all__ = [ 'MplStylePlan', 'PlanChanges' ]
+
+# The element types that can end a plan target name.
+PLAN_TARGETS = [ 'figure', 'axes', 'xAxis', 'yAxis', 'font', 'line', 'patch',
+                 'text' ]
+
+# The element types that can contain other elements in a plan target name.
+PLAN_CONTAINERS = [ 'figure', 'axes' ]
+
+#===========================================================================
+class PlanChanges( dict ):
+   """: The changes between two compiled sub-style plans that are dicts.
+
+   This has the same keys as the new plan, so it can be passed to the same
+   'applyPlan' method.  Values that did not change are None, which the
+   'applyPlan' methods skip.  The plans the changes were found from are kept,
+   for the elements that need the whole plan (see MplAxisStyle).
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self, old, new ):
+      """: Create a new PlanChanges object.
+
+      = INPUT VARIABLES
+      - old   The plan that was applied.
+      - new   The plan that replaces it.
+      """
+      dict.__init__( self )
+      self.old = old
+      self.new = new
+
+   #-----------------------------------------------------------------------
+
+#===========================================================================
+class MplStylePlan( object ):
+   """: A compiled MplStyle that can be applied repeatedly.
+
+   A plan holds the sub-style plans (see the 'compile' method of each
+   sub-style) for every kind of element an MplStyle can be applied to.
+   Applying a plan only calls the matplotlib setters, so none of the style
+   properties or defaults need to be resolved again.
+
+   Plan targets are named by the element types used to reach the element,
+   separated by '.', because an element inherits different defaults
+   depending upon what contains it.  For example 'axes.line' is a Line2D
+   reached by applying the style to an Axes, where 'figure.axes.line' is a
+   Line2D reached by applying the style to a Figure.
+
+   Each target is compiled the first time it is requested, using the values
+   of the style at that time.  A plan should not be kept after the style
+   it was compiled from is changed.  MplStyle.compile will create a new plan
+   once the style has changed.
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self, style ):
+      """: Create a new MplStylePlan.
+
+      = INPUT VARIABLES
+      - style   The MplStyle to compile.
+      """
+      self._style = style
+      self._targets = {}
+
+   #-----------------------------------------------------------------------
+   def __getitem__( self, target ):
+      """: Get the compiled sub-style plan for the named target.
+
+      = ERROR CONDITIONS
+      - Will throw an exception if the target name is not valid.
+
+      = INPUT VARIABLES
+      - target   The name of the target.  Eg. 'figure.axes.line'
+
+      = RETURN VALUE
+      - Returns the result of calling 'compile' on the sub-style that
+        applies to the target.
+      """
+      if target not in self._targets:
+         self._targets[ target ] = self._compile( target )
+
+      return self._targets[ target ]
+
+   #-----------------------------------------------------------------------
+   def _compile( self, target ):
+      """: Compile the named target.
+
+      This resolves the same defaults as the MplStyle apply methods do when
+      they reach the target element.
+
+      = INPUT VARIABLES
+      - target   The name of the target.
+
+      = RETURN VALUE
+      - Returns the compiled sub-style plan for the target.
+      """
+      style = self._style
+      names = target.split( '.' )
+      name = names.pop()
+
+      if ( name not in PLAN_TARGETS ) or \
+         [ n for n in names if n not in PLAN_CONTAINERS ]:
+         msg = "Unable to compile the MplStyle plan target '%s'.  Targets " \
+               "must be one of %s, optionally preceded by any of %s " \
+               "separated by '.'" % (target, PLAN_TARGETS, PLAN_CONTAINERS)
+         raise Exception( msg )
+
+      defaults = { 'bgColor' : style.bgColor,
+                   'fgColor' : style.fgColor,
+                   'text' : style.text }
+
+      # Pass the defaults down through each of the containers
+      for container in names:
+         defaults = S.lib.resolveDefaults( defaults, [ container ] )
+
+         if container == 'figure':
+            defaults = S.lib.resolveDefaults( defaults, bgColor = style.bgColor )
+         else:
+            defaults = S.lib.resolveDefaults( defaults,
+                                              bgColor = style.axes.bgColor,
+                                              fgColor = style.axes.fgColor,
+                                              labels = style.axes.labels )
+
+      if name in [ 'xAxis', 'yAxis' ]:
+         defaults = S.lib.resolveDefaults( defaults, [ 'axis' ] )
+         subStyle = getattr( style.axes, name )
+
+      elif name == 'font':
+         # This will pull up any 'text' values to the top, including any
+         # 'font' parameters
+         defaults = S.lib.resolveDefaults( defaults, [ 'text' ] )
+
+         # This will take any 'font' parameters and merge them into any that
+         # already exist at the top-level.
+         defaults = S.lib.resolveDefaults( defaults, [ 'font' ] )
+         subStyle = style.text.font
+
+      else:
+         defaults = S.lib.resolveDefaults( defaults, [ name ] )
+         subStyle = getattr( style, name )
+
+      return subStyle.compile( defaults )
+
+   #-----------------------------------------------------------------------
+   # Static Functions
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def changes( old, new ):
+      """: Get the changes between two compiled sub-style plans.
+
+      Applying the changes to an element that the old plan was applied to
+      has the same result as applying the new plan, but only the matplotlib
+      setters of the values that changed are called.  Values that are no
+      longer set by the new plan are left as they are, as they would be by
+      applying the new plan.
+
+      = INPUT VARIABLES
+      - old   A plan returned by the 'compile' method of a sub-style.
+      - new   A plan returned by the 'compile' method of the same sub-style.
+
+      = RETURN VALUE
+      - Returns a plan of the changes, or None if nothing changed.
+      """
+      changes, changed = MplStylePlan._changes( old, new )
+      if changed:
+         return changes
+
+      return None
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def merge( old, new ):
+      """: Combine two compiled sub-style plans into one.
+
+      Applying the merged plan has the same result as applying the old plan
+      and then the new plan.  Values that the new plan does not set (None)
+      keep the value from the old plan.  Neither plan is modified.
+
+      = INPUT VARIABLES
+      - old   A plan returned by the 'compile' method of a sub-style, or the
+              changes between two plans (see 'changes').  This can be None.
+      - new   A plan of the same sub-style, or the changes between two plans.
+
+      = RETURN VALUE
+      - Returns the merged plan.
+      """
+      if old is None:
+         return new
+      elif new is None:
+         return old
+
+      if isinstance( new, list ):
+         # A list of keyword dictionaries for 'update' (see MplArtistStyle)
+         kw = {}
+         for values in old + new:
+            kw.update( values )
+
+         return [ kw ]
+
+      merged = dict( old )
+      for key, value in new.iteritems():
+         if isinstance( value, ( list, dict ) ):
+            merged[ key ] = MplStylePlan.merge( old.get( key ), value )
+         elif value is not None:
+            merged[ key ] = value
+
+      return merged
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def _changes( old, new ):
+      """: Get the changes between two compiled sub-style plans.
+
+      = INPUT VARIABLES
+      - old   The plan that was applied.  This is None if there was none.
+      - new   The plan that replaces it.
+
+      = RETURN VALUE
+      - Returns a tuple of the plan of the changes and whether anything
+        changed.
+      """
+      if isinstance( new, list ):
+         # A list of keyword dictionaries for 'update' (see MplArtistStyle)
+         before = {}
+         for kw in ( old or [] ):
+            before.update( kw )
+
+         after = {}
+         for kw in new:
+            after.update( kw )
+
+         kw = {}
+         for key, value in after.iteritems():
+            if ( key not in before ) or ( before[ key ] != value ):
+               kw[ key ] = value
+
+         if kw:
+            return [ kw ], True
+
+         return [], False
+
+      old = old or {}
+      changes = PlanChanges( old, new )
+      changed = False
+
+      for key, value in new.iteritems():
+         before = old.get( key )
+
+         if isinstance( value, ( list, dict ) ):
+            changes[ key ], subChanged = MplStylePlan._changes( before, value )
+            changed = changed or subChanged
+         elif ( key in old ) and ( before == value ):
+            changes[ key ] = None
+         else:
+            changes[ key ] = value
+            changed = changed or ( value is not None )
+
+      return changes, changed
+
+   #-----------------------------------------------------------------------
+   # Class Properties
+
+   #-----------------------------------------------------------------------
+   @property
+   def style( self ):
+      """The MplStyle this plan was compiled from.
+      """
+      return self._style
+
+   #-----------------------------------------------------------------------
+
@@ -49,6 +49,17 @@ import matplotlib.text as mpltext
 
 __all__ = [ 'MplTextStyle' ]
 
+# Map the style name to mpl property name
+TEXT_PROPERTY_MAP = {
+   'bgColor'     : 'backgroundcolor',
+   'fgColor'     : 'color',
+   'vertAlign'   : 'verticalalignment',
+   'horizAlign'  : 'horizontalalignment',
+   'multiAlign'  : 'multialignment',
+   'lineSpacing' : 'linespacing',
+   'rotation'    : 'rotation',
+}
+
 #===========================================================================
 class MplTextStyle( MplArtistStyle ):
    """: Style properties for managing matplotlib text elements.
@@ -133,44 +144,88 @@ The rotation of the text from 0.0 to 360.0 degrees.
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      if not isinstance( obj, mpltext.Text ):
-         msg = "Unable to apply this sub-style to the given element." \
-               "Expected a matplotlib 'Text' and instead received " \
-               "the following:\n%s" % (obj,)
-         raise Exception( msg )
-
-      # Map the style name to mpl property name
-      properties = {
-         'bgColor'     : 'backgroundcolor',
-         'fgColor'     : 'color',
-         'vertAlign'   : 'verticalalignment',
-         'horizAlign'  : 'horizontalalignment',
-         'multiAlign'  : 'multialignment',
-         'lineSpacing' : 'linespacing',
-         'rotation'    : 'rotation',
-      }
-
-      # Apply the font properties
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
+
+   #-----------------------------------------------------------------------
+   def compile( self, defaults = {}, **kwargs ):
+      """: Compile this style into a plan that can be applied later.
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
+
+      = RETURN VALUE
+      - Returns a dictionary with the compiled 'font' plan and the list of
+        'artist' updates to make on the Text.
+      """
+      # Compile the font properties
       subKwargs = kwargs.get( 'font', {} )
       subDefaults = S.lib.resolveDefaults( defaults, ['font'] )
-      self.font.apply( obj.get_font_properties(), subDefaults, **subKwargs )
+      font = self.font.compile( subDefaults, **subKwargs )
 
-      # Call the parent class method
-      MplArtistStyle.apply( self, obj, defaults, **kwargs )
+      # Call the parent class method, which includes the text values
+      artist = MplArtistStyle.compile( self, defaults, **kwargs )
 
-      kw = {}
+      return { 'font' : font, 'artist' : artist }
+
+   #-----------------------------------------------------------------------
+   def _compileValues( self, defaults = {}, **kwargs ):
+      """: Get the matplotlib property values set by this style.
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
 
-      for p in properties:
-         mplProp = properties[ p ]
+      = RETURN VALUE
+      - Returns a dictionary of the matplotlib property names and values.
+      """
+      # Call the parent class method
+      kw = MplArtistStyle._compileValues( self, defaults, **kwargs )
 
+      for p, mplProp in TEXT_PROPERTY_MAP.iteritems():
          value = self.getValue( p, defaults, **kwargs )
 
          if value is not None:
             kw[ mplProp ] = value
 
-      # Only call update if there is something to update
-      if kw:
-         obj.update( kw )
+      return kw
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
+
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      MplTextStyle.applyPlanToAll( [ obj ], plan )
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlanToAll( objs, plan ):
+      """: Apply a plan created by 'compile' to each of the given objects.
+
+      = INPUT VARIABLES
+      - objs   The list of objects to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      for obj in objs:
+         if not isinstance( obj, mpltext.Text ):
+            msg = "Unable to apply this sub-style to the given element." \
+                  "Expected a matplotlib 'Text' and instead received " \
+                  "the following:\n%s" % (obj,)
+            raise Exception( msg )
+
+      if plan[ 'font' ]:
+         MplFontStyle.applyPlanToAll( [ obj.get_font_properties()
+                                        for obj in objs ], plan[ 'font' ] )
+
+      MplArtistStyle.applyPlanToAll( objs, plan[ 'artist' ] )
 
    #-----------------------------------------------------------------------
 
@@ -49,6 +49,9 @@ import matplotlib.axis as mplaxis
 
 __all__ = [ 'MplTickStyle' ]
 
+# The Tick members that turn each part of a tick on or off.
+TICK_SWITCHES = [ 'label1On', 'label2On', 'tick1On', 'tick2On', 'gridOn' ]
+
 #===========================================================================
 class MplTickStyle( S.SubStyle ):
    """: Style properties for managing matplotlib axis tick elements.
@@ -134,84 +137,153 @@ The spacing between the ticks and their labels (in points).
       - kwargs    Keyword-value dictionary whose values will supercede
                   any values set by the properties of this sub-style.
       """
-      if not isinstance( obj, mplaxis.Tick ):
-         msg = "Unable to apply this sub-style to the given element." \
-               "Expected a matplotlib 'Tick' and instead received the " \
-               "following:\n%s" % (obj,)
-         raise Exception( msg )
+      self.applyPlan( obj, self.compile( defaults, **kwargs ) )
+
+   #-----------------------------------------------------------------------
+   def compile( self, defaults = {}, **kwargs ):
+      """: Compile this style into a plan that can be applied later.
+
+      The plan does not depend upon the Tick it is applied to, so a single
+      plan can be applied to every tick of an axis.
+
+      = INPUT VARIABLES
+      - defaults  Keyword-value dictionary with defaults values to use if a
+                  property value is not specified.
+      - kwargs    Keyword-value dictionary whose values will supercede
+                  any values set by the properties of this sub-style.
+
+      = RETURN VALUE
+      - Returns a dictionary of the compiled plans for each tick component
+        and the tick values to set.
+      """
+      plan = {}
 
       # Labels
       subKwargs = kwargs.get( 'labels', {} )
       subDefaults = S.lib.resolveDefaults( defaults, ['text', 'labels'] )
-      self.labels.apply( obj.label1, subDefaults, **subKwargs )
-
-      value = self.labels.getValue( 'visible', subDefaults, **subKwargs )
-      if value is not None:
-         obj.label1On = value
+      plan[ 'labels' ] = self.labels.compile( subDefaults, **subKwargs )
+      plan[ 'label1On' ] = self.labels.getValue( 'visible',
+                                                 subDefaults, **subKwargs )
 
       # Secondary Labels
       subKwargs = kwargs.get( 'secondaryLabels', {} )
       subDefaults = S.lib.resolveDefaults( defaults,
                                          ['text', 'labels', 'secondaryLabels'] )
-      self.secondaryLabels.apply( obj.label2, subDefaults, **subKwargs )
-
-      value = self.secondaryLabels.getValue( 'visible',
-                                              subDefaults, **subKwargs )
-      if value is not None:
-         obj.label2On = value
+      plan[ 'secondaryLabels' ] = self.secondaryLabels.compile( subDefaults,
+                                                                **subKwargs )
+      plan[ 'label2On' ] = self.secondaryLabels.getValue( 'visible',
+                                                     subDefaults, **subKwargs )
 
       # marks
       subKwargs = kwargs.get( 'marks', {} )
       subDefaults = S.lib.resolveDefaults( defaults, ['marks'] )
-      self.marks.apply( obj.tick1line, subDefaults, **subKwargs )
-
-      value = self.marks.getValue( 'visible', subDefaults, **subKwargs )
-      if value is not None:
-         obj.tick1On = value
+      plan[ 'marks' ] = self.marks.compile( subDefaults, **subKwargs )
+      plan[ 'tick1On' ] = self.marks.getValue( 'visible',
+                                               subDefaults, **subKwargs )
 
       # Secondary Marks
       subKwargs = kwargs.get( 'secondaryMarks', {} )
       subDefaults = S.lib.resolveDefaults( defaults, ['secondaryMarks'] )
-      self.secondaryMarks.apply( obj.tick2line, subDefaults, **subKwargs )
-
-      value = self.secondaryMarks.getValue( 'visible',
-                                             subDefaults, **subKwargs )
-      if value is not None:
-         obj.tick2On = value
+      plan[ 'secondaryMarks' ] = self.secondaryMarks.compile( subDefaults,
+                                                              **subKwargs )
+      plan[ 'tick2On' ] = self.secondaryMarks.getValue( 'visible',
+                                                     subDefaults, **subKwargs )
 
       # Grid
       subKwargs = kwargs.get( 'grid', {} )
       subDefaults = S.lib.resolveDefaults( defaults, ['grid'] )
-      self.grid.apply( obj.gridline, subDefaults, **subKwargs )
+      plan[ 'grid' ] = self.grid.compile( subDefaults, **subKwargs )
+      plan[ 'gridOn' ] = self.grid.getValue( 'visible',
+                                             subDefaults, **subKwargs )
+
+      # Length, Width and Pad
+      for p in [ 'length', 'width', 'pad' ]:
+         plan[ p ] = self.getValue( p, defaults, **kwargs )
 
-      value = self.grid.getValue( 'visible', subDefaults, **subKwargs )
-      if value is not None:
-         obj.gridOn = value
+      return plan
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlan( obj, plan ):
+      """: Apply a plan created by 'compile' to the given object.
 
+      = INPUT VARIABLES
+      - obj    The object to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      MplTickStyle.applyPlanToAll( [ obj ], plan )
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def applyPlanToAll( objs, plan ):
+      """: Apply a plan created by 'compile' to each of the given objects.
+
+      This has the same result as calling 'applyPlan' for each tick, but the
+      values to set are only found once and then set on all of the ticks.
+
+      = INPUT VARIABLES
+      - objs   The list of Ticks to apply the plan to.
+      - plan   The plan returned by 'compile'.
+      """
+      for obj in objs:
+         if not isinstance( obj, mplaxis.Tick ):
+            msg = "Unable to apply this sub-style to the given element." \
+                  "Expected a matplotlib 'Tick' and instead received the " \
+                  "following:\n%s" % (obj,)
+            raise Exception( msg )
+
+      # Labels
+      MplTextStyle.applyPlanToAll( [ obj.label1 for obj in objs ],
+                                   plan[ 'labels' ] )
+
+      # Secondary Labels
+      MplTextStyle.applyPlanToAll( [ obj.label2 for obj in objs ],
+                                   plan[ 'secondaryLabels' ] )
+
+      # marks
+      MplBasicLineStyle.applyPlanToAll( [ obj.tick1line for obj in objs ],
+                                        plan[ 'marks' ] )
+
+      # Secondary Marks
+      MplBasicLineStyle.applyPlanToAll( [ obj.tick2line for obj in objs ],
+                                        plan[ 'secondaryMarks' ] )
+
+      # Grid
+      MplBasicLineStyle.applyPlanToAll( [ obj.gridline for obj in objs ],
+                                        plan[ 'grid' ] )
+
+      # Turn the labels, marks and grid on or off
       # Activate the grid as appropriate
       #FUTURE: This should be here using Tick.major, but matplotlib
       #FUTURE: needs to be fixed first.
       #FUTURE obj.grid( self.grid.visible )
       #FUTURE: Setup minor tick locators (as necessary)
-
-      # Length
-      value = self.getValue( 'length', defaults, **kwargs )
-      if value is not None:
-         obj._size = value
-         obj.tick1line.set_markersize( obj._size )
-         obj.tick2line.set_markersize( obj._size )
-
-      # Width
-      value = self.getValue( 'width', defaults, **kwargs )
-      if value is not None:
-         obj._width = value
-         obj.tick1line.set_markeredgewidth( obj._width )
-         obj.tick2line.set_markeredgewidth( obj._width )
-
-      # Pad 
-      value = self.getValue( 'pad', defaults, **kwargs )
-      if value is not None:
-         obj.set_pad( value )
+      switches = [ ( p, plan[ p ] ) for p in TICK_SWITCHES
+                   if plan[ p ] is not None ]
+
+      length = plan[ 'length' ]
+      width = plan[ 'width' ]
+      pad = plan[ 'pad' ]
+
+      for obj in objs:
+         for p, value in switches:
+            setattr( obj, p, value )
+
+         # Length
+         if length is not None:
+            obj._size = length
+            obj.tick1line.set_markersize( obj._size )
+            obj.tick2line.set_markersize( obj._size )
+
+         # Width
+         if width is not None:
+            obj._width = width
+            obj.tick1line.set_markeredgewidth( obj._width )
+            obj.tick2line.set_markeredgewidth( obj._width )
+
+         # Pad 
+         if pad is not None:
+            obj.set_pad( pad )
 
    #-----------------------------------------------------------------------
 
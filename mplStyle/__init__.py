@@ -42,6 +42,7 @@ __version__ = "$Revision: #1 $"
 
 #===========================================================================
 from .MplStyle import MplStyle
+from .MplStylePlan import MplStylePlan
 from .MplSubStyle import MplSubStyle
 from .MplStyleManager import MplStyleManager
 
@@ -0,0 +1,463 @@
+#===========================================================================
+#
+# Copyright (c) 2014, California Institute of Technology.
+# U.S. Government Sponsorship under NASA Contract NAS7-03001 is
+# acknowledged.  All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# 1. Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#===========================================================================
+
+""": Style and save many matplotlib figures with a pool of processes.
+
+Each job builds a figure, applies a list of styles from the style manager
+to it and saves it to a file.  The jobs are run in chunks by a pool of
+worker processes that use the headless 'Agg' backend.  Each worker loads
+the styles once and keeps the styles it has merged and compiled for the
+jobs it has run.
+
+Eg.
+   from mplStyle import batch
+
+   jobs = [ batch.BatchJob( 'reports.plots:buildFlux', [ 'Dark', 'Report' ],
+                            'out/flux%03d.png' % i, args = ( i, ) )
+            for i in range( 1000 ) ]
+   report = batch.run( jobs, path = [ '/data/styles' ] )
+   print report
+
+The jobs can also be run from the command line with a JSON file of jobs:
+
+   python -m mplStyle.batch jobs.json --path /data/styles -j 8
+"""
+
+__version__ = "$Revision: #1 $"
+
+#===========================================================================
+import os
+import os.path
+import sys
+import json
+import time
+import argparse
+import importlib
+import traceback
+import multiprocessing
+#===========================================================================
+
+__all__ = [ 'BatchJob', 'BatchResult', 'BatchReport', 'run', 'main' ]
+
+# The phases of a job, in the order they are run.
+PHASES = [ 'build', 'style', 'save' ]
+
+# The state of the current worker process (see _initWorker).
+_WORKER = { 'mgr' : None }
+
+#===========================================================================
+class BatchJob( object ):
+   """: A figure to build, style and save.
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self, build, styles, output, args = (), kwargs = {},
+                 saveKwargs = {} ):
+      """: Create a new BatchJob object.
+
+      = INPUT VARIABLES
+      - build        The function that builds the figure.  It is called as
+                     'build( *args, **kwargs )' and must return the figure.
+                     This can also be the name of the function in the form
+                     'module:function'.  Functions are sent to the worker
+                     processes, so they must be defined at the top level of
+                     a module.
+      - styles       The name of a style or a list of style names to apply
+                     to the figure.
+      - output       The name of the file to save the figure to.
+      - args         The positional arguments to pass to 'build'.
+      - kwargs       The keyword arguments to pass to 'build'.
+      - saveKwargs   The keyword arguments to pass to the 'savefig' method of
+                     the figure.
+      """
+      if isinstance( styles, basestring ):
+         styles = [ styles ]
+
+      self.build = build
+      self.styles = list( styles )
+      self.output = output
+      self.args = tuple( args )
+      self.kwargs = dict( kwargs )
+      self.saveKwargs = dict( saveKwargs )
+
+   #-----------------------------------------------------------------------
+   def __repr__( self ):
+      return "BatchJob( %r, %r, %r )" % ( self.build, self.styles,
+                                          self.output )
+
+   #-----------------------------------------------------------------------
+   def getBuildFunc( self ):
+      """: Get the function that builds the figure.
+
+      = ERROR CONDITIONS
+      - Will throw an exception if the named function can not be imported.
+
+      = RETURN VALUE
+      - Returns the build function.
+      """
+      if not isinstance( self.build, basestring ):
+         return self.build
+
+      if ':' not in self.build:
+         msg = "BatchJob: Invalid build function '%s'.  The name must be " \
+               "in the form 'module:function'." % ( self.build, )
+         raise Exception( msg )
+
+      moduleName, funcName = self.build.split( ':', 1 )
+      module = importlib.import_module( moduleName )
+
+      return getattr( module, funcName )
+
+#===========================================================================
+class BatchResult( object ):
+   """: The result of running a BatchJob.
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self, index, output ):
+      """: Create a new BatchResult object.
+
+      = INPUT VARIABLES
+      - index    The index of the job in the list of jobs that was run.
+      - output   The name of the file the figure was saved to.
+      """
+      self.index = index
+      self.output = output
+
+      # The traceback of the error the job failed with (or None)
+      self.error = None
+
+      # The time in seconds taken by each phase of the job that was run.
+      self.timings = {}
+
+      # The process that ran the job.
+      self.pid = os.getpid()
+
+   #-----------------------------------------------------------------------
+   def __repr__( self ):
+      status = "ok"
+      if self.error:
+         status = "failed"
+
+      return "BatchResult( %d, %r, %s )" % ( self.index, self.output, status )
+
+#===========================================================================
+class BatchReport( object ):
+   """: The results and throughput of a batch of jobs.
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self, results, elapsed, processes ):
+      """: Create a new BatchReport object.
+
+      = INPUT VARIABLES
+      - results     The list of BatchResult objects in the order of the jobs.
+      - elapsed     The wall clock time in seconds taken to run the jobs.
+      - processes   The number of worker processes that ran the jobs.
+      """
+      self.results = results
+      self.elapsed = elapsed
+      self.processes = processes
+
+   #-----------------------------------------------------------------------
+   def failures( self ):
+      """: Get the results of the jobs that failed.
+      """
+      return [ r for r in self.results if r.error ]
+
+   #-----------------------------------------------------------------------
+   def figuresPerSec( self ):
+      """: Get the number of figures saved each second.
+      """
+      saved = len( self.results ) - len( self.failures() )
+      if self.elapsed <= 0.0:
+         return 0.0
+
+      return saved / self.elapsed
+
+   #-----------------------------------------------------------------------
+   def phaseTimes( self ):
+      """: Get the total time in seconds that the jobs spent in each phase.
+
+      = RETURN VALUE
+      - Returns a dictionary of the total time of each phase in PHASES.  The
+        times are summed over all of the worker processes, so they can add
+        up to more than the elapsed time.
+      """
+      totals = dict( ( phase, 0.0 ) for phase in PHASES )
+      for r in self.results:
+         for phase, seconds in r.timings.iteritems():
+            totals[ phase ] += seconds
+
+      return totals
+
+   #-----------------------------------------------------------------------
+   def __str__( self ):
+      numFailed = len( self.failures() )
+
+      lines = [ "%d figures in %.2f sec with %d processes " \
+                "(%.1f figures/sec), %d failed" % \
+                ( len( self.results ) - numFailed, self.elapsed,
+                  self.processes, self.figuresPerSec(), numFailed ) ]
+
+      totals = self.phaseTimes()
+      for phase in PHASES:
+         lines.append( "   %-6s %9.3f sec" % ( phase, totals[ phase ] ) )
+
+      for r in self.failures():
+         lines.append( "Job %d (%s) failed:" % ( r.index, r.output ) )
+         lines.append( r.error.rstrip() )
+
+      return "\n".join( lines )
+
+#===========================================================================
+def run( jobs, path = None, processes = None, chunkSize = None,
+         styles = None ):
+   """: Style and save the figures of a list of jobs.
+
+   The jobs are split into chunks that are run by a pool of worker
+   processes.  An error in a job is recorded in its result and does not
+   stop the other jobs.
+
+   = INPUT VARIABLES
+   - jobs        A list of BatchJob objects.
+   - path        The list of directories to load the styles from.  See
+                 StyleManager.load.  Styles that are already in the style
+                 manager ('mplStyle.mgr') are also available to the jobs run
+                 in this process and to the workers where processes are
+                 forked.  The jobs use their own style manager, so
+                 'mplStyle.mgr' is not changed.
+   - processes   The number of worker processes.  If not specified, then the
+                 number of CPUs is used.  If 0, then the jobs are run in
+                 this process (with the current matplotlib backend).
+   - chunkSize   The number of jobs sent to a worker at a time.  If not
+                 specified, then the jobs are split into about four chunks
+                 per worker.
+   - styles      A list of styles to send to the workers.  The styles are
+                 pickled (see Style.getState), so the workers do not need
+                 to load them from files.
+
+   = RETURN VALUE
+   - Returns a BatchReport of the jobs.
+   """
+   if processes is None:
+      processes = multiprocessing.cpu_count()
+
+   if chunkSize is None:
+      chunkSize, extra = divmod( len( jobs ), max( processes, 1 ) * 4 )
+      if extra or not chunkSize:
+         chunkSize += 1
+
+   chunks = []
+   for i in range( 0, len( jobs ), chunkSize ):
+      chunks.append( list( enumerate( jobs[ i : i + chunkSize ], i ) ) )
+
+   start = time.time()
+
+   results = []
+   if processes:
+      pool = multiprocessing.Pool( processes, _initWorker,
+                                   ( path, styles, True ) )
+      try:
+         for chunkResults in pool.imap_unordered( _runChunk, chunks ):
+            results.extend( chunkResults )
+
+         pool.close()
+      except:
+         pool.terminate()
+         raise
+      finally:
+         pool.join()
+
+   else:
+      _initWorker( path, styles, False )
+      for chunk in chunks:
+         results.extend( _runChunk( chunk ) )
+
+   elapsed = time.time() - start
+
+   results.sort( key = lambda r: r.index )
+
+   return BatchReport( results, elapsed, processes )
+
+#===========================================================================
+def _initWorker( path, styles, isWorker ):
+   """: Set up a worker process to run jobs.
+
+   This creates the style manager of the jobs and loads the styles.  It
+   starts with the styles of 'mplStyle.mgr', which is not changed.  The
+   style files are loaded lazily, since a worker usually only uses a few of
+   them (see StyleManager.load).  The style manager is kept for all of the
+   jobs the worker runs, so that the styles it merges and compiles are
+   reused (see StyleManager.applyMany).
+
+   = INPUT VARIABLES
+   - path       The list of directories to load the styles from.
+   - styles     A list of styles to add to the style manager.
+   - isWorker   True if this is a worker process of a pool.  Workers switch
+                matplotlib to the 'Agg' backend.  Otherwise the jobs are run
+                in the calling process, whose backend is left as it is.
+   """
+   if isWorker:
+      import matplotlib
+      matplotlib.use( 'Agg', warn = False )
+
+   from . import mgr
+   from .MplStyleManager import MplStyleManager
+
+   workerMgr = MplStyleManager()
+   workerMgr.cacheDir = mgr.cacheDir
+
+   # Share the styles of the global style manager.  In a forked worker,
+   # these are the styles of the parent process.
+   for data in mgr._styles.values():
+      workerMgr.add( data.style )
+
+   workerMgr._pending.update( mgr._pending )
+
+   if path:
+      workerMgr.load( path, lazy = True )
+
+   for style in styles or []:
+      workerMgr.add( style, replace = True )
+
+   _WORKER[ 'mgr' ] = workerMgr
+
+#===========================================================================
+def _runChunk( chunk ):
+   """: Run a chunk of jobs in a worker.
+
+   = INPUT VARIABLES
+   - chunk  A list of ( index, BatchJob ) tuples.
+
+   = RETURN VALUE
+   - Returns a list of the BatchResult of each job.
+   """
+   return [ _runJob( index, job ) for index, job in chunk ]
+
+#===========================================================================
+def _runJob( index, job ):
+   """: Build, style and save the figure of a job.
+
+   = INPUT VARIABLES
+   - index  The index of the job.
+   - job    The BatchJob to run.
+
+   = RETURN VALUE
+   - Returns the BatchResult of the job.
+   """
+   from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+   result = BatchResult( index, job.output )
+   fig = None
+
+   try:
+      t = time.time()
+      fig = job.getBuildFunc()( *job.args, **job.kwargs )
+      result.timings[ 'build' ] = time.time() - t
+
+      t = time.time()
+      _WORKER[ 'mgr' ].applyMany( [ ( fig, job.styles ) ] )
+      result.timings[ 'style' ] = time.time() - t
+
+      t = time.time()
+      if fig.canvas is None:
+         FigureCanvasAgg( fig )
+
+      outdir = os.path.dirname( job.output )
+      if outdir and not os.path.exists( outdir ):
+         os.makedirs( outdir )
+
+      fig.savefig( job.output, **job.saveKwargs )
+      result.timings[ 'save' ] = time.time() - t
+
+   except Exception:
+      result.error = traceback.format_exc()
+
+   # Release figures that were made with pyplot
+   if ( fig is not None ) and ( 'matplotlib.pyplot' in sys.modules ):
+      sys.modules[ 'matplotlib.pyplot' ].close( fig )
+
+   return result
+
+#===========================================================================
+def main( argv = None ):
+   """: Run the jobs in a JSON file from the command line.
+
+   The file contains a list of jobs.  Each job is a dictionary with the
+   arguments of BatchJob, where 'build' is in the form 'module:function'.
+
+   Eg.
+      [ { "build" : "reports.plots:buildFlux",
+          "styles" : [ "Dark", "Report" ],
+          "output" : "out/flux000.png",
+          "args" : [ 0 ] } ]
+
+   = INPUT VARIABLES
+   - argv   The list of command line arguments.  If not specified, then
+            sys.argv is used.
+
+   = RETURN VALUE
+   - Returns the exit status: 0 if every job succeeded, otherwise 1.
+   """
+   parser = argparse.ArgumentParser( prog = "python -m mplStyle.batch",
+               description = "Style and save matplotlib figures with a pool "
+                             "of processes." )
+   parser.add_argument( "jobs", help = "The JSON file of jobs to run." )
+   parser.add_argument( "--path", action = "append",
+                        help = "A directory to load styles from.  Can be "
+                               "used more than once." )
+   parser.add_argument( "-j", "--processes", type = int, default = None,
+                        help = "The number of worker processes." )
+   parser.add_argument( "--chunk", type = int, default = None,
+                        help = "The number of jobs sent to a worker at a "
+                               "time." )
+   options = parser.parse_args( argv )
+
+   with open( options.jobs ) as fin:
+      jobs = [ BatchJob( **job ) for job in json.load( fin ) ]
+
+   report = run( jobs, options.path, options.processes, options.chunk )
+   print report
+
+   if report.failures():
+      return 1
+
+   return 0
+
+#===========================================================================
+if __name__ == "__main__":
+   sys.exit( main() )
+
@@ -274,4 +274,27 @@ class TestMplAxesStyle( unittest.TestCase ):
                    msg = "Failed to throw on invalid element." )
 
    #-----------------------------------------------------------------------
+   def testUnchanged( self ):
+      """Test applying MplAxesStyle to axes that already have its values."""
+
+      fig = mpl.figure.Figure()
+      ax = mpl.axes.Axes( fig, [ 0.2, 0.2, 0.6, 0.6 ] )
+      style = MplAxesStyle( zOrder = 2, axisBelow = True, bgColor = '#FF0000',
+                            showFrame = False )
+      style.apply( ax )
+
+      calls = []
+      for p in [ 'zorder', 'axisbelow', 'axis_bgcolor', 'frame_on' ]:
+         setattr( ax, 'set_' + p,
+                  lambda value, p = p: calls.append( ( p, value ) ) )
+
+      style.apply( ax )
+      self.assertEqual( [], calls,
+                        msg = "Set values that did not change." )
+
+      MplAxesStyle( axisBelow = False, showFrame = False ).apply( ax )
+      self.assertEqual( [ ( 'axisbelow', False ) ], calls,
+                        msg = "Failed to set only the changed value." )
+
+   #-----------------------------------------------------------------------
 
@@ -278,4 +278,108 @@ class TestMplAxisStyle( unittest.TestCase ):
                    msg = "Failed to throw with invalid axis type." )
 
    #-----------------------------------------------------------------------
+   def testNewTicks( self ):
+      """Test styling the ticks created after applying MplAxisStyle."""
+      fig = mpl.figure.Figure()
+      ax = mpl.axes.Axes( fig, [ 0.2, 0.2, 0.6, 0.6 ] )
+
+      style = MplAxisStyle()
+      style.majorTicks.length = 15.0
+      style.majorTicks.pad = 2.0
+      style.majorTicks.labels.color = '#FF0000'
+      style.minorTicks.marks.color = '#0000FF'
+
+      style.apply( ax.xaxis )
+      style.apply( ax.xaxis )
+
+      tickVals = { 'pad' : 2.0 }
+      markVals = { 'markersize' : 15.0 }
+      labelVals = { 'color' : '#FF0000' }
+
+      # Ticks created when matplotlib needs more ticks
+      ticks = ax.xaxis.get_major_ticks( 20 )
+      self.assertEqual( 20, len( ticks ), msg = "Invalid number of ticks." )
+
+      for tick in ticks:
+         self.checkElement( "New tick", tickVals, tick )
+         self.checkElement( "New mark", markVals, tick.tick1line )
+         self.checkElement( "New label", labelVals, tick.label1 )
+
+      # Ticks created when matplotlib resets the ticks
+      ax.xaxis.reset_ticks()
+
+      for tick in ax.xaxis.get_major_ticks():
+         self.checkElement( "Reset tick", tickVals, tick )
+         self.checkElement( "Reset mark", markVals, tick.tick1line )
+         self.checkElement( "Reset label", labelVals, tick.label1 )
+
+      for tick in ax.xaxis.get_minor_ticks():
+         self.checkElement( "Reset minor mark", { 'color' : '#0000FF' },
+                            tick.tick1line )
+
+      # The y-axis was not styled
+      for tick in ax.yaxis.get_major_ticks( 20 ):
+         self.assertNotEqual( 2.0, tick.get_pad(),
+                              msg = "Styled a tick of the wrong axis." )
+
+   #-----------------------------------------------------------------------
+   def testReapplyNewTicks( self ):
+      """Test styling new ticks after applying MplAxisStyle many times."""
+      fig = mpl.figure.Figure()
+      ax = mpl.axes.Axes( fig, [ 0.2, 0.2, 0.6, 0.6 ] )
+
+      style = MplAxisStyle()
+      style.majorTicks.labels.color = '#FF0000'
+      style.apply( ax.xaxis )
+
+      other = MplAxisStyle()
+      other.majorTicks.pad = 2.0
+
+      for i in range( 50 ):
+         other.majorTicks.length = float( i )
+         other.apply( ax.xaxis )
+
+      plan = ax.xaxis._get_tick.plans[ 'major' ]
+      self.assertEqual( True, isinstance( plan, dict ),
+                        msg = "Failed to keep a single tick plan." )
+
+      # The new ticks have the values of every style that was applied
+      for tick in ax.xaxis.get_major_ticks( 20 ):
+         self.checkElement( "New tick", { 'pad' : 2.0 }, tick )
+         self.checkElement( "New mark", { 'markersize' : 49.0 },
+                            tick.tick1line )
+         self.checkElement( "New label", { 'color' : '#FF0000' }, tick.label1 )
+
+   #-----------------------------------------------------------------------
+
+   def testExistingTicks( self ):
+      """Test applying MplAxisStyle without finding the ticks to use."""
+      fig = mpl.figure.Figure()
+      ax = mpl.axes.Axes( fig, [ 0.2, 0.2, 0.6, 0.6 ] )
+
+      class CountingLocator( matplotlib.ticker.AutoLocator ):
+         calls = 0
+         def __call__( self ):
+            CountingLocator.calls += 1
+            return matplotlib.ticker.AutoLocator.__call__( self )
+
+      ticks = ax.xaxis.get_major_ticks( 5 )
+      ax.xaxis.set_major_locator( CountingLocator() )
+
+      style = MplAxisStyle()
+      style.majorTicks.labels.color = '#FF0000'
+      style.apply( ax.xaxis )
+
+      self.assertEqual( 0, CountingLocator.calls,
+                        msg = "Ran the tick locator to apply the style." )
+
+      for tick in ticks:
+         self.checkElement( "Existing label", { 'color' : '#FF0000' },
+                            tick.label1 )
+
+      for tick in ax.xaxis.get_major_ticks():
+         self.checkElement( "Located label", { 'color' : '#FF0000' },
+                            tick.label1 )
+
+   #-----------------------------------------------------------------------
 
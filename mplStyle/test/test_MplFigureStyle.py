@@ -199,3 +199,28 @@ class TestMplFigureStyle( unittest.TestCase ):
 
    #-----------------------------------------------------------------------
 
+   def testUnchanged( self ):
+      """Test applying MplFigureStyle without changing the figure layout."""
+
+      element = matplotlib.figure.Figure()
+      style = S.MplFigureStyle( width = 8.0, dpi = 90, leftMargin = 0.2,
+                                rightMargin = 0.1 )
+      style.apply( element )
+
+      calls = []
+      element.subplots_adjust = lambda **kw: calls.append( kw )
+      element.set_size_inches = lambda *args, **kw: calls.append( args )
+      element.set_dpi = lambda *args: calls.append( args )
+
+      style.apply( element )
+      S.MplFigureStyle( bgColor = 'white' ).apply( element )
+      self.assertEqual( [], calls,
+                        msg = "Changed the layout with the same values." )
+
+      S.MplFigureStyle( rightMargin = 0.2, height = 5.0 ).apply( element )
+      self.assertEqual( [ { 'right' : 0.8 },
+                          ( 8.0, 5.0 ) ], calls,
+                        msg = "Failed to change only the changed layout." )
+
+   #-----------------------------------------------------------------------
+
@@ -110,4 +110,26 @@ class TestMplFontStyle( unittest.TestCase ):
                    msg = "Failed to throw on invalid element." )
 
    #-----------------------------------------------------------------------
+   def testUnchanged( self ):
+      """Test applying MplFontStyle to a font that already has its values."""
+
+      element = mpl.font_manager.FontProperties()
+      style = MplFontStyle( size = 12, family = 'serif', style = 'italic',
+                            weight = 'bold' )
+      style.apply( element )
+
+      calls = []
+      for p in [ 'size', 'family', 'style', 'weight' ]:
+         setattr( element, 'set_' + p,
+                  lambda value, p = p: calls.append( ( p, value ) ) )
+
+      style.apply( element )
+      self.assertEqual( [], calls,
+                        msg = "Set values that did not change." )
+
+      MplFontStyle( size = 14, family = 'serif' ).apply( element )
+      self.assertEqual( [ ( 'size', 14 ) ], calls,
+                        msg = "Failed to set only the changed value." )
+
+   #-----------------------------------------------------------------------
 
@@ -133,3 +133,57 @@ class TestMplLineStyle( unittest.TestCase ):
 
    #-----------------------------------------------------------------------
 
+   def testUnchanged( self ):
+      """Test applying MplLineStyle to a line that already has its values."""
+
+      element = mpl.lines.Line2D( [1, 2, 3], [3, 2, 1] )
+      style = MplLineStyle( color = 'red', width = 2.5,
+                            marker = { 'style' : 'o', 'size' : 8 } )
+      style.apply( element )
+
+      updates = []
+      update = element.update
+      def recordUpdate( kw ):
+         updates.append( kw )
+         update( kw )
+      element.update = recordUpdate
+
+      style.apply( element )
+      self.assertEqual( [], updates,
+                        msg = "Set values that did not change." )
+
+      element.set_linewidth( 1.0 )
+      style.apply( element )
+      self.assertEqual( [ { 'linewidth' : 2.5 } ], updates,
+                        msg = "Failed to set only the changed value." )
+      self.checkElement( "Changed", { 'linewidth' : 2.5 }, element )
+
+   #-----------------------------------------------------------------------
+
+   def testSingleUpdate( self ):
+      """Test that MplLineStyle sets all of its values in one update."""
+
+      element = mpl.lines.Line2D( [1, 2, 3], [3, 2, 1] )
+      style = MplLineStyle( color = 'red', width = 2.5, alpha = 0.5,
+                            marker = { 'style' : 'o', 'size' : 8 } )
+
+      plan = style.compile()
+      self.assertEqual( 1, len( plan ),
+                        msg = "Compiled more than one update." )
+
+      updates = []
+      update = element.update
+      def recordUpdate( kw ):
+         updates.append( kw )
+         update( kw )
+      element.update = recordUpdate
+
+      style.apply( element )
+      self.assertEqual( 1, len( updates ),
+                        msg = "Applied more than one update." )
+      self.checkElement( "Single", { 'linewidth' : 2.5, 'alpha' : 0.5,
+                                     'marker' : 'o', 'markersize' : 8 },
+                         element )
+
+   #-----------------------------------------------------------------------
+
@@ -114,4 +114,28 @@ class TestMplMarkerStyle( unittest.TestCase ):
                    msg = "Failed to throw on invalid element." )
 
    #-----------------------------------------------------------------------
+   def testUnchanged( self ):
+      """Test applying MplMarkerStyle to a line that already has its values."""
+
+      element = mpl.lines.Line2D( [1, 2, 3], [3, 2, 1] )
+      style = MplMarkerStyle( style = 'o', size = 8, color = '#00FF00' )
+      style.apply( element )
+
+      updates = []
+      update = element.update
+      def recordUpdate( kw ):
+         updates.append( kw )
+         update( kw )
+      element.update = recordUpdate
+
+      style.apply( element )
+      self.assertEqual( [], updates,
+                        msg = "Set values that did not change." )
+
+      element.set_markersize( 4 )
+      style.apply( element )
+      self.assertEqual( [ { 'markersize' : 8 } ], updates,
+                        msg = "Failed to set only the changed value." )
+
+   #-----------------------------------------------------------------------
 
@@ -50,12 +50,14 @@ mpl.use( "Agg" )
 
 import matplotlib.pyplot
 import matplotlib.axes
+import matplotlib.collections
 import matplotlib.figure
 import matplotlib.patches
 import matplotlib.text
 import os, os.path
 import shutil
 import math, operator
+import pickle
 
 import mplStyle as S
 
@@ -232,14 +234,24 @@ class TestMplStyle( unittest.TestCase ):
                    '__metaclass__', '__module__', '__new__', '__reduce__',
                    '__reduce_ex__',
                    '__repr__', '__setattr__', '__sizeof__', '__str__',
-                   '__subclasshook__', '__weakref__', '_aliases',
-                   '_applyStyle', '_completed_init', '_getParentOfProperty',
-                   '_name', '_propertyNames', '_restricted_setattr',
-                   '_subStyle', 'apply', 'axes', 'bgColor', 'canApply', 'copy',
-                   'custom', 'fgColor', 'figure', 'format', 'getPropertyType',
-                   'getResolvedValue', 'getValue', 'hasAnySet', 'kwargs',
+                   '__subclasshook__', '__weakref__', '_addOwner', '_aliases',
+                   '_applyResolved', '_applyStyle', '_attach', '_cache',
+                   '_changed', '_clone', '_completed_init', '_customChain',
+                   '_customFile', '_getParentOfProperty', '_getProperties',
+                   '_getResolved', '_isUnset', '_loadCustom',
+                   '_name', '_owners', '_peek', '_pendingOwner',
+                   '_propertyInitializers',
+                   '_propertyNames', '_propertyTemplate', '_removeOwner',
+                   '_resolveStats', '_restricted_setattr',
+                   '_subStyle', '_trackChanges', '_version', '_versionCounter',
+                   '_versionKey', 'apply', 'axes', 'batch', 'beginBatch',
+                   'bgColor', 'canApply', 'compile', 'copy', 'custom',
+                   'endBatch', 'fgColor', 'figure', 'format', 'fromState',
+                   'getPropertyType', 'getResolvedValue', 'getState',
+                   'getValue', 'hasAnySet', 'kwargs',
                    'line', 'name', 'parent', 'patch', 'propertyNames',
-                   'resolve', 'resolveStyles', 'setValue', 'text', 'update' ]
+                   'resolve', 'resolveCacheStats', 'resolveStyles',
+                   'setValue', 'text', 'update' ]
       self.assertEqual( expected, dir(style), msg = "Invalid 'dir' result." )
 
       # Check the str function
@@ -421,4 +433,376 @@ class TestMplStyle( unittest.TestCase ):
                   msg = "Styled plot is not correct" )
 
    #-----------------------------------------------------------------------
+   def testCompile( self ):
+      """Test compiling an MplStyle into a plan."""
+      fig, ax = matplotlib.pyplot.subplots()
+      ax.set_title( "This is the Title" )
+      line = ax.plot( [1, 2, 3, 4], [2, 4, 6, 8] )[0]
+
+      style = S.MplStyle( "Compiled Style" )
+      style.figure.width = 6
+      style.axes.title.font.size = 20
+      style.line.width = 3
+      style.line.marker.style = 'circle'
+
+      plan = style.compile()
+      self.assertEqual( True, plan.style is style,
+                        msg = "Invalid plan style." )
+
+      # Check the compiled values
+      self.assertEqual( [ { 'marker' : 'o', 'linewidth' : 3.0 } ],
+                        plan[ 'line' ], msg = "Invalid line plan." )
+      self.assertEqual( plan[ 'line' ], plan[ 'figure.axes.line' ],
+                        msg = "Invalid nested line plan." )
+      self.assertEqual( True, plan[ 'line' ] is plan[ 'line' ],
+                        msg = "Plan targets should only be compiled once." )
+      self.assertEqual( 6.0, plan[ 'figure' ][ 'width' ],
+                        msg = "Invalid figure plan." )
+      self.assertEqual( { 'size' : 20.0 },
+                        plan[ 'figure.axes' ][ 'title' ][ 'font' ],
+                        msg = "Invalid axes plan." )
+
+      self.assertRaises( Exception, plan.__getitem__, 'bogus',
+                   msg = "Failed to throw on an invalid target." )
+      self.assertRaises( Exception, plan.__getitem__, 'line.axes',
+                   msg = "Failed to throw on an invalid container." )
+      self.assertRaises( Exception, style.line.applyPlan, ax,
+                         plan[ 'line' ],
+                   msg = "Failed to throw on an invalid plan object." )
+
+      # Apply the plan directly
+      style.line.applyPlan( line, plan[ 'line' ] )
+      self.assertEqual( 3.0, line.get_linewidth(),
+                        msg = "Plan was not applied to the line." )
+
+      # Applying the style uses the plan
+      style.apply( fig )
+      self.assertEqual( 6.0, fig.get_figwidth(),
+                        msg = "Style was not applied to the figure." )
+      self.assertEqual( 20.0, ax.title.get_fontsize(),
+                        msg = "Style was not applied to the title." )
+      self.assertEqual( 'o', line.get_marker(),
+                        msg = "Style was not applied to the line." )
+
+   #-----------------------------------------------------------------------
+   def testResolveCache( self ):
+      """Test caching the resolved MplStyle."""
+      base = S.MplStyle( "Base" )
+      base.line.width = 1
+      base.line.color = 'red'
+
+      left = S.MplStyle( "Left", parent = base )
+      left.line.color = 'green'
+
+      right = S.MplStyle( "Right", parent = base )
+      right.line.marker.size = 5
+
+      style = S.MplStyle( "Diamond", parent = [ left, right ] )
+
+      def checkResolve( hits, misses, msg ):
+         resolved = style.resolve( "Resolved" )
+         stats = S.MplStyle.resolveCacheStats( reset = True )
+         self.assertEqual( { 'hits' : hits, 'misses' : misses }, stats,
+                           msg = msg )
+         return resolved
+
+      S.MplStyle.resolveCacheStats( reset = True )
+      resolved = checkResolve( 1, 4, "Failed to resolve each style once." )
+      self.assertEqual( "Resolved", resolved.name,
+                        msg = "Invalid resolved style name." )
+      self.assertEqual( 1.0, resolved.line.width,
+                        msg = "Invalid resolved line width." )
+      self.assertEqual( 5.0, resolved.line.marker.size,
+                        msg = "Invalid resolved marker size." )
+
+      # The resolved style is a copy
+      resolved.line.width = 10
+      resolved = checkResolve( 1, 0, "Failed to use the cached style." )
+      self.assertEqual( 1.0, resolved.line.width,
+                        msg = "Resolved style was not copied." )
+
+      # Changing a property of any style in the hierarchy
+      base.line.width = 2
+      resolved = checkResolve( 1, 4, "Failed to resolve a nested change." )
+      self.assertEqual( 2.0, resolved.line.width,
+                        msg = "Resolved style was not updated." )
+
+      right.setValue( 'line.marker.size', 6 )
+      resolved = checkResolve( 2, 2, "Failed to resolve a set value." )
+      self.assertEqual( 6.0, resolved.line.marker.size,
+                        msg = "Resolved style was not updated by setValue." )
+
+      update = S.MplStyle( "Update" )
+      update.line.style = '--'
+      style.update( update )
+      resolved = checkResolve( 2, 1, "Failed to resolve an update." )
+      self.assertEqual( '--', resolved.line.style,
+                        msg = "Resolved style was not updated by update." )
+
+      style.parent = [ right, left ]
+      resolved = checkResolve( 2, 1, "Failed to resolve a new parent." )
+      self.assertEqual( '#008000', resolved.line.color,
+                        msg = "Resolved style was not updated by parent." )
+
+      style.custom = doNothing
+      checkResolve( 2, 1, "Failed to resolve a new custom function." )
+
+      # Compiling only changes with the style
+      plan = style.compile()
+      self.assertEqual( True, plan is style.compile(),
+                        msg = "Failed to use the cached plan." )
+      style.line.width = 3
+      self.assertEqual( False, plan is style.compile(),
+                        msg = "Failed to compile the changed style." )
+
+   #-----------------------------------------------------------------------
+   def testApplyResolved( self ):
+      """Test applying the resolved MplStyle."""
+      calls = []
+
+      def makeCustom( name ):
+         def custom( element ):
+            calls.append( name )
+         return custom
+
+      class RecordingLine( matplotlib.lines.Line2D ):
+         def update( self, props ):
+            calls.append( sorted( props.keys() ) )
+            return matplotlib.lines.Line2D.update( self, props )
+
+      base = S.MplStyle( "Base", custom = makeCustom( "base" ) )
+      base.line.width = 1
+      base.line.color = 'red'
+
+      org = S.MplStyle( "Org", parent = base, custom = makeCustom( "org" ) )
+      org.line.width = 2
+
+      team = S.MplStyle( "Team", parent = [ org, base ],
+                         custom = makeCustom( "team" ) )
+      team.line.width = 3
+
+      def countUpdates( key ):
+         return len( [ c for c in calls if isinstance( c, list ) and key in c ] )
+
+      line = RecordingLine( [ 0, 1 ], [ 0, 1 ] )
+      team.apply( line, resolved = True )
+
+      self.assertEqual( 1, countUpdates( 'linewidth' ),
+                        msg = "Resolved style was not applied once." )
+      self.assertEqual( [ 'base', 'org', 'team' ], calls[ -3: ],
+                        msg = "Invalid order of custom functions." )
+      self.assertEqual( 3.0, line.get_linewidth(),
+                        msg = "Invalid resolved line width." )
+      self.assertEqual( base.line.color, line.get_color(),
+                        msg = "Invalid resolved line color." )
+
+      del calls[:]
+      team.apply( line, resolved = False )
+      self.assertEqual( 4, countUpdates( 'linewidth' ),
+                        msg = "Failed to apply each parent style." )
+
+      # The class default is used when not specified
+      del calls[:]
+      self.assertEqual( False, S.MplStyle._applyResolved,
+                        msg = "Invalid default apply mode." )
+      team._applyResolved = True
+      line.set_linewidth( 1 )
+      team.apply( line )
+      self.assertEqual( 1, countUpdates( 'linewidth' ),
+                        msg = "Failed to use the apply mode of the style." )
+
+   #-----------------------------------------------------------------------
+
+   def testAttributeRoutes( self ):
+      """A test of where MplStyle attributes are found."""
+
+      class MplDerivedStyle( S.MplStyle ):
+         extra = 'class'
+         def __init__( self, *args, **kwargs ):
+            S.MplStyle.__init__( self, *args, **kwargs )
+            self.bgColor = 'white'
+            self.newProperty = 'instance'
+
+      style = MplDerivedStyle( "Derived Style" )
+      style.line.width = 2
+
+      self.assertEqual( '#FFFFFF', style.bgColor,
+                        msg = "Failed to get a sub-style property." )
+      self.assertEqual( '#FFFFFF', style._subStyle.bgColor,
+                        msg = "Failed to set a sub-style property." )
+      self.assertEqual( 2, style._subStyle.line.width,
+                        msg = "Failed to set a nested sub-style property." )
+      self.assertEqual( 'class', style.extra,
+                        msg = "Failed to get a class attribute." )
+      self.assertEqual( 'instance', style.newProperty,
+                        msg = "Failed to get an instance attribute." )
+
+      style.extra = 'changed'
+      style.newProperty = 'changed'
+      self.assertEqual( 'changed', style.__dict__[ 'extra' ],
+                        msg = "Failed to set a class attribute." )
+      self.assertEqual( 'changed', style.__dict__[ 'newProperty' ],
+                        msg = "Failed to set an instance attribute." )
+      self.assertEqual( 'class', MplDerivedStyle.extra,
+                        msg = "Changed the class attribute." )
+
+      # The routes of another style class do not change
+      style = S.MplStyle( "Plain Style" )
+      self.assertRaises( Exception, getattr, style, 'extra',
+                         msg = "Failed to throw on an invalid property." )
+
+   #-----------------------------------------------------------------------
+
+   def testRegisterType( self ):
+      """A test of registering how to apply to a type of object."""
+
+      class MyText( matplotlib.text.Text ):
+         pass
+
+      class MyCollection( matplotlib.collections.LineCollection ):
+         pass
+
+      applied = []
+      def applyToCollection( style, obj, filter, postProcess, plan, prefix ):
+         applied.append( ( obj, prefix ) )
+         for values in plan[ prefix + 'line' ]:
+            obj.update( values )
+
+      style = S.MplStyle( "Registered Style" )
+      style.text.font.size = 15
+      style.line.width = 3
+
+      text = MyText( 0, 0, "text" )
+      self.assertEqual( '_applyToText', style._getApplyFunc( text ),
+                        msg = "Invalid apply function for a sub-class." )
+
+      # Registering a sub-class replaces the cached base class function
+      S.MplStyle.registerType( MyText, '_applyToFont' )
+      self.assertEqual( '_applyToFont', style._getApplyFunc( text ),
+                        msg = "Failed to use the registered sub-class." )
+      S.MplStyle.registerType( MyText, '_applyToText' )
+
+      fig, ax = matplotlib.pyplot.subplots()
+      collection = MyCollection( [ [ ( 0, 0 ), ( 1, 1 ) ] ] )
+      ax.add_collection( collection )
+
+      self.assertEqual( False, style.canApply( collection ),
+                        msg = "Can apply to an unregistered type." )
+      style.apply( fig )
+      self.assertEqual( [], applied,
+                        msg = "Applied to an unregistered type." )
+
+      S.MplStyle.registerType( MyCollection, applyToCollection )
+      self.assertEqual( True, style.canApply( collection ),
+                        msg = "Cannot apply to a registered type." )
+
+      style.apply( fig )
+      self.assertEqual( [ ( collection, 'figure.axes.' ) ], applied,
+                        msg = "Failed to apply to a registered collection." )
+      self.assertEqual( ( 3.0, ), tuple( collection.get_linewidths() ),
+                        msg = "Invalid registered collection line width." )
+
+      del applied[:]
+      style.apply( collection )
+      self.assertEqual( [ ( collection, '' ) ], applied,
+                        msg = "Failed to apply to a registered type." )
+
+   #-----------------------------------------------------------------------
+
+   def testBind( self ):
+      """A test of keeping bound elements updated with style changes."""
+
+      style = S.MplStyle( "Bound Style" )
+      style.line.width = 3
+      style.axes.xAxis.majorTicks.labels.font.weight = 'bold'
+      style.axes.xAxis.majorTicks.labels.font.size = 8
+
+      fig, ax = matplotlib.pyplot.subplots()
+      line, = ax.plot( [ 0, 1 ], [ 0, 1 ] )
+      style.bind( fig )
+
+      self.assertEqual( 3.0, line.get_linewidth(),
+                        msg = "Failed to apply the bound style." )
+
+      updates = []
+      update = line.update
+      def recordUpdate( kw ):
+         updates.append( kw )
+         update( kw )
+      line.update = recordUpdate
+
+      style.line.color = 'red'
+      self.assertEqual( [ { 'color' : '#FF0000' } ], updates,
+                        msg = "Failed to apply only the changed line value." )
+      self.assertEqual( '#FF0000', line.get_color(),
+                        msg = "Invalid bound line color." )
+
+      weights = []
+      font = ax.xaxis.get_major_ticks()[0].label1.get_font_properties()
+      font.set_weight = weights.append
+
+      del updates[:]
+      style.axes.xAxis.majorTicks.labels.font.size = 20
+      self.assertEqual( 20.0, font.get_size(),
+                        msg = "Failed to apply the changed font size." )
+      self.assertEqual( [], weights,
+                        msg = "Applied an unchanged font value." )
+      self.assertEqual( [], updates,
+                        msg = "Applied a font change to a line." )
+
+      # Ticks that are created later use the changed plan
+      tick = ax.xaxis.get_major_ticks( 30 )[-1]
+      self.assertEqual( 20.0, tick.label1.get_size(),
+                        msg = "Invalid font size of a new tick." )
+      self.assertEqual( 20.0, ax.xaxis._get_tick.plans[ 'major' ][
+                        'labels' ][ 'font' ][ 'size' ],
+                        msg = "Failed to replace the old tick plan." )
+
+      style.unbind()
+      style.line.color = 'blue'
+      self.assertEqual( '#FF0000', line.get_color(),
+                        msg = "Applied a change after unbinding." )
+
+      self.assertRaises( Exception, style.bind, "bogusObject",
+                         msg = "Failed to throw on an invalid bind object." )
+
+   #-----------------------------------------------------------------------
+
+   def testPickle( self ):
+      """Test sending an MplStyle through pickle."""
+
+      parent = S.MplStyle( "Pickle Parent" )
+      parent.line.width = 3
+      parent.figure.bgColor = 'white'
+
+      child = S.MplStyle( "Pickle Child", { 'line.color' : 'red',
+                                            'line.marker.size' : 8 },
+                          parent = parent )
+      other = S.MplStyle( "Pickle Other", parent = parent )
+
+      self.assertEqual( { 'name' : "Pickle Child",
+                          'properties' : { 'line.color' : '#FF0000',
+                                           'line.marker.size' : 8.0 },
+                          'parents' : [ "Pickle Parent" ],
+                          'custom' : None },
+                        child.getState(), msg = "Invalid style state." )
+
+      newChild, newOther = pickle.loads(
+         pickle.dumps( [ child, other ], pickle.HIGHEST_PROTOCOL ) )
+
+      self.assertEqual( "Pickle Child", newChild.name,
+                        msg = "Invalid name of the unpickled style." )
+      self.assertEqual( True, newChild.parent[0] is newOther.parent[0],
+                        msg = "Failed to share the unpickled parent." )
+      self.assertEqual( child._getResolved().compile()[ 'figure.axes.line' ],
+                        newChild._getResolved().compile()[ 'figure.axes.line' ],
+                        msg = "Invalid values of the unpickled style." )
+      self.assertEqual( '#FFFFFF',
+                        newChild.getResolvedValue( 'figure.bgColor' ),
+                        msg = "Invalid values of the unpickled parent." )
+
+      self.assertRaises( Exception, S.MplStyle.fromState, child.getState(),
+                   msg = "Failed to throw on missing parent styles." )
+
+   #-----------------------------------------------------------------------
 
@@ -52,13 +52,17 @@ import matplotlib.axes
 import matplotlib.figure
 import matplotlib.patches
 import matplotlib.text
+import matplotlib.font_manager
 import matplotlib.pyplot
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import os
 import os.path
 import shutil
 import math
 import operator
+import pickle
 import mplStyle as S
+from mplStyle.MplStyleManager import parseLiteral
 
 #
 # Place all imports before here.
@@ -411,3 +415,497 @@ class TestMplStyleManager( unittest.TestCase ):
 
    #-----------------------------------------------------------------------
 
+   def testReapplyChanged( self ):
+      """Test re-applying only the styles that changed."""
+
+      fig, ax = matplotlib.pyplot.subplots()
+      line1, line2 = ax.plot( [ 0, 1 ], [ 0, 1 ], [ 0, 1 ], [ 1, 0 ] )
+
+      mgr = S.mgr
+
+      base = mgr.create( 'Reapply Base' )
+      base.line.width = 2
+      child = mgr.create( 'Reapply Child', parent = base )
+      other = mgr.create( 'Reapply Other' )
+      other.line.width = 3
+
+      mgr.apply( line1, child )
+      mgr.apply( line2, other )
+
+      def reapply( *args, **kwargs ):
+         line1.set_linewidth( 1 )
+         line2.set_linewidth( 1 )
+         mgr.reapply( *args, **kwargs )
+         return ( line1.get_linewidth(), line2.get_linewidth() )
+
+      self.assertEqual( ( 1.0, 1.0 ), reapply(),
+               msg = "Re-applied styles that did not change." )
+      self.assertEqual( ( 2.0, 3.0 ), reapply( force = True ),
+               msg = "Failed to force re-applying the styles." )
+
+      # Changing the parent re-applies the child style
+      base.line.width = 4
+      self.assertEqual( ( 1.0, 1.0 ), reapply( 'Reapply Other' ),
+               msg = "Re-applied a style that was not named." )
+      self.assertEqual( ( 4.0, 1.0 ), reapply( [ 'Reapply Child' ] ),
+               msg = "Failed to re-apply a style with a changed parent." )
+      self.assertEqual( ( 1.0, 1.0 ), reapply(),
+               msg = "Re-applied a style twice." )
+
+      other.line.width = 5
+      self.assertEqual( ( 1.0, 5.0 ), reapply(),
+               msg = "Failed to re-apply a changed style." )
+
+      # Changing the styles of an element re-applies it
+      mgr.setElementStyles( line2, [ child.name ] )
+      self.assertEqual( ( 1.0, 4.0 ), reapply(),
+               msg = "Failed to re-apply new element styles." )
+
+      # Different elements with equal values are each re-applied
+      fonts = [ mpl.font_manager.FontProperties( size = 10 ),
+                mpl.font_manager.FontProperties( size = 10 ) ]
+      mgr.apply( fonts, other )
+      other.text.font.size = 30
+      mgr.reapply()
+      self.assertEqual( [ 30.0, 30.0 ], [ f.get_size() for f in fonts ],
+               msg = "Failed to re-apply elements with equal values." )
+
+      for style in [ child, base, other ]:
+         mgr.erase( style )
+
+   #-----------------------------------------------------------------------
+
+   def testBatch( self ):
+      """Test redrawing each figure once after a batch of applies."""
+
+      # Figures that pyplot does not manage, so only the style redraws them
+      figs = [ matplotlib.figure.Figure(), matplotlib.figure.Figure() ]
+      lines = []
+      draws = []
+      for fig in figs:
+         FigureCanvasAgg( fig )
+         ax = fig.add_subplot( 111 )
+         lines.extend( ax.plot( [ 0, 1 ], [ 0, 1 ], [ 0, 1 ], [ 1, 0 ] ) )
+         fig.canvas.draw = lambda fig=fig: draws.append( ( 'draw', fig ) )
+         fig.canvas.draw_idle = \
+            lambda fig=fig: draws.append( ( 'draw_idle', fig ) )
+
+      mgr = S.mgr
+
+      wide = mgr.create( 'Batch Wide' )
+      wide.line.width = 3
+      red = mgr.create( 'Batch Red' )
+      red.line.color = 'red'
+
+      mpl.interactive( True )
+      try:
+         mgr.apply( lines, [ wide, red ] )
+         self.assertEqual( [ ( 'draw_idle', figs[0] ),
+                             ( 'draw_idle', figs[1] ) ], draws,
+                  msg = "Failed to redraw each figure once after applying." )
+
+         del draws[:]
+         with mgr.batch():
+            mgr.apply( lines[0], wide )
+            mgr.apply( figs[1], red )
+            self.assertEqual( [], draws,
+                     msg = "Redrew a figure during a batch." )
+
+         self.assertEqual( [ ( 'draw_idle', figs[0] ),
+                             ( 'draw_idle', figs[1] ) ], draws,
+                  msg = "Failed to redraw each figure once after a batch." )
+
+         # The elements are re-applied in any order
+         del draws[:]
+         wide.line.width = 4
+         mgr.reapply()
+         self.assertEqual( sorted( [ ( 'draw_idle', figs[0] ),
+                                     ( 'draw_idle', figs[1] ) ] ),
+                           sorted( draws ),
+                  msg = "Failed to redraw each figure once after reapply." )
+
+         # Applying a style directly still draws right away
+         del draws[:]
+         red.apply( figs[0] )
+         self.assertEqual( [ ( 'draw', figs[0] ) ], draws,
+                  msg = "Failed to redraw after applying a style." )
+      finally:
+         mpl.interactive( False )
+
+      for style in [ wide, red ]:
+         mgr.erase( style )
+
+   #-----------------------------------------------------------------------
+
+   def testQuietStale( self ):
+      """Test marking each figure stale once after a batch of applies."""
+
+      figs = [ matplotlib.figure.Figure(), matplotlib.figure.Figure() ]
+      lines = []
+      stale = []
+      for fig in figs:
+         ax = fig.add_subplot( 111 )
+         lines.extend( ax.plot( [ 0, 1 ], [ 0, 1 ], [ 0, 1 ], [ 1, 0 ] ) )
+         fig.stale = False
+         fig.stale_callback = lambda fig, val: stale.append( fig )
+
+      mgr = S.mgr
+      wide = mgr.create( 'Stale Wide' )
+      wide.line.width = 3
+      wide.line.color = 'red'
+
+      with mgr.batch():
+         mgr.apply( lines, wide )
+         mgr.apply( figs[1], wide )
+         self.assertEqual( [], stale,
+                  msg = "Marked a figure stale during a batch." )
+         self.assertEqual( False, figs[0].stale,
+                  msg = "Passed the stale state of a line to its figure." )
+         self.assertEqual( True, lines[0].stale,
+                  msg = "Failed to mark a styled line stale." )
+
+      self.assertEqual( figs, stale,
+               msg = "Failed to mark each figure stale once after a batch." )
+
+      # Outside of a batch the stale state is passed on again
+      del stale[:]
+      figs[0].stale = False
+      lines[0].set_linewidth( 1 )
+      self.assertEqual( [ figs[0] ], stale,
+               msg = "Failed to restore the stale state callbacks." )
+
+      # Figures that are not styled pass on their stale state in a batch
+      other = matplotlib.figure.Figure()
+      otherLine = other.add_subplot( 111 ).plot( [ 0, 1 ], [ 0, 1 ] )[0]
+      other.stale = False
+
+      with mgr.batch():
+         mgr.apply( lines[0], wide )
+         otherLine.set_color( 'green' )
+         self.assertEqual( True, other.stale,
+                  msg = "Stopped the stale state of an unstyled figure." )
+
+      mgr.erase( wide )
+
+   #-----------------------------------------------------------------------
+
+   def testApplyMany( self ):
+      """Test applying many styles to an element at once."""
+
+      mgr = S.MplStyleManager()
+
+      base = mgr.create( 'Many Base', { 'line.width' : 2,
+                                        'line.color' : 'red' } )
+      section = mgr.create( 'Many Section', { 'line.width' : 3 } )
+      series = mgr.create( 'Many Series', { 'line.style' : '--' } )
+      names = [ base.name, section.name, series.name ]
+
+      lines = []
+      for i in range( 2 ):
+         fig, ax = matplotlib.pyplot.subplots()
+         lines.extend( ax.plot( [ 0, 1 ], [ 0, 1 ] ) )
+         mgr.tag( [ fig, ax, lines[-1] ], 'report' )
+
+      # Count the elements that are checked for tags
+      checked = []
+      getTags = mgr.getTags
+      def countTags( e ):
+         checked.append( e )
+         return getTags( e )
+      mgr.getTags = countTags
+
+      mgr.apply( lines[0].figure, names, tag = 'report' )
+      count = len( checked )
+
+      del checked[:]
+      mgr.applyMany( [ ( lines[1].figure, base, 'report' ),
+                       ( lines[1].figure, names[1:], 'report' ) ] )
+      self.assertEqual( count, 3 * len( checked ),
+               msg = "Failed to style the figure once." )
+
+      for line in lines:
+         self.assertEqual( ( 3.0, '#FF0000', '--' ),
+                           ( line.get_linewidth(), line.get_color(),
+                             line.get_linestyle() ),
+                  msg = "Invalid line style properties." )
+
+      self.assertEqual( names, mgr.getElementStyles( lines[1] ),
+               msg = "Invalid styles of the element." )
+
+      merged = mgr._mergeStyles( [ base, section, series ] )
+      self.assertTrue( merged is mgr._mergeStyles( [ base, section, series ] ),
+               msg = "Failed to reuse the merged styles." )
+
+      section.line.width = 4
+      mgr.reapply()
+      self.assertEqual( 4.0, lines[1].get_linewidth(),
+               msg = "Failed to re-apply the merged styles." )
+      self.assertFalse( merged is mgr._mergeStyles( [ base, section, series ] ),
+               msg = "Reused the merged styles after a change." )
+
+      self.assertRaises( Exception, mgr.applyMany,
+                         [ ( lines[1], 'Many Bogus' ) ],
+               msg = "Failed to throw on applying an unknown style." )
+
+   #-----------------------------------------------------------------------
+
+   def testPickle( self ):
+      """Test sending a style with a custom script through pickle."""
+
+      mgr = S.MplStyleManager()
+      mgr.create( "Pickle Custom", { 'line.width' : 3 } )
+      outdir = os.path.abspath( self.outputFile( "pickle" ) )
+      mgr.save( outdir = outdir )
+
+      fname = os.path.join( outdir, "Pickle_Custom.mplstyle" )
+      customFile = os.path.join( outdir, "Pickle_Custom_custom.mplstyle" )
+      with open( customFile, 'w' ) as fout:
+         fout.write( "def applyStyle( obj ):\n   pass\n" )
+
+      mgr = S.MplStyleManager()
+      style = mgr.loadFile( fname )
+
+      self.assertEqual( customFile, style.getState()[ 'custom' ],
+               msg = "Failed to refer to the custom script." )
+
+      newStyle = pickle.loads( pickle.dumps( style ) )
+      self.assertEqual( True, callable( newStyle.custom ),
+               msg = "Failed to load the custom script." )
+      self.assertEqual( newStyle.custom,
+                        pickle.loads( pickle.dumps( style ) ).custom,
+               msg = "Failed to reuse the loaded custom script." )
+      self.assertEqual( style._getProperties(), newStyle._getProperties(),
+               msg = "Invalid values of the unpickled style." )
+
+      newStyle.custom = None
+      self.assertEqual( None, newStyle.getState()[ 'custom' ],
+               msg = "Failed to forget the custom script." )
+
+   #-----------------------------------------------------------------------
+
+   def testParseFile( self ):
+      """Test loading style files without running them."""
+
+      mgr = S.MplStyleManager()
+      mgr.create( "Parse Style", { 'line.width' : 3,
+                                   'line.marker.style' : 'o',
+                                   'figure.bgColor' : 'white',
+                                   'text.font.family' : "it's serif",
+                                   'axes.axisBelow' : False } )
+      outdir = self.outputFile( "parse" )
+      mgr.save( outdir = outdir )
+      fname = os.path.join( outdir, "Parse_Style.mplstyle" )
+
+      style = mgr._parseFile( fname )
+      self.assertNotEqual( None, style, msg = "Failed to parse a saved file." )
+      self.assertEqual( mgr[ "Parse Style" ]._getProperties(),
+                        style._getProperties(),
+                        msg = "Invalid values of the parsed style." )
+
+      # Files with other statements are run
+      with open( fname, 'a' ) as fout:
+         fout.write( "style.line.width = 1 + 4\n" )
+
+      self.assertEqual( None, mgr._parseFile( fname ),
+               msg = "Parsed a file that needs to be run." )
+      style = S.MplStyleManager().loadFile( fname )
+      self.assertEqual( 5, style.line.width,
+               msg = "Failed to run a file that can not be parsed." )
+
+      with open( fname, 'a' ) as fout:
+         fout.write( "style.line.bogus = 1\n" )
+
+      self.assertRaises( Exception, S.MplStyleManager().loadFile, fname,
+               msg = "Failed to throw on an invalid property." )
+
+      for text in [ "None", "True", "12", "-1.5e3", "'a'", '"b"', "u'c'",
+                    "'d\\'e'", "( 1, 'f' )", "[ 2.0 ]" ]:
+         self.assertEqual( eval( text ), parseLiteral( text ),
+                  msg = "Invalid value of the literal %s." % text )
+
+      self.assertRaises( ValueError, parseLiteral, "1 + 2" )
+
+   #-----------------------------------------------------------------------
+   def testCache( self ):
+      """Test caching loaded style files."""
+
+      mgr = S.MplStyleManager()
+      mgr.create( "Cache Style", { 'line.width' : 3,
+                                   'line.marker.style' : 'o',
+                                   'figure.bgColor' : 'white' } )
+      outdir = self.outputFile( "cachestyles" )
+      cacheDir = self.outputFile( "cache" )
+      mgr.save( outdir = outdir )
+      fname = os.path.join( outdir, "Cache_Style.mplstyle" )
+
+      def loadFile( fromFile ):
+         loader = S.MplStyleManager()
+         loader.cacheDir = cacheDir
+
+         if not fromFile:
+            def fail( fname ):
+               raise Exception( "The file was loaded without the cache." )
+
+            loader._parseFile = fail
+            loader._runFile = fail
+
+         return loader.loadFile( fname )
+
+      style = loadFile( True )
+      self.assertEqual( 1, len( os.listdir( cacheDir ) ),
+               msg = "Failed to cache the loaded file." )
+
+      cached = loadFile( False )
+      self.assertEqual( "Cache Style", cached.name,
+               msg = "Invalid name of the cached style." )
+      self.assertEqual( style._getProperties(), cached._getProperties(),
+               msg = "Invalid values of the cached style." )
+
+      version = cached._versionKey()
+      cached.line.width = 5
+      self.assertNotEqual( version, cached._versionKey(),
+               msg = "Failed to track changes to a cached style." )
+
+      # Changing the time of the file checks the contents
+      stat = os.stat( fname )
+      os.utime( fname, ( stat.st_atime, stat.st_mtime + 10 ) )
+      cached = loadFile( False )
+      self.assertEqual( 3, cached.line.width,
+               msg = "Failed to use the cache of an unchanged file." )
+
+      # Changing the contents loads the file again
+      with open( fname, 'a' ) as fout:
+         fout.write( "style.line.width = 7\n" )
+
+      self.assertRaises( Exception, loadFile, False )
+      self.assertEqual( 7, loadFile( True ).line.width,
+               msg = "Failed to load a changed file." )
+      self.assertEqual( 7, loadFile( False ).line.width,
+               msg = "Failed to cache a changed file." )
+
+      # Entries of another format, library version or style are not used
+      entry = os.path.join( cacheDir, os.listdir( cacheDir )[0] )
+      with open( entry, 'rb' ) as fin:
+         formatVersion, version, key, state = pickle.load( fin )
+
+      def writeEntry( *record ):
+         with open( entry, 'wb' ) as fout:
+            pickle.dump( record, fout )
+
+      writeEntry( formatVersion + 1, version, key, state )
+      self.assertRaises( Exception, loadFile, False )
+      writeEntry( formatVersion, version + " old", key, state )
+      self.assertRaises( Exception, loadFile, False )
+
+      state[ 'properties' ][ 'line.bogus' ] = 1
+      writeEntry( formatVersion, version, key, state )
+      self.assertRaises( Exception, loadFile, False )
+      self.assertEqual( 7, loadFile( True ).line.width,
+               msg = "Failed to load a file with an invalid cache entry." )
+      self.assertEqual( 7, loadFile( False ).line.width,
+               msg = "Failed to replace an invalid cache entry." )
+
+      # No cache directory loads the file every time
+      self.assertEqual( None, S.MplStyleManager()._readCache( fname ),
+               msg = "Used the cache without a cache directory." )
+
+   #-----------------------------------------------------------------------
+   def testLazyLoad( self ):
+      """Test loading style files when they are used."""
+
+      mgr = S.MplStyleManager()
+      mgr.create( "Lazy Parent", { 'line.width' : 3 } )
+      mgr.create( "Lazy Child", { 'line.width' : 5 } )
+      outdir = self.outputFile( "lazy" )
+      mgr.save( outdir = outdir )
+
+      # A file that has to be run to know its style
+      with open( os.path.join( outdir, "Lazy_Run.mplstyle" ), 'w' ) as fout:
+         fout.write( "name = 'Lazy Run'\nstyle = MplStyle( name )\n" )
+
+      mgr = S.MplStyleManager()
+      loaded = []
+      loadFromFile = mgr._loadFromFile
+
+      def recordLoad( fname ):
+         style = loadFromFile( fname )
+         loaded.append( style.name )
+         return style
+
+      mgr._loadFromFile = recordLoad
+      mgr.load( outdir, lazy = True )
+
+      self.assertEqual( [ "Lazy Run" ], loaded,
+               msg = "Loaded the files of a lazy load." )
+      self.assertEqual( [ "Lazy Child", "Lazy Parent", "Lazy Run" ],
+                        mgr.getAll(),
+               msg = "Invalid names of a lazy load." )
+      self.assertEqual( True, mgr.exists( "Lazy Child" ),
+               msg = "Failed to find a style that is not loaded." )
+
+      style = mgr.create( "Lazy Style", parent = "Lazy Parent" )
+      self.assertEqual( [ "Lazy Run", "Lazy Parent" ], loaded,
+               msg = "Failed to load the parent of a new style." )
+      self.assertEqual( 3, style._getResolved().line.width,
+               msg = "Invalid value of a lazily loaded parent." )
+
+      fig = mpl.figure.Figure()
+      ax = fig.add_subplot( 111 )
+      line = ax.plot( [ 1, 2 ], [ 1, 2 ] )[0]
+      mgr.apply( line, "Lazy Child" )
+      self.assertEqual( 5, line.get_linewidth(),
+               msg = "Failed to apply a lazily loaded style." )
+      self.assertEqual( outdir, os.path.dirname( mgr._styles[
+                        "Lazy Child" ].filename ),
+               msg = "Invalid file of a lazily loaded style." )
+
+      # Loading a file again does not replace the lazily loaded style
+      mgr.load( outdir )
+      self.assertEqual( [ "Lazy Child", "Lazy Parent", "Lazy Run" ],
+                        sorted( loaded[ 3: ] ),
+               msg = "Invalid files loaded after a lazy load." )
+      self.assertEqual( [], mgr._pending.keys(),
+               msg = "Failed to load all of the styles." )
+
+      mgr = S.MplStyleManager()
+      mgr.load( outdir, lazy = True )
+      mgr.erase( "Lazy Child", delete = False )
+      self.assertEqual( None, mgr.find( "Lazy Child" ),
+               msg = "Failed to erase a style that is not loaded." )
+      self.assertEqual( "Lazy Parent", mgr[ "Lazy Parent" ].name,
+               msg = "Failed to get a lazily loaded style." )
+
+   #-----------------------------------------------------------------------
+   def testFontRegistries( self ):
+      """Test tracking elements whose hash changes when they are styled."""
+
+      mgr = S.MplStyleManager()
+      style = mgr.create( "Font Style", { 'text.font.size' : 12 } )
+
+      font = mpl.font_manager.FontProperties()
+      other = mpl.font_manager.FontProperties()
+      mgr.tag( [ font, other ], 'fontTag' )
+      self.assertEqual( 2, len( mgr._tags[ 'fontTag' ] ),
+               msg = "Failed to tag elements with the same values." )
+
+      mgr.apply( font, "Font Style" )
+      self.assertEqual( 12, font.get_size(),
+               msg = "Failed to style the font." )
+
+      style.text.font.size = 14
+      mgr.reapply()
+      self.assertEqual( 14, font.get_size(),
+               msg = "Failed to re-style the font." )
+
+      data = mgr._styles[ "Font Style" ]
+      self.assertEqual( 1, len( data.elements ),
+               msg = "Tracked a styled font more than once." )
+      self.assertEqual( style._versionKey(), data.elements[ font ],
+               msg = "Invalid version of the re-styled font." )
+
+      mgr.untag( font, 'fontTag' )
+      self.assertEqual( [ other ], mgr._tags[ 'fontTag' ].keys(),
+               msg = "Failed to untag a styled font." )
+
+   #-----------------------------------------------------------------------
+
@@ -131,4 +131,36 @@ class TestMplTickStyle( unittest.TestCase ):
                    msg = "Failed to throw on invalid element." )
 
    #-----------------------------------------------------------------------
+   def testApplyPlanToAll( self ):
+      """Test applying a plan to all of the ticks of an axis."""
+      fig = mpl.figure.Figure()
+      ax = mpl.axes.Axes( fig, [ 0.2, 0.2, 0.6, 0.6 ] )
+      ticks = ax.get_xaxis().get_major_ticks()
+
+      style = MplTickStyle(
+         pad = 0.1,
+         length = 15,
+         labels = { 'color' : '#FF0000', 'font' : { 'size' : 12.0 } },
+         marks = { 'color' : '#F0F000' },
+         secondaryMarks = { 'visible' : False },
+      )
+
+      MplTickStyle.applyPlanToAll( ticks, style.compile() )
+
+      for tick in ticks:
+         self.checkElement( "Apply tick", { 'pad' : 0.1 }, tick )
+         self.checkElement( "Apply mark", { 'color' : '#F0F000',
+                                            'markersize' : 15 },
+                            tick.tick1line )
+         self.checkElement( "Apply label", { 'color' : '#FF0000',
+                                             'size' : 12.0 },
+                            tick.label1 )
+         self.assertEqual( False, tick.tick2On,
+                           msg = "Failed to turn off the secondary marks." )
+
+      self.assertRaises( Exception, MplTickStyle.applyPlanToAll,
+                         ticks + [ 'invalid' ], style.compile(),
+                         msg = "Failed to throw on invalid element." )
+
+   #-----------------------------------------------------------------------
 
@@ -0,0 +1,244 @@
+#===========================================================================
+#
+# Copyright (c) 2014, California Institute of Technology.
+# U.S. Government Sponsorship under NASA Contract NAS7-03001 is
+# acknowledged.  All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# 1. Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#===========================================================================
+
+"Unit test for the batch module."
+
+__version__ = "$Revision: #1 $"
+#===========================================================================
+# Required imports.  Do not modify these.
+
+import unittest
+
+#===========================================================================
+# Place all imports after here.
+#
+import matplotlib as mpl
+mpl.use( "Agg" )
+
+import matplotlib.figure
+import json
+import os
+import os.path
+import mplStyle as S
+from mplStyle import batch
+
+#
+# Place all imports before here.
+#===========================================================================
+
+# The figures built by buildFigure in this process.
+FIGURES = []
+
+#---------------------------------------------------------------------------
+def buildFigure( title ):
+   fig = matplotlib.figure.Figure()
+   ax = fig.add_subplot( 111 )
+   ax.set_title( title )
+   ax.plot( [ 1, 2, 3 ], [ 3, 1, 2 ] )
+   FIGURES.append( fig )
+   return fig
+
+#---------------------------------------------------------------------------
+def buildError( title ):
+   raise Exception( "Unable to build %s" % title )
+
+#===========================================================================
+class TestBatch( unittest.TestCase ):
+   """Test the batch module."""
+
+   #-----------------------------------------------------------------------
+   @classmethod
+   def setUpClass( self ):
+      """This method is called before any tests are run."""
+      self.outputDir = os.path.join( "output", "batch" )
+      if not os.path.exists( self.outputDir ):
+         os.makedirs( self.outputDir )
+
+      mgr = S.MplStyleManager()
+      mgr.create( 'Batch Wide', { 'line.width' : 4 } )
+      mgr.create( 'Batch Red', { 'line.color' : 'red' } )
+      mgr.save( outdir = self.outputDir )
+
+   #-----------------------------------------------------------------------
+   @classmethod
+   def tearDownClass( self ):
+      """This method is called after all tests are run."""
+      S.mgr.clear()
+
+   #=======================================================================
+   # Add tests methods below.
+   # Any method whose name begins with 'test' will be run by the framework.
+
+   #-----------------------------------------------------------------------
+   def outputFile( self, fname ):
+      return os.path.join( self.outputDir, fname )
+
+   #-----------------------------------------------------------------------
+   def testRun( self ):
+      """Test running jobs with a pool of processes."""
+
+      jobs = []
+      for i in range( 5 ):
+         jobs.append( batch.BatchJob( buildFigure,
+                                      [ 'Batch Wide', 'Batch Red' ],
+                                      self.outputFile( 'run%d.png' % i ),
+                                      args = ( 'Plot %d' % i, ) ) )
+
+      jobs[3].build = buildError
+
+      report = batch.run( jobs, path = [ self.outputDir ], processes = 2,
+                          chunkSize = 2 )
+
+      self.assertEqual( range( 5 ), [ r.index for r in report.results ],
+                        msg = "Results are not in the order of the jobs." )
+      self.assertEqual( [ 3 ], [ r.index for r in report.failures() ],
+                        msg = "Failed to capture the error of a job." )
+      self.assertEqual( True, "Unable to build Plot 3" in
+                        report.failures()[0].error,
+                        msg = "Incorrect error for a failed job." )
+
+      for i in [ 0, 1, 2, 4 ]:
+         self.assertEqual( True, os.path.exists( jobs[i].output ),
+                           msg = "Failed to save figure %d." % i )
+
+      self.assertEqual( False, os.path.exists( jobs[3].output ),
+                        msg = "Saved the figure of a failed job." )
+
+      self.assertEqual( sorted( batch.PHASES ),
+                        sorted( report.phaseTimes().keys() ),
+                        msg = "Incorrect phase timings." )
+      self.assertEqual( True, report.figuresPerSec() > 0.0,
+                        msg = "Incorrect throughput." )
+      self.assertEqual( True, "4 figures" in str( report ),
+                        msg = "Incorrect report." )
+
+   #-----------------------------------------------------------------------
+   def testRunInProcess( self ):
+      """Test running jobs in this process."""
+
+      del FIGURES[:]
+      job = batch.BatchJob( 'test_batch:buildFigure', 'Batch Wide',
+                            self.outputFile( 'inprocess.png' ),
+                            kwargs = { 'title' : 'In Process' } )
+
+      report = batch.run( [ job ], path = [ self.outputDir ], processes = 0 )
+
+      self.assertEqual( [], report.failures(),
+                        msg = "Failed to run a job." )
+      self.assertEqual( 4, FIGURES[0].axes[0].lines[0].get_linewidth(),
+                        msg = "Failed to style the figure." )
+      self.assertEqual( True, os.path.exists( job.output ),
+                        msg = "Failed to save the figure." )
+
+      job = batch.BatchJob( 'buildFigure', 'Batch Wide', 'bad.png' )
+      self.assertRaises( Exception, job.getBuildFunc,
+                   msg = "Failed to throw on an invalid function name." )
+
+   #-----------------------------------------------------------------------
+   def testRunInProcessManager( self ):
+      """Test that running jobs in this process keeps the style manager."""
+
+      own = S.mgr.create( 'Batch Own', { 'line.width' : 2 } )
+      names = S.mgr.getAll()
+      backend = mpl.get_backend()
+
+      try:
+         sent = S.MplStyle( 'Batch Own', { 'line.width' : 6 } )
+
+         del FIGURES[:]
+         job = batch.BatchJob( 'test_batch:buildFigure',
+                               [ 'Batch Wide', 'Batch Own' ],
+                               self.outputFile( 'ownmgr.png' ),
+                               kwargs = { 'title' : 'Own Manager' } )
+
+         report = batch.run( [ job ], path = [ self.outputDir ],
+                             processes = 0, styles = [ sent ] )
+
+         self.assertEqual( [], report.failures(),
+                           msg = "Failed to run a job." )
+         self.assertEqual( 6, FIGURES[0].axes[0].lines[0].get_linewidth(),
+                           msg = "Failed to use the sent style." )
+         self.assertEqual( True, S.mgr[ 'Batch Own' ] is own,
+                           msg = "Replaced a style of the style manager." )
+         self.assertEqual( names, S.mgr.getAll(),
+                           msg = "Changed the styles of the style manager." )
+         self.assertEqual( backend, mpl.get_backend(),
+                           msg = "Changed the backend of this process." )
+      finally:
+         S.mgr.erase( 'Batch Own', delete = False )
+
+   #-----------------------------------------------------------------------
+   def testMain( self ):
+      """Test running jobs from the command line."""
+
+      jobFile = self.outputFile( 'jobs.json' )
+      with open( jobFile, 'w' ) as fout:
+         json.dump( [ { 'build' : 'test_batch:buildFigure',
+                        'styles' : [ 'Batch Red' ],
+                        'output' : self.outputFile( 'main.png' ),
+                        'args' : [ 'Main' ] } ], fout )
+
+      status = batch.main( [ jobFile, '--path', self.outputDir, '-j', '0' ] )
+      self.assertEqual( 0, status, msg = "Failed to run the jobs." )
+      self.assertEqual( True, os.path.exists( self.outputFile( 'main.png' ) ),
+                        msg = "Failed to save the figure." )
+
+      with open( jobFile, 'w' ) as fout:
+         json.dump( [ { 'build' : 'test_batch:buildError',
+                        'styles' : [ 'Batch Red' ],
+                        'output' : self.outputFile( 'error.png' ),
+                        'args' : [ 'Error' ] } ], fout )
+
+      status = batch.main( [ jobFile, '--path', self.outputDir, '-j', '0' ] )
+      self.assertEqual( 1, status, msg = "Failed to report a failed job." )
+
+   #-----------------------------------------------------------------------
+
+   def testSendStyles( self ):
+      """Test sending styles to the worker processes."""
+
+      parent = S.MplStyle( 'Batch Sent Parent', { 'line.width' : 5 } )
+      style = S.MplStyle( 'Batch Sent', { 'line.color' : 'blue' },
+                          parent = parent )
+
+      job = batch.BatchJob( buildFigure, 'Batch Sent',
+                            self.outputFile( 'sent.png' ), args = ( 'Sent', ) )
+
+      report = batch.run( [ job ], processes = 1, styles = [ style ] )
+      self.assertEqual( [], report.failures(),
+                        msg = "Failed to use a style sent to a worker." )
+
+   #-----------------------------------------------------------------------
+
@@ -0,0 +1,294 @@
+#===========================================================================
+#
+# Copyright (c) 2014, California Institute of Technology.
+# U.S. Government Sponsorship under NASA Contract NAS7-03001 is
+# acknowledged.  All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# 1. Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#===========================================================================
+
+
+""": An immutable, layered set of default values."""
+
+__version__ = "$Revision: #1 $"
+
+#===========================================================================
+
+from .SubStyle import SubStyle, _UNSET
+#===========================================================================
+
+__all__ = [ 'Defaults' ]
+
+# Marks a value that is not set in a layer.
+_MISSING = object()
+
+#===========================================================================
+class Defaults( object ):
+   """: An immutable set of default values made of layers.
+
+   Each Defaults is a layer of values on top of a parent Defaults.  A value
+   set in a layer overrides the value in its parents.  When a layer value
+   and the parent value are both dictionaries (or SubStyles), then they are
+   "merged" by using the parent value as the parent of a nested Defaults.
+   This gives the same values as 'lib.mergeDicts' without copying any
+   dictionary, so creating a layer only depends upon the number of values
+   it sets.
+
+   The values of a layer can be a dictionary, a SubStyle (using the values
+   from its 'kwargs' method), or another Defaults.  These are not copied, so
+   they must not be changed while the Defaults is in use.
+
+   Each value that is looked up is cached, so it is only resolved once.
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self, values = None, parent = None ):
+      """: Create a new Defaults object.
+
+      = INPUT VARIABLES
+      - values   The dictionary, SubStyle or Defaults with the values of this
+                 layer.
+      - parent   The Defaults with the values not set by this layer.
+      """
+      if values is None:
+         values = {}
+
+      self._values = values
+      self._parent = parent
+
+      # The resolved value of each key that has been looked up.
+      self._cache = {}
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def isMapping( value ):
+      """: Check if the value can be merged as a set of values.
+
+      = INPUT VARIABLES
+      - value    The value to check.
+
+      = RETURN VALUE
+      - Returns True if the value is a dictionary, SubStyle or Defaults.
+      """
+      return isinstance( value, ( dict, SubStyle, Defaults ) )
+
+   #-----------------------------------------------------------------------
+   def layer( self, values ):
+      """: Create a new layer of values on top of this one.
+
+      = INPUT VARIABLES
+      - values   The dictionary, SubStyle or Defaults with the values of the
+                 new layer.
+
+      = RETURN VALUE
+      - Returns a new Defaults whose parent is this Defaults.
+      """
+      return Defaults( values, self )
+
+   #-----------------------------------------------------------------------
+   def _localValues( self ):
+      """: Get the values set by this layer only.
+
+      = RETURN VALUE
+      - Returns a dictionary or Defaults with the values of this layer.
+      """
+      values = self._values
+
+      if isinstance( values, SubStyle ):
+         # These are the same values as returned by SubStyle.kwargs, but
+         # without copying any nested SubStyle.
+         local = {}
+         for key in values.propertyNames():
+            value = values._peek( key )
+            if value is _UNSET:
+               continue
+
+            if isinstance( value, SubStyle ) or \
+               ( value != getattr( values.__class__, key ).default ):
+               local[ key ] = value
+
+         values = local
+         self._values = values
+
+      return values
+
+   #-----------------------------------------------------------------------
+   def _resolve( self, key ):
+      """: Get the value of the key from this layer or its parents.
+
+      = RETURN VALUE
+      - Returns the value or _MISSING if the key is not set.
+      """
+      cache = self._cache
+      if key in cache:
+         return cache[ key ]
+
+      values = self._values
+      if isinstance( values, Defaults ):
+         value = values._resolve( key )
+      elif isinstance( values, dict ):
+         value = values.get( key, _MISSING )
+      else:
+         value = self._localValues().get( key, _MISSING )
+
+      if self._parent is not None:
+         if value is _MISSING:
+            # The parent caches the value for any other layers that share it
+            value = self._parent._resolve( key )
+
+         elif self.isMapping( value ):
+            # Merge with the parent value
+            other = self._parent._resolve( key )
+
+            if self.isMapping( other ):
+               if not isinstance( other, Defaults ):
+                  other = Defaults( other )
+
+               value = Defaults( value, other )
+
+      cache[ key ] = value
+      return value
+
+   #-----------------------------------------------------------------------
+   def get( self, key, default = None ):
+      """: Get the value of the key.
+
+      = INPUT VARIABLES
+      - key      The name of the value to get.
+      - default  The value to return if the key is not set.
+
+      = RETURN VALUE
+      - Returns the value of the key.  Merged dictionaries are returned as
+        a Defaults.
+      """
+      value = self._resolve( key )
+      if value is _MISSING:
+         return default
+
+      return value
+
+   #-----------------------------------------------------------------------
+   def __getitem__( self, key ):
+      """: Get the value of the key.
+
+      = ERROR CONDITIONS
+      - Will throw a KeyError if the key is not set.
+      """
+      value = self._resolve( key )
+      if value is _MISSING:
+         raise KeyError( key )
+
+      return value
+
+   #-----------------------------------------------------------------------
+   def __contains__( self, key ):
+      """: Check if the key is set.
+      """
+      return self._resolve( key ) is not _MISSING
+
+   #-----------------------------------------------------------------------
+   def keys( self ):
+      """: Get the names of all of the values set.
+
+      = RETURN VALUE
+      - Returns a list of the keys set by this layer and its parents.
+      """
+      result = []
+      layer = self
+      while layer is not None:
+         for key in layer._localValues().keys():
+            if key not in result:
+               result.append( key )
+
+         layer = layer._parent
+
+      return result
+
+   #-----------------------------------------------------------------------
+   def __iter__( self ):
+      """: Iterate over the keys.
+      """
+      return iter( self.keys() )
+
+   #-----------------------------------------------------------------------
+   def __len__( self ):
+      """: Get the number of keys.
+      """
+      return len( self.keys() )
+
+   #-----------------------------------------------------------------------
+   def items( self ):
+      """: Get the key-value pairs.
+      """
+      return [ ( key, self[ key ] ) for key in self.keys() ]
+
+   #-----------------------------------------------------------------------
+   def toDict( self ):
+      """: Get the values as a dictionary.
+
+      = RETURN VALUE
+      - Returns a new dictionary with the values of this Defaults.  Any
+        merged values are also converted into dictionaries.
+      """
+      result = {}
+
+      for key, value in self.items():
+         if isinstance( value, Defaults ):
+            value = value.toDict()
+
+         result[ key ] = value
+
+      return result
+
+   #-----------------------------------------------------------------------
+   def __eq__( self, other ):
+      """: Compare the values with a dictionary or another Defaults.
+      """
+      if isinstance( other, Defaults ):
+         other = other.toDict()
+
+      return self.toDict() == other
+
+   #-----------------------------------------------------------------------
+   def __ne__( self, other ):
+      """: Compare the values with a dictionary or another Defaults.
+      """
+      return not self.__eq__( other )
+
+   # The values of a Defaults are not hashable.
+   __hash__ = None
+
+   #-----------------------------------------------------------------------
+   def __repr__( self ):
+      """: Get a string representation of this instance.
+      """
+      return "Defaults(%r)" % ( self.toDict(), )
+
+   #-----------------------------------------------------------------------
+
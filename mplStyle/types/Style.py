@@ -38,6 +38,11 @@
 __version__ = "$Revision: #1 $"
 
 #===========================================================================
+
+import contextlib
+import itertools
+
+from .SubStyle import SubStyle
 #===========================================================================
 
 __all__ = [ 'Style' ]
@@ -90,6 +95,12 @@ class _StyleFactory( type ):
       # Return the newly created and initialized instance
       return instance
 
+#===========================================================================
+def _restoreStyle( cls, state, parents ):
+   """: Create a style from its pickled state (see Style.__reduce__).
+   """
+   return cls.fromState( state, parents )
+
 #===========================================================================
 class Style( object ):
    """: An object used to contain style information.
@@ -112,6 +123,11 @@ class Style( object ):
         This is a static method that is specific to the derived class.  This
         is what applies the derived style to an instance of the object type
         it was defined for.
+
+      * compile
+        The base Style class cannot know how the derived class applies its
+        properties, therefor the derived class needs to build any
+        pre-computed form of the style that it can apply repeatedly.
    """
 
    # Define a wrapper for how this class (and its derivatives) are created.
@@ -122,6 +138,27 @@ class Style( object ):
    # restrict setattr access after __init__ has completed.
    _completed_init = False
 
+   # Derived classes that report every change of their property values to
+   # '_changed' can set this to True.  This allows the resolved style to be
+   # cached until the style (or one of its parents) changes.  Any SubStyle
+   # stored in a Style will report its changes.
+   _trackChanges = False
+
+   # Every change of any Style is given the next number from this counter, so
+   # a version is never repeated.
+   _versionCounter = itertools.count( 1 )
+
+   # The number of cached (hits) and new (misses) resolved styles.
+   _resolveStats = { 'hits' : 0, 'misses' : 0 }
+
+   # When set to True, 'apply' will apply the resolved style once instead of
+   # applying each parent style and then this style.
+   _applyResolved = False
+
+   # The script file that the custom function was loaded from (if any).  This
+   # is sent in place of the function when the style is pickled.
+   _customFile = None
+
    #-----------------------------------------------------------------------
    def __init__( self, name, initialValues = {}, parent = None, custom = None ):
       """: Create a new Style object.
@@ -142,6 +179,11 @@ class Style( object ):
       # This cannot be changed after creating.
       self._name = name
 
+      # The version of the property values and any cached data that depend
+      # upon them.
+      self._version = next( Style._versionCounter )
+      self._cache = {}
+
       # All Styles can have a parent style for resolving values
       if isinstance( parent, Style ):
          parent = [ parent ]
@@ -155,6 +197,98 @@ class Style( object ):
       for key in initialValues:
          self.setValue( key, initialValues[ key ] )
 
+   #-----------------------------------------------------------------------
+   def __setattr__( self, name, value ):
+      """: Set the attribute value.
+
+      Changing the parent or custom function changes the version of this
+      style.  Any SubStyle that is stored will report its changes to this
+      style.
+
+      = INPUT VARIABLES
+      - name    The name of the attribute to set.
+      - value   The value to give the named attribute.
+      """
+      object.__setattr__( self, name, value )
+
+      if name == 'custom':
+         self.__dict__.pop( '_customFile', None )
+
+      if name in [ 'parent', 'custom' ]:
+         self._changed( name )
+      elif isinstance( value, SubStyle ):
+         value._addOwner( self, '' )
+
+   #-----------------------------------------------------------------------
+   def _changed( self, name ):
+      """: Record that a property of this style has changed.
+
+      = INPUT VARIABLES
+      - name   The name of the property that changed.  Nested property names
+               are concatenated together with '.'  Eg 'a.b.property'
+      """
+      object.__setattr__( self, '_version', next( Style._versionCounter ) )
+
+   #-----------------------------------------------------------------------
+   def _versionKey( self ):
+      """: Get a key that changes whenever this style or a parent changes.
+
+      = RETURN VALUE
+      - Returns the version key, or None if changes are not tracked for this
+        style or one of its parents.
+      """
+      if not self._trackChanges:
+         return None
+
+      key = self._version
+
+      if self.parent:
+         parentKeys = [ p._versionKey() for p in self.parent ]
+         if None in parentKeys:
+            return None
+
+         key = ( key, tuple( parentKeys ) )
+
+      return key
+
+   #-----------------------------------------------------------------------
+   def _getResolved( self ):
+      """: Get this style resolved with its parents.
+
+      This is the same as 'resolve( None )', except that the result is cached
+      (see '_trackChanges') and shared.  The result must not be modified.
+
+      = RETURN VALUE
+      - Returns a style with all properties resolved to a value
+        (where possible).
+      """
+      key = self._versionKey()
+
+      if key is None:
+         return self.resolve( None )
+
+      cached = self._cache.get( 'resolve' )
+      if cached and ( cached[0] == key ):
+         Style._resolveStats[ 'hits' ] += 1
+         return cached[1]
+
+      Style._resolveStats[ 'misses' ] += 1
+
+      if self.parent:
+         newStyle = self.parent[0]._getResolved().copy( None )
+
+         for p in self.parent[1:]:
+            newStyle.update( p._getResolved() )
+
+         newStyle.update( self )
+      else:
+         newStyle = self.copy( None )
+         newStyle.parent = None
+         newStyle.custom = None
+
+      self._cache[ 'resolve' ] = ( key, newStyle )
+      return newStyle
+
    #-----------------------------------------------------------------------
    def _getParentOfProperty( self, property ):
       """: Get the parent of the specified property.
@@ -171,21 +305,19 @@ class Style( object ):
       objectNames = property.split( '.' )
 
       currentObject = self
-      currentName = self.__class__.__name__
-      currentPath = "%s" % currentName
-
-      nextName = objectNames.pop( 0 )
-
-      while len( objectNames ):
-         if hasattr( currentObject, nextName ):
-            currentObject = getattr( currentObject, nextName )
-            currentName = nextName
-            currentPath = '%s.%s' % (currentPath, currentName)
-            nextName = objectNames.pop( 0 )
-         else:
+
+      for i in range( len( objectNames ) - 1 ):
+         # Get each object once, since getting an unset SubStyle makes a new
+         # instance of it.
+         nextObject = getattr( currentObject, objectNames[i], None )
+
+         if nextObject is None:
+            currentPath = '.'.join( [ self.__class__.__name__ ] +
+                                    objectNames[ :i ] )
+
             msg  = "Invalid Property '%s'\n" % property
             msg += "%s does not have a property named '%s'.  " % \
-                   (currentPath, nextName)
+                   (currentPath, objectNames[i])
             msg += "Valid values are:\n"
 
             propertyList = dir( currentObject )
@@ -198,7 +330,9 @@ class Style( object ):
 
             raise Exception( msg )
 
-      return currentObject, nextName
+         currentObject = nextObject
+
+      return currentObject, objectNames[-1]
 
    #-----------------------------------------------------------------------
    def getResolvedValue( self, property ):
@@ -303,6 +437,7 @@ class Style( object ):
 
       # set the value
       setattr( parent, itemName, value )
+      self._changed( property )
 
    #-----------------------------------------------------------------------
    def resolve( self, name, style = None ):
@@ -316,6 +451,11 @@ class Style( object ):
       = NOTE
       This will not take into account any custom defined formatter functions.
 
+      = NOTE
+      If changes are tracked for this style (see '_trackChanges'), then the
+      resolved values are cached until this style or one of its parents
+      changes, so only the copy is made.
+
       = INPUT VARIABLES
       - name     The name to give to the new resolved style.
       - style    If specified, this is a style whose property values
@@ -329,7 +469,9 @@ class Style( object ):
       - Returns a single style with all properties resolved to a value
         (where possible).
       """
-      if self.parent:
+      if self._versionKey() is not None:
+         newStyle = self._getResolved().copy( name )
+      elif self.parent:
          newStyle = self.parent[0].resolve( name )
 
          for p in self.parent[1:]:
@@ -380,7 +522,72 @@ class Style( object ):
       pass
 
    #-----------------------------------------------------------------------
-   def apply( self, obj, recursive = True, filter = None, postProcess = None ):
+   def compile( self ):
+      """: Compile the properties set by this style.
+
+      The compiled form of a style holds the final values this style will
+      apply, so it can be applied repeatedly without resolving them again.
+      This does not include the parent styles.  To compile every property
+      that applies to an element, compile the result of 'resolve'.
+
+      = RETURN VALUE
+      - Returns the compiled form of this style, or None if this style type
+        cannot be compiled.
+      """
+      # Nothing to do here -- Specialize in derived class.
+      return None
+
+   #-----------------------------------------------------------------------
+   def getState( self ):
+      """: Get a compact form of this style that can be sent elsewhere.
+
+      The state holds only the property values that are set, the names of
+      the parent styles, and the custom function.  If the custom function
+      was loaded from a script, then the name of the script is used in its
+      place.  See 'fromState'.
+
+      Pickling a style pickles its state and its parent styles, so styles
+      can be sent to other processes (eg. a multiprocessing pool).
+
+      = RETURN VALUE
+      - Returns a dictionary with the 'name', 'properties', 'parents' and
+        'custom' of this style.
+      """
+      parents = []
+      if self.parent:
+         parents = [ p.name for p in self.parent ]
+
+      custom = self._customFile
+      if custom is None:
+         custom = self.custom
+
+      return { 'name' : self.name,
+               'properties' : self._getProperties(),
+               'parents' : parents,
+               'custom' : custom,
+             }
+
+   #-----------------------------------------------------------------------
+   def _getProperties( self ):
+      """: Get the property values that are set in this style.
+
+      = RETURN VALUE
+      - Returns a dictionary of the property values.  Nested property names
+        are concatenated together with '.'  Eg 'a.b.property'
+      """
+      # Nothing to do here -- Specialize in derived class.
+      return {}
+
+   #-----------------------------------------------------------------------
+   def __reduce__( self ):
+      """: Pickle this style as its state and parent styles.
+      """
+      return ( _restoreStyle, ( self.__class__, self.getState(),
+                                self.parent ) )
+
+   #-----------------------------------------------------------------------
+   def apply( self, obj, recursive = True, filter = None, postProcess = None,
+              resolved = None ):
       """Resolve this style and apply its values to the given object.
 
       = INPUT VARIABLES
@@ -398,6 +605,16 @@ class Style( object ):
                      element.  It is passed the element as a parameter.  This
                      will be called recursively on child elements (where
                      applicable).
+      - resolved     If True, then the style will be resolved with its parents
+                     and applied once, so each property is only set to its
+                     final value.  Otherwise each parent style is applied
+                     before this style.  If None, then '_applyResolved' is
+                     used.
+
+      = NOTE
+      When applying the resolved style, the custom functions of the parent
+      styles and this style are called after all of the values have been
+      applied.  They are still called in order from parent to child.
       """
       # Lets always define it
       if filter is None:
@@ -406,11 +623,25 @@ class Style( object ):
       if postProcess is None:
          postProcess = lambda x: None
 
+      if resolved is None:
+         resolved = self._applyResolved
+
+      if resolved:
+         # apply the resolved values once
+         self._getResolved()._applyStyle( obj, filter = filter,
+                                          postProcess = postProcess )
+
+         # apply any custom functions
+         for custom in self._customChain():
+            custom( obj )
+
+         return
+
       # Apply the parent styles first
       if self.parent:
          for p in self.parent:
             # No need to post-process yet, as we are not done processing.
-            p.apply( obj, recursive, filter )
+            p.apply( obj, recursive, filter, resolved = False )
 
       # apply this style
       self._applyStyle( obj, filter = filter, 
@@ -420,6 +651,36 @@ class Style( object ):
       if self.custom:
          self.custom( obj )
 
+   #-----------------------------------------------------------------------
+   def _customChain( self, visited = None ):
+      """: Get the custom functions of this style and its parents.
+
+      = INPUT VARIABLES
+      - visited   The styles that have already been checked.  A style that
+                  is a parent more than once only has its function used once.
+
+      = RETURN VALUE
+      - Returns a list of the custom functions in order from the furthest
+        parent to this style.
+      """
+      if visited is None:
+         visited = []
+
+      if self in visited:
+         return []
+
+      visited.append( self )
+
+      result = []
+      if self.parent:
+         for p in self.parent:
+            result.extend( p._customChain( visited ) )
+
+      if self.custom:
+         result.append( self.custom )
+
+      return result
+
    #-----------------------------------------------------------------------
    def _applyStyle( self, obj, filter, postProcess ):
       """: Apply the style to the object.
@@ -446,6 +707,64 @@ class Style( object ):
    #-----------------------------------------------------------------------
    # Static Functions
 
+   #-----------------------------------------------------------------------
+   @classmethod
+   def fromState( cls, state, parents = None ):
+      """: Create a style from the state of a style.
+
+      = ERROR CONDITIONS
+      - Will throw an exception if the parent styles do not match the parent
+        names of the state.
+
+      = INPUT VARIABLES
+      - state     The state of a style (see 'getState').
+      - parents   The list of parent styles, in the order of the parent
+                  names of the state.
+
+      = RETURN VALUE
+      - Returns the new style.
+      """
+      if parents is None:
+         parents = []
+
+      if [ p.name for p in parents ] != list( state[ 'parents' ] ):
+         msg = "Unable to create the style '%s'.  The parent styles %s do " \
+               "not match the parents %s of the style." % \
+               ( state[ 'name' ], [ p.name for p in parents ],
+                 list( state[ 'parents' ] ) )
+         raise Exception( msg )
+
+      custom = state[ 'custom' ]
+      customFile = None
+      if isinstance( custom, basestring ):
+         customFile = custom
+         custom = cls._loadCustom( customFile, state[ 'name' ] )
+
+      style = cls( state[ 'name' ], state[ 'properties' ],
+                   list( parents ) or None, custom )
+
+      if customFile is not None:
+         style._customFile = customFile
+
+      return style
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def _loadCustom( fname, name ):
+      """: Load the custom function of a style from a script.
+
+      = INPUT VARIABLES
+      - fname   The name of the script file.
+      - name    The name of the style.
+
+      = RETURN VALUE
+      - Returns the custom function.
+      """
+      # Specialize in derived class.
+      msg = "Unable to load the custom script '%s' of the style '%s'.  " \
+            "This style type has no custom scripts." % ( fname, name )
+      raise Exception( msg )
+
    #-----------------------------------------------------------------------
    @classmethod
    def resolveStyles( cls, name, styles ):
@@ -466,10 +785,69 @@ class Style( object ):
 
       for s in styles:
          if s:
-            newStyle.update( s.resolve(None) )
+            newStyle.update( s._getResolved() )
 
       return newStyle
 
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def resolveCacheStats( reset = False ):
+      """: Get the number of resolved styles that were cached or created.
+
+      = INPUT VARIABLES
+      - reset   If True, then the counts will be set back to zero.
+
+      = RETURN VALUE
+      - Returns a dictionary with the number of cached 'hits' and 'misses'.
+      """
+      result = dict( Style._resolveStats )
+
+      if reset:
+         Style._resolveStats[ 'hits' ] = 0
+         Style._resolveStats[ 'misses' ] = 0
+
+      return result
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def beginBatch():
+      """: Start a batch of applies.
+
+      Any work that is needed after each apply (such as redrawing the
+      elements) is put off until the batch ends, so that it is only done
+      once.  Batches can be nested, and the work is done when the outer
+      batch ends.  Each call must be matched by a call to 'endBatch'.
+      """
+      # Nothing to do here -- Specialize in derived class.
+      pass
+
+   #-----------------------------------------------------------------------
+   @staticmethod
+   def endBatch():
+      """: End a batch of applies started by 'beginBatch'.
+      """
+      # Nothing to do here -- Specialize in derived class.
+      pass
+
+   #-----------------------------------------------------------------------
+   @classmethod
+   @contextlib.contextmanager
+   def batch( cls ):
+      """: Batch the applies made in a 'with' statement.
+
+      Eg.
+         with MplStyle.batch():
+            style.apply( fig1 )
+            style.apply( fig2 )
+
+      See beginBatch.
+      """
+      cls.beginBatch()
+      try:
+         yield
+      finally:
+         cls.endBatch()
+
    #-----------------------------------------------------------------------
    @staticmethod
    def canApply( obj ):
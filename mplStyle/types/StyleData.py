@@ -39,6 +39,7 @@ __version__ = "$Revision: #1 $"
 
 #===========================================================================
 from .Data import Data
+from .WeakIdDict import WeakIdDict
 #===========================================================================
 
 __all__ = [ 'StyleData' ]
@@ -57,9 +58,13 @@ class StyleData( Data ):
       - style     A style instance.
       - filename  The path and name of the file containing the style.  None if
                   not set.
-      - elements  A list of elements that are using the style.
+      - elements  A list of elements that are using the style.  These are
+                  stored in a WeakIdDict that maps each element to
+                  the version key of the style when it was applied to the
+                  element (see Style._versionKey), so deleted elements are
+                  removed.
       """
-      elements = elements if elements is not None else []
+      elements = WeakIdDict.fromkeys( elements or [] )
       Data.__init__( self, style = style,
                            filename = filename,
                            elements = elements )
@@ -38,19 +38,28 @@
 __version__ = "$Revision: #1 $"
 
 #===========================================================================
+import contextlib
 import logging
-import weakref
 import os
 import os.path
 import glob
+import hashlib
+import tempfile
+import cPickle
 from .Style import Style
 from .StyleData import StyleData
+from .WeakIdDict import WeakIdDict
 from .lib import stylePath, cleanupFilename
 #===========================================================================
 
 __all__ = [ 'StyleManager' ]
 
 DEFAULT_ENVVAR = "$STYLEPATH"
+DEFAULT_CACHE_ENVVAR = "$STYLECACHE"
+
+# The version of the entries of the style file cache.  Change this whenever
+# the contents of an entry change, so that older entries are not used.
+CACHE_FORMAT_VERSION = 2
 
 # The prefix will be added later
 ELEMENT_TAG_PROPERTY = "_mpl_style_%s_tag"
@@ -108,9 +117,28 @@ class StyleManager( object ):
       #  Value: StyleData
       self._styles = {}
 
-      # This is a dictionary mapping tags to elements
+      # The style files found by a lazy 'load' that have not been loaded yet.
+      # A file is loaded the first time its style is used.
+      #  Key: Name
+      #  Value: The path of the file that creates the style.
+      self._pending = {}
+
+      # This is a dictionary mapping tags to a WeakIdDict of the elements with
+      # that tag.  Elements are removed when they are deleted.
       self._tags = {}
 
+      # The directory that loaded style files are cached in, so that they are
+      # only loaded again when they change (eg. '~/.matplotlib/styles/cache').
+      # If this is None, then '$STYLECACHE' is used.  If that is not set
+      # either, then style files are not cached.
+      self.cacheDir = None
+
+      # The styles merged by 'applyMany', so that they are only resolved and
+      # compiled again when one of the styles changes.
+      #  Key: A tuple of the names of the merged styles.
+      #  Value: A tuple of the version keys of the styles and the merged style.
+      self._merged = {}
+
    #-----------------------------------------------------------------------
    def loadFile( self, fname, ignoreIfExists = False ):
       """: Load the specified style file.
@@ -130,6 +158,10 @@ class StyleManager( object ):
       # call the implementation specific "load" function
       style = self._loadFromFile( fname )
 
+      # A style found by a lazy load is loaded first, so that the same file
+      # is used as when all of the styles are loaded at once.
+      self._loadPending( style.name )
+
       if not ( self.exists( style.name ) and ignoreIfExists ):
          # Add the style to the manager
          self.add( style )
@@ -141,7 +173,7 @@ class StyleManager( object ):
       return style
 
    #-----------------------------------------------------------------------
-   def load( self, path = None ):
+   def load( self, path = None, lazy = False ):
       """: Load all the styles available.
 
       This will load all styles found in the path as determined by
@@ -149,9 +181,16 @@ class StyleManager( object ):
       be '$STYLEPATH'.  If that too is not specified, then it will default
       to be [ '.', '~/.matplotlib/styles' ]
 
+      If 'lazy' is True, then only the name of the style in each file is
+      read.  The file is loaded the first time that the style is needed
+      (eg. by 'find', 'apply' or 'create' with the style as a parent).  Files
+      whose style name can not be read without loading them are loaded now.
+
       = INPUT VARIABLES
       - path   If specified, then this path will be used to search for
                style files.
+      - lazy   If True, then the style files are not loaded until their
+               styles are used.
       """
       # Get the directories to search
       dirs = self._searchPath( path )
@@ -160,15 +199,27 @@ class StyleManager( object ):
          if os.path.exists( d ):
             files = glob.glob( os.path.join( d, '*.%s' % (self.extension) ) )
             for f in files:
-               if os.path.isfile( f ):
-                  self.loadFile( f, ignoreIfExists = True )
+               if not os.path.isfile( f ):
+                  continue
+
+               if lazy:
+                  name = self._readStyleName( f )
+                  if name is not None:
+                     if not self.exists( name ):
+                        self._pending[ name ] = f
+
+                     continue
+
+               self.loadFile( f, ignoreIfExists = True )
 
    #-----------------------------------------------------------------------
    def save( self, outdir = '~/.matplotlib/styles', overwrite = True ):
       """: Save the styles to persistent file.
 
       If a style was not loaded from a file, then it will be written to
-      a file placed in the directory specified by 'outdir'.
+      a file placed in the directory specified by 'outdir'.  The styles that
+      a lazy 'load' has not loaded yet are not written, since their files
+      have not changed.
 
       = INPUT VARIABLES
       - outdir      The directory to write styles to that have not yet
@@ -235,16 +286,17 @@ class StyleManager( object ):
       if isinstance( name, Style ):
          name = name.name
 
-      return name in self._styles
+      return ( name in self._styles ) or ( name in self._pending )
 
    #-----------------------------------------------------------------------
    def getAll( self ):
       """: Get a list of the loaded styles.
 
       = RETURN VALUE
-      - This will return a list of the names of the loaded styles.
+      - This will return a list of the names of the loaded styles.  This
+        includes the styles that a lazy 'load' has not loaded yet.
       """
-      names = self._styles.keys()
+      names = self._styles.keys() + self._pending.keys()
       names.sort()
       return names
 
@@ -280,13 +332,13 @@ class StyleManager( object ):
                # we were given a style not in the manager, so add it
                self.add( styleName )
 
-            newStyle.update( styleName.resolve(None) )
+            newStyle.update( styleName._getResolved() )
          else:
             # we have the name of a style
             s = self.find( styleName )
 
             if s:
-               newStyle.update( s.resolve(None) )
+               newStyle.update( s._getResolved() )
             elif not ignoreNotFound:
                msg = "Could not resolve the style named '%s'.  There is no " \
                      "loaded style with that name.\nLoaded Styles:\n" \
@@ -301,7 +353,8 @@ class StyleManager( object ):
       return newStyle
 
    #-----------------------------------------------------------------------
-   def apply( self, element, style, tag = None, recurse = True ):
+   def apply( self, element, style, tag = None, recurse = True,
+              resolved = None ):
       """: Apply a style or list of styles to an element.
 
       Will apply a style or list of styles to the specified element.  If a
@@ -321,6 +374,9 @@ class StyleManager( object ):
       - recurse   If True and the element has sub-elements that can be handled
                   by the styles, then those sub-elements will also have the
                   specified style(s) applied.
+      - resolved  If True, then each style is resolved with its parents and
+                  applied once.  If None, then the default of each style
+                  is used.  See Style.apply.
       """
       # Make sure we have lists.  Can't use iterable() for elements
       # because of the way the test cases are set up.
@@ -330,106 +386,303 @@ class StyleManager( object ):
       if element is None and tag:
          # Apply to all elements for the given tag
          if tag in self._tags:
-            element = [ ref() for ref in self._tags[ tag ] ]
+            element = list( self._tags[ tag ] )
 
       if not ( isinstance( element, list ) or isinstance( element, tuple ) ):
          element = [ element ]
 
-      # Determine the actual styles to use
-      styleList = []
-      for name in style:
-         s = None
+      # Redraw the elements once, after all of the styles are applied
+      with self.batch():
+         # Determine the actual styles to use
+         styleList = []
+         for name in style:
+            s = None
+
+            if isinstance( name, Style ):
+               if name.name:
+                  if not self.exists( name.name ):
+                     # we were given a style not in the manager, so add it
+                     self.add( name )
+               else:
+                  s = name
 
-         if isinstance( name, Style ):
-            if name.name:
-               if not self.exists( name.name ):
-                  # we were given a style not in the manager, so add it
-                  self.add( name )
-            else:
-               s = name
+               # we only want the name of the style
+               name = name.name
+
+            #FUTURE: resolve the styles as much as possible before applying
+            #        them.
+            def filterFunc( e ):
+               if tag:
+                  return bool( tag in self.getTags( e ) ), recurse
+               else:
+                  return True, recurse
+
+            if s:
+               for e in element:
+                  s.apply( e, recursive = recurse, filter = filterFunc,
+                           resolved = resolved )
+
+            elif self.exists( name ):
+               s = self._getStyleData( name )
+
+               def postApply( e ):
+                  # Save the list of styles to the element
+                  self.setElementStyles( e, styleList )
 
-            # we only want the name of the style
-            name = name.name
+                  # Add a reference to the element in the style data, with the
+                  # version of the style that was applied.
+                  s.elements[ e ] = s.style._versionKey()
+
+               for e in element:
+                  s.style.apply( e, recursive = recurse, filter = filterFunc,
+                                 postProcess = postApply, resolved = resolved )
 
-         #FUTURE: resolve the styles as much as possible before applying them.
-         def filterFunc( e ):
-            if tag:
-               return bool( tag in self.getTags( e ) ), recurse
             else:
-               return True, recurse
+               msg = "Unable to apply the style '%s' to the element %s.  " \
+                     "No style with that name could be found." \
+                     % (name, element)
+               raise Exception( msg )
 
-         if s:
-            for e in element:
-               s.apply( e, recursive = recurse, filter = filterFunc )
+            styleList.append( name )
 
-         elif self.exists( name ):
-            s = self._styles[ name ]
+   #-----------------------------------------------------------------------
+   def applyMany( self, assignments, recurse = True ):
+      """: Apply many styles to many elements at once.
+
+      Each assignment is the same as a call to 'apply'.  However, all of the
+      styles that consecutive assignments apply to the same element (or list
+      of elements) with the same tag are merged into a single style, and
+      each element is styled with it once.  So layering a theme, a section
+      style and a series style onto a figure only styles the figure once,
+      instead of once for each style.
+
+      Eg.
+         mgr.applyMany( [ ( fig, 'Theme' ),
+                          ( fig, [ 'Section', 'Series' ] ),
+                          ( fig, 'Highlight', 'important' ) ] )
+
+      = NOTE
+      The merged styles are always resolved (see Style.apply).  The custom
+      functions of each style are called in order after all of the merged
+      styles have been applied.
+
+      = ERROR CONDITIONS
+      - Will throw an exception if a named style does not exist.
+
+      = INPUT VARIABLES
+      - assignments  A list of tuples of '( element, style )' or
+                     '( element, style, tag )'.  See 'apply'.  The styles
+                     that an element is tracked with (see 'reapply') are the
+                     styles of the assignments that were merged.
+      - recurse      If True and the elements have sub-elements that can be
+                     handled by the styles, then those sub-elements will also
+                     have the styles applied.
+      """
+      # Merge the styles of consecutive assignments to the same elements
+      groups = []
+      for assignment in assignments:
+         element, style = assignment[:2]
+         tag = None
+         if len( assignment ) > 2:
+            tag = assignment[2]
+
+         if not iterable( style, excludeStrings=True ):
+            style = [ style ]
+
+         if groups and ( groups[-1][0] is element ) and \
+            ( groups[-1][2] == tag ):
+            groups[-1][1].extend( style )
+         else:
+            groups.append( ( element, list( style ), tag ) )
+
+      with self.batch():
+         for element, style, tag in groups:
+            self._applyMerged( element, style, tag, recurse )
+
+   #-----------------------------------------------------------------------
+   def _applyMerged( self, element, style, tag, recurse ):
+      """: Merge a list of styles and apply them to an element once.
+
+      = INPUT VARIABLES
+      - element   The object or list of objects to apply the styles to.
+      - style     A list of Style instances or names of managed styles.
+      - tag       The tag of the elements to apply to (see 'apply').
+      - recurse   If True, then the styles are also applied to sub-elements.
+      """
+      if element is None and tag:
+         # Apply to all elements for the given tag
+         element = list( self._tags.get( tag, [] ) )
 
-            def postApply( e ):
-               # Add a reference to the element in the style data
-               ref = weakref.ref( e )
-               if ref not in s.elements:
-                  s.elements.append( ref )
+      if not ( isinstance( element, list ) or isinstance( element, tuple ) ):
+         element = [ element ]
+
+      # Determine the actual styles to use.  Only the managed styles are
+      # tracked with the elements.
+      styles = []
+      styleList = []
+      for name in style:
+         if isinstance( name, Style ):
+            s = name
+            if s.name:
+               if not self.exists( s.name ):
+                  # we were given a style not in the manager, so add it
+                  self.add( s )
 
-               # Save the list of styles to the element
-               self.setElementStyles( e, styleList )
+               styleList.append( s.name )
 
-            for e in element:
-               s.style.apply( e, recursive = recurse, filter = filterFunc,
-                              postProcess = postApply )
+         elif self.exists( name ):
+            s = self._getStyleData( name ).style
+            styleList.append( name )
 
          else:
             msg = "Unable to apply the style '%s' to the element %s.  " \
                   "No style with that name could be found." % (name, element)
             raise Exception( msg )
 
-         styleList.append( name )
+         styles.append( s )
+
+      merged = self._mergeStyles( styles )
+
+      def filterFunc( e ):
+         if tag:
+            return bool( tag in self.getTags( e ) ), recurse
+         else:
+            return True, recurse
+
+      def postApply( e ):
+         # Save the list of styles to the element
+         self.setElementStyles( e, styleList )
+
+         # Add a reference to the element in the data of each style, with
+         # the version of the style that was applied.
+         for name in styleList:
+            data = self._styles[ name ]
+            data.elements[ e ] = data.style._versionKey()
+
+      for e in element:
+         merged.apply( e, recursive = recurse, filter = filterFunc,
+                       postProcess = postApply, resolved = True )
+
+         # apply any custom functions
+         for s in styles:
+            for custom in s._customChain():
+               custom( e )
 
    #-----------------------------------------------------------------------
-   def reapply( self ):
+   def _mergeStyles( self, styles ):
+      """: Resolve a list of styles into a single style.
+
+      The merged style is cached and only created again when one of the
+      styles has changed.
+
+      = INPUT VARIABLES
+      - styles   A list of Style instances.
+
+      = RETURN VALUE
+      - Returns an unnamed style without a parent or custom function, that
+        is the result of resolving all of the styles in order.
+      """
+      names = tuple( [ s.name for s in styles ] )
+      keys = tuple( [ s._versionKey() for s in styles ] )
+
+      # Styles without a name or that do not track their changes can not be
+      # cached.
+      cache = ( None not in names ) and ( None not in keys )
+
+      if cache:
+         cached = self._merged.get( names )
+         if cached and ( cached[0] == keys ):
+            return cached[1]
+
+      merged = self.styleClass.resolveStyles( None, styles )
+
+      if cache:
+         self._merged[ names ] = ( keys, merged )
+
+      return merged
+
+   #-----------------------------------------------------------------------
+   def reapply( self, names = None, force = False ):
       """: Re-Apply styles to the elements they were applied to.
 
       Whenever a style is applied to an element it is tracked.  Calling
       'reapply' will reapply the styles set to the tracked elements.
+
+      Only the elements that use a style that has changed since it was
+      applied to them are updated.  A style has changed if any of its
+      properties or any of its parents has changed (see Style._versionKey).
+      Styles that do not track their changes are always re-applied.
+
+      = INPUT VARIABLES
+      - names   The name (or list of names) of the styles to re-apply.  If
+                None, then all styles are checked.
+      - force   If True, then the styles are re-applied even if they have not
+                changed.
       """
-      # First build up a list of elements to update
+      if names is None:
+         names = self._styles.keys()
+      elif not iterable( names, excludeStrings = True ):
+         names = [ names ]
+
+      # First build up a list of elements to update.  Deleted elements have
+      # already been removed from the elements of each style.
       elements = []
+      found = set()
 
-      for name in self._styles:
-         style = self._styles[ name ]
-
-         updatedElementList = []
-         for ref in style.elements:
-            # Check to see if the reference is still valid
-            e = ref()
-            if e is not None:
-               # Then we will keep the reference
-               updatedElementList.append( ref )
-
-               # Add the element to the list (if it is not already there)
-               if e not in elements:
-                  elements.append( e )
-
-         # Update the element list with references that are still valid
-         style.elements = updatedElementList
-
-      # Iterate over the elements and update them
-      for e in elements:
-         elementStyles = self.getElementStyles( e )
-
-         styles = []
-         # check for invalid styles
-         for name in elementStyles:
-            if self.exists( name ):
-               styles.append( name )
-            else:
-               msg = "MplStyle: Unable to re-apply the style '%s' to the " \
-                     "element %s.  No style with that name could be found." \
-                     % (name, e)
-               logging.warning( msg )
+      for name in names:
+         style = self._styles.get( name )
+         if style is None:
+            continue
 
-         self.apply( e, styles, recurse = False )
+         key = style.style._versionKey()
+
+         for e, appliedKey in style.elements.items():
+            if ( key is not None ) and ( appliedKey == key ) and not force:
+               continue
+
+            # Add the element to the list (if it is not already there)
+            # Use the id, since some elements (eg. a FontProperties) are
+            # equal to other elements with the same values.
+            if id( e ) not in found:
+               found.add( id( e ) )
+               elements.append( e )
+
+      # Iterate over the elements and update them, redrawing them once
+      with self.batch():
+         for e in elements:
+            elementStyles = self.getElementStyles( e )
+
+            styles = []
+            # check for invalid styles
+            for name in elementStyles:
+               if self.exists( name ):
+                  styles.append( name )
+               else:
+                  msg = "MplStyle: Unable to re-apply the style '%s' to " \
+                        "the element %s.  No style with that name could be " \
+                        "found." % (name, e)
+                  logging.warning( msg )
 
+            self.apply( e, styles, recurse = False )
+
+   #-----------------------------------------------------------------------
+   @contextlib.contextmanager
+   def batch( self ):
+      """: Batch the applies made in a 'with' statement.
+
+      The elements that styles are applied to in the 'with' statement are
+      redrawn (where applicable) once at the end, instead of after each apply.
+      'apply' and 'reapply' always batch their applies.
+
+      Eg.
+         with mgr.batch():
+            mgr.apply( fig1, 'Dark' )
+            mgr.apply( fig2, 'Dark' )
+
+      See Style.beginBatch.
+      """
+      with self.styleClass.batch():
+         yield
 
    #-----------------------------------------------------------------------
    def add( self, style, replace = False ):
@@ -451,6 +704,7 @@ class StyleManager( object ):
                "A style with that name already exists." % (style.name,)
          raise Exception( msg )
 
+      self._pending.pop( style.name, None )
       self._styles[ style.name ] = StyleData( style )
 
    #-----------------------------------------------------------------------
@@ -465,9 +719,20 @@ class StyleManager( object ):
       if isinstance( name, Style ):
          name = name.name
 
-      if self.exists( name ):
+      if name in self._pending:
+         # The style was never loaded
+         fname = self._pending.pop( name )
+
+         if delete:
+            self._deleteStyleFile( fname )
+      elif self.exists( name ):
          s = self._styles.pop( name )
 
+         # Forget the merged styles that used the removed style
+         for names in self._merged.keys():
+            if name in names:
+               del self._merged[ names ]
+
          if delete and s.filename:
             self._deleteStyleFile( s.filename )
       else:
@@ -681,11 +946,9 @@ class StyleManager( object ):
 
                # Add the element to the tag map
                if lbl not in self._tags:
-                  self._tags[ lbl ] = []
+                  self._tags[ lbl ] = WeakIdDict()
 
-               ref = weakref.ref( e )
-               if ref not in self._tags[ lbl ]:
-                  self._tags[ lbl ].append( ref )
+               self._tags[ lbl ][ e ] = None
 
    #-----------------------------------------------------------------------
    def untag( self, element, label ):
@@ -718,9 +981,7 @@ class StyleManager( object ):
                tagAttr.remove( lbl )
 
             if lbl in self._tags:
-               ref = weakref.ref( e )
-               while ref in self._tags[ lbl ]:
-                  self._tags[ lbl ].remove( ref )
+               self._tags[ lbl ].pop( e )
 
    #-----------------------------------------------------------------------
    def hasTag( self, element, label ):
@@ -774,8 +1035,17 @@ class StyleManager( object ):
       - styles    A list of style names that are to be assiciated with the
                   specified element.
       """
+      previous = self.getElementStyles( element )
+
       setattr( element, ELEMENT_STYLES_PROPERTY % self.prefix, styles )
 
+      if previous != styles:
+         # Make sure that 'reapply' will update the element
+         for name in set( previous ) | set( styles ):
+            data = self._styles.get( name )
+            if ( data is not None ) and ( element in data.elements ):
+               data.elements[ element ] = None
+
    #-----------------------------------------------------------------------
    def _searchPath( self, dirs ):
       """: Determine the actual search path.
@@ -814,6 +1084,204 @@ class StyleManager( object ):
 
       return actualPaths
 
+   #-----------------------------------------------------------------------
+   def _getStyleData( self, name ):
+      """: Get the data of a managed style, loading the style if needed.
+
+      = INPUT VARIABLES
+      - name    The name of the style.
+
+      = RETURN VALUE
+      - Returns the StyleData of the style, or None if there is no style with
+        that name.
+      """
+      self._loadPending( name )
+      return self._styles.get( name )
+
+   #-----------------------------------------------------------------------
+   def _loadPending( self, name ):
+      """: Load a style that a lazy 'load' found, if it is not loaded yet.
+
+      = INPUT VARIABLES
+      - name    The name of the style.
+      """
+      fname = self._pending.pop( name, None )
+
+      if fname is not None:
+         self.loadFile( fname, ignoreIfExists = True )
+
+   #-----------------------------------------------------------------------
+   def _readStyleName( self, fname ):
+      """: Get the name of the style in a file without loading it.
+
+      Sub-classes that can read the name of a style cheaply override this.
+
+      = INPUT VARIABLES
+      - fname    The path of the style file.
+
+      = RETURN VALUE
+      - Returns the name of the style, or None if the file needs to be loaded
+        to know it.
+      """
+      return None
+
+   #-----------------------------------------------------------------------
+   def _getCacheDir( self ):
+      """: Determine the directory of the style file cache.
+
+      = RETURN VALUE
+      - Returns the cache directory, or None if style files are not cached.
+      """
+      cacheDir = self.cacheDir
+      if cacheDir is None:
+         cacheDir = os.getenv( DEFAULT_CACHE_ENVVAR[ 1: ], "" )
+
+      if not cacheDir:
+         return None
+
+      return os.path.normpath( os.path.expanduser \
+                               ( os.path.expandvars( cacheDir ) ) )
+
+   #-----------------------------------------------------------------------
+   def _getCacheEntry( self, cacheDir, fname ):
+      """: Get the name of the cache file of a style file.
+
+      = INPUT VARIABLES
+      - cacheDir  The cache directory.
+      - fname     The path of the style file.
+
+      = RETURN VALUE
+      - Returns the path of the cache file.
+      """
+      key = hashlib.sha1( os.path.abspath( fname ) ).hexdigest()
+      return os.path.join( cacheDir, "%s.cache" % key )
+
+   #-----------------------------------------------------------------------
+   def _getCacheVersion( self ):
+      """: Get the version of the library that writes the style file cache.
+
+      Entries written by another version are not used.
+
+      = RETURN VALUE
+      - Returns the version string.
+      """
+      # Specialize in derived class.
+      return __version__
+
+   #-----------------------------------------------------------------------
+   def _readCache( self, fname ):
+      """: Get the cached style of a style file.
+
+      The style is used if the style file has the same modification time and
+      size as when it was cached.  Otherwise it is only used if the contents
+      of the file are the same (eg. the file was copied or checked out
+      again).  Entries of another cache format or library version, and
+      entries that the style can not be created from, are not used.
+
+      = INPUT VARIABLES
+      - fname    The path of the style file.
+
+      = RETURN VALUE
+      - Returns the style created from the state stored by '_writeCache', or
+        None if the file is not cached or has changed since it was.
+      """
+      cacheDir = self._getCacheDir()
+      if cacheDir is None:
+         return None
+
+      entry = self._getCacheEntry( cacheDir, fname )
+
+      try:
+         with open( entry, 'rb' ) as fin:
+            formatVersion, version, key, state = cPickle.load( fin )
+
+         path, mtime, size, digest = key
+         stat = os.stat( fname )
+      except Exception:
+         # There is no usable entry for the file
+         return None
+
+      if ( formatVersion != CACHE_FORMAT_VERSION ) or \
+         ( version != self._getCacheVersion() ):
+         return None
+
+      if path != os.path.abspath( fname ) or size != stat.st_size:
+         return None
+
+      if mtime != stat.st_mtime:
+         if digest != self._getFileDigest( fname ):
+            return None
+
+         refresh = True
+      else:
+         refresh = False
+
+      try:
+         style = self.styleClass.fromState( state )
+      except Exception:
+         # The state does not match this version of the style
+         return None
+
+      if refresh:
+         # Store the new time, so the contents do not need to be checked
+         self._writeCache( fname, state, digest )
+
+      return style
+
+   #-----------------------------------------------------------------------
+   def _writeCache( self, fname, state, digest = None ):
+      """: Store the state of the style of a style file in the cache.
+
+      Any errors are logged, since the style file can always be loaded
+      without the cache.
+
+      = INPUT VARIABLES
+      - fname    The path of the style file.
+      - state    The state of the style (see Style.getState).  This must be
+                 able to be pickled.
+      - digest   The digest of the contents of the file (if known).
+      """
+      cacheDir = self._getCacheDir()
+      if cacheDir is None:
+         return
+
+      try:
+         if not os.path.exists( cacheDir ):
+            os.makedirs( cacheDir )
+
+         stat = os.stat( fname )
+         if digest is None:
+            digest = self._getFileDigest( fname )
+
+         key = ( os.path.abspath( fname ), stat.st_mtime, stat.st_size, digest )
+
+         # Write a new file and then replace the entry with it, so that other
+         # processes never read part of an entry.
+         fd, tmpName = tempfile.mkstemp( dir = cacheDir )
+         with os.fdopen( fd, 'wb' ) as fout:
+            record = ( CACHE_FORMAT_VERSION, self._getCacheVersion(), key,
+                      state )
+            cPickle.dump( record, fout, cPickle.HIGHEST_PROTOCOL )
+
+         os.rename( tmpName, self._getCacheEntry( cacheDir, fname ) )
+      except Exception, e:
+         msg = "StyleManager: Unable to cache the style file '%s': %s" % \
+               (fname, e)
+         logging.warning( msg )
+
+   #-----------------------------------------------------------------------
+   def _getFileDigest( self, fname ):
+      """: Get the digest of the contents of a file.
+
+      = INPUT VARIABLES
+      - fname    The path of the file.
+
+      = RETURN VALUE
+      - Returns the hex digest of the contents.
+      """
+      with open( fname, 'rb' ) as fin:
+         return hashlib.sha1( fin.read() ).hexdigest()
+
    #-----------------------------------------------------------------------
    def _loadFromFile( self, name, fname ):
       """: Load the specified style file.
@@ -859,11 +1327,13 @@ class StyleManager( object ):
       = RETURN VALUE
       - Will return the style with the given name.
       """
-      if name in self._styles:
-         return self._styles[ name ].style
+      data = self._getStyleData( name )
+
+      if data is not None:
+         return data.style
       else:
          msg = "Invalid style '%s'.  Valid values are:\n" % (name)
-         for name in self._styles:
+         for name in self.getAll():
             msg += "   * %s\n" % name
 
          raise Exception( msg )
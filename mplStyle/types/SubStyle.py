@@ -43,6 +43,7 @@ __version__ = "$Revision: #1 $"
 #===========================================================================
 
 import inspect
+import weakref
 
 from copy import copy
 
@@ -51,6 +52,48 @@ from .StyleProperty import StyleProperty
 
 __all__ = [ 'SubStyle' ]
 
+# Values of these types are shared instead of copied between instances.
+_IMMUTABLE_TYPES = ( type( None ), bool, int, long, float, basestring, tuple )
+
+#===========================================================================
+class _Unset( object ):
+   """: The type of the value of a nested SubStyle that was never created.
+   """
+
+   #-----------------------------------------------------------------------
+   def __repr__( self ):
+      """: Get a string representation of this instance.
+      """
+      return "_UNSET"
+
+   #-----------------------------------------------------------------------
+   def __reduce__( self ):
+      """: Pickle this as a reference to the shared instance.
+      """
+      return "_UNSET"
+
+   #-----------------------------------------------------------------------
+
+# The value shared by each nested SubStyle that was never created.
+_UNSET = _Unset()
+
+#===========================================================================
+def _isPlainProperty( prop ):
+   """: Determine if a property can be initialized from a template.
+
+   = INPUT VARIABLES
+   - prop   The StyleProperty to check.
+
+   = RETURN VALUE
+   - Returns True if the property stores its default in the instance
+     dictionary without doing anything else, and the default is immutable.
+   """
+   propType = prop.__class__
+
+   return ( propType.initialize.im_func is StyleProperty.initialize.im_func ) \
+      and ( propType.__set__.im_func is StyleProperty.__set__.im_func ) \
+      and isinstance( prop.default, _IMMUTABLE_TYPES )
+
 #===========================================================================
 class _SubStyleFactory( type ):
    """: Allow us to create/validate instance attributes.
@@ -125,6 +168,7 @@ class _SubStyleFactory( type ):
       """
       # Delay load to avoid circular imports
       from .property import Alias
+      from .property import SubStyle as SubStyleProperty
 
       # Each SubStyle derived class needs to track the aliases it contains
       cls._aliases = {}
@@ -147,6 +191,9 @@ class _SubStyleFactory( type ):
             value._owner = cls
 
          if isinstance( value, Alias ):
+            # Resolve the alias path once instead of on every access
+            value.compile()
+
             # Keep track of aliases
             propName = value.alias
             if propName not in cls._aliases:
@@ -168,6 +215,22 @@ class _SubStyleFactory( type ):
 
       cls._propertyNames.sort()
 
+      # Pre-compute how instances of this class are initialized.  Properties
+      # with an immutable default are copied from a template of default
+      # values, the rest are initialized by the property.  Nested SubStyles
+      # are not created until they are used.
+      cls._propertyTemplate = {}
+      cls._propertyInitializers = []
+
+      for name in cls._propertyNames:
+         value = getattr( cls, name )
+         if _isPlainProperty( value ):
+            cls._propertyTemplate[ name ] = value.default
+         elif isinstance( value, SubStyleProperty ):
+            cls._propertyTemplate[ name ] = _UNSET
+         else:
+            cls._propertyInitializers.append( ( name, value ) )
+
    #-----------------------------------------------------------------------
    def __call__( cls, *args, **kwargs ):
       """: Construct an instance of SubStyle class.
@@ -207,6 +270,10 @@ class SubStyle( object ):
 
    _propertyNames = []
 
+   # A new copy of the default of a nested SubStyle that was never created
+   # stores the container and name to be set in once it is changed.
+   _pendingOwner = None
+
    #-----------------------------------------------------------------------
    def __new__( cls, **kwargs ):
       """: Initialize the StyleProperty instances to their defaults.
@@ -218,12 +285,20 @@ class SubStyle( object ):
       # Call the base class new
       instance = object.__new__( cls, **kwargs )
 
-      # For each class member that is a StyleProperty, set to default
-      for memberName in dir( cls ):
-         member = getattr( cls, memberName )
-         if isinstance( member, StyleProperty ):
-            # Set the value for this instance to the default value
-            member.initialize( instance, memberName, kwargs )
+      # The containers this instance reports its changes to.  This must be
+      # set before any SubStyle members are set.
+      object.__setattr__( instance, '_owners', [] )
+
+      # Set each StyleProperty to its default value.
+      template = cls._propertyTemplate
+      instance.__dict__.update( template )
+
+      for memberName in kwargs:
+         if memberName in template:
+            setattr( instance, memberName, kwargs[ memberName ] )
+
+      for memberName, member in cls._propertyInitializers:
+         member.initialize( instance, memberName, kwargs )
 
       # Return the newly created instance
       return instance
@@ -275,13 +350,26 @@ class SubStyle( object ):
          subName = name[ idx+1: ]
          name = name[ :idx ]
 
-      if hasattr( self, name ) or ( name in properties ) or \
+      if ( name in properties ) or hasattr( self, name ) or \
          ( not self._restricted_setattr ):
          if subName:
             obj = getattr( self, name )
             setattr( obj, subName, value )
          else:
+            previous = self.__dict__.get( name )
             object.__setattr__( self, name, value )
+            current = self.__dict__.get( name )
+
+            # Any SubStyle member reports its changes to this instance
+            if current is not previous:
+               if isinstance( previous, SubStyle ):
+                  previous._removeOwner( self, name )
+
+               if isinstance( current, SubStyle ):
+                  current._addOwner( self, name )
+
+            if self._restricted_setattr and not name.startswith( '_' ):
+               self._changed( name )
       else:
          msg = "Unable to set the property '%s' to the specified value.  " \
                "No property with that name exists.  Valid properties are:" \
@@ -292,6 +380,106 @@ class SubStyle( object ):
 
          raise Exception( msg )
 
+   #-----------------------------------------------------------------------
+   def _addOwner( self, owner, name ):
+      """: Report the changes of this instance to the given container.
+
+      = INPUT VARIABLES
+      - owner   The SubStyle or Style that contains this instance.  It must
+                have a '_changed' method.
+      - name    The name of the member of 'owner' that is this instance.
+      """
+      self._owners.append( ( weakref.ref( owner ), name ) )
+
+   #-----------------------------------------------------------------------
+   def _removeOwner( self, owner, name ):
+      """: Stop reporting the changes of this instance to the given container.
+
+      = INPUT VARIABLES
+      - owner   The SubStyle or Style that contained this instance.
+      - name    The name of the member of 'owner' that was this instance.
+      """
+      self._owners[:] = [ ( ref, n ) for ref, n in self._owners
+                          if ( ref() is not owner ) or ( n != name ) ]
+
+   #-----------------------------------------------------------------------
+   def _changed( self, name ):
+      """: Report that a property of this instance has changed.
+
+      The change is reported to each container of this instance, prefixed
+      with the name the container uses for this instance.
+
+      = INPUT VARIABLES
+      - name   The name of the property that changed.  Nested property names
+               are concatenated together with '.'  Eg 'a.b.property'
+      """
+      # The pending container must be kept alive until it has been told
+      # about the change, so that it can store itself in its own container.
+      pending = self._pendingOwner
+      if pending is not None:
+         self._attach()
+
+      for ref, ownerName in self._owners:
+         owner = ref()
+         if owner is None:
+            continue
+
+         if ownerName:
+            owner._changed( '%s.%s' % ( ownerName, name ) )
+         else:
+            owner._changed( name )
+
+   #-----------------------------------------------------------------------
+   def _attach( self ):
+      """: Store this in the container that it was created for.
+
+      This is a copy of the default of a nested SubStyle that was never
+      created.  Unless the container has been given another value since,
+      this becomes the value of the container.
+      """
+      owner, name = self._pendingOwner
+      del self.__dict__[ '_pendingOwner' ]
+
+      if owner._isUnset( name ):
+         owner.__dict__[ name ] = self
+         self._addOwner( owner, name )
+
+   #-----------------------------------------------------------------------
+   def _isUnset( self, name ):
+      """: Determine if a nested SubStyle was never created.
+
+      = INPUT VARIABLES
+      - name   The name of the property to check.
+
+      = RETURN VALUE
+      - Returns True if the named property is a nested SubStyle that was
+        never created.
+      """
+      value = self.__dict__.get( name )
+      return ( value is _UNSET ) or isinstance( value, weakref.ref )
+
+   #-----------------------------------------------------------------------
+   def _peek( self, name ):
+      """: Get the value of a property without creating a nested SubStyle.
+
+      = INPUT VARIABLES
+      - name   The name of the property to get.
+
+      = RETURN VALUE
+      - Returns the value of the named property.  If the property is a nested
+        SubStyle that was never created, then this returns the shared default
+        value if it has anything set, and _UNSET otherwise.  The shared
+        default must not be changed.
+      """
+      if self._isUnset( name ):
+         prop = getattr( self.__class__, name )
+         if prop.isDefaultSet():
+            return prop.default
+         else:
+            return _UNSET
+
+      return getattr( self, name )
+
    #-----------------------------------------------------------------------
    def __str__( self ):
       """: Get a string representation of this instance.
@@ -382,8 +570,8 @@ class SubStyle( object ):
       properties = self.propertyNames()
 
       for p in properties:
-         value = getattr( self, p )
-         if value is not None:
+         value = self._peek( p )
+         if ( value is not None ) and ( value is not _UNSET ):
             if isinstance( value, SubStyle ):
                result = value.hasAnySet()
                if result:
@@ -476,11 +664,14 @@ class SubStyle( object ):
       for p in properties:
          # Only if the sub-style has the property
          if hasattr( subStyle, p ):
-            v1 = getattr( self, p )
-            v2 = getattr( subStyle, p )
+            if isinstance( subStyle, SubStyle ):
+               v2 = subStyle._peek( p )
+            else:
+               v2 = getattr( subStyle, p )
 
             # Only if the sub-style property is set
-            if v2 is not None:
+            if ( v2 is not None ) and ( v2 is not _UNSET ):
+               v1 = getattr( self, p )
                if isinstance( v1, SubStyle ):
                   # If this is a sub-sub-style
                   v1.update( v2 )
@@ -500,8 +691,12 @@ class SubStyle( object ):
       kw = {}
 
       for p in properties:
-         value = getattr( self, p )
-         if value != getattr( self.__class__, p ).default:
+         value = self._peek( p )
+         if value is _UNSET:
+            continue
+
+         if isinstance( value, SubStyle ) or \
+            ( value != getattr( self.__class__, p ).default ):
          #if value is not None:
             if isinstance( value, SubStyle ):
                if recursive:
@@ -522,7 +717,51 @@ class SubStyle( object ):
       = RETURN VALUE
       - Return  a copy of this class type
       """
-      result = self.__class__( **self.kwargs() )
+      result = self._clone()
+
+      if result is None:
+         result = self.__class__( **self.kwargs() )
+
+      return result
+
+   #-----------------------------------------------------------------------
+   def _clone( self ):
+      """: Copy this object without calling the constructor.
+
+      = RETURN VALUE
+      - Returns a copy of this object.  If this has a member that is not a
+        SubStyle, a StyleProperty or an immutable value, then this does not
+        know how to copy it and returns None.
+      """
+      # Delay load to avoid circular imports
+      from .property import Alias
+
+      cls = self.__class__
+      result = object.__new__( cls )
+      object.__setattr__( result, '_owners', [] )
+      members = result.__dict__
+
+      for name, value in self.__dict__.iteritems():
+         if name in ( '_owners', '_pendingOwner' ):
+            continue
+         elif ( value is _UNSET ) or isinstance( value, weakref.ref ):
+            value = _UNSET
+         elif isinstance( value, _IMMUTABLE_TYPES ):
+            pass
+         elif isinstance( value, SubStyle ):
+            if isinstance( getattr( cls, name, None ), Alias ):
+               # The alias value is set when its target is copied
+               return None
+
+            value = value.copy()
+            value._addOwner( result, name )
+         elif isinstance( value, StyleProperty ):
+            value = copy( value )
+         else:
+            return None
+
+         members[ name ] = value
+
       return result
 
    def copy( self ):
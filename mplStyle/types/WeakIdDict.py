@@ -0,0 +1,247 @@
+#===========================================================================
+#
+# Copyright (c) 2014, California Institute of Technology.
+# U.S. Government Sponsorship under NASA Contract NAS7-03001 is
+# acknowledged.  All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# 1. Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#===========================================================================
+
+""": A dictionary of weakly referenced elements, keyed by their identity."""
+
+__version__ = "$Revision: #1 $"
+
+#===========================================================================
+import weakref
+#===========================================================================
+
+__all__ = [ 'WeakIdDict' ]
+
+#===========================================================================
+class WeakIdDict( object ):
+   """: A dictionary whose keys are weakly referenced elements.
+
+   This is like a weakref.WeakKeyDictionary, except that the elements are
+   found by their identity instead of by 'hash' and '=='.  Some elements
+   (eg. a matplotlib FontProperties) compute their hash from values that a
+   style changes, so they could not be found again once they were styled.
+   An element is removed when it is deleted.
+   """
+
+   #-----------------------------------------------------------------------
+   def __init__( self, items = None ):
+      """: Create a new WeakIdDict object.
+
+      = INPUT VARIABLES
+      - items   A list of ( element, value ) pairs to add.
+      """
+      # The weak reference and value of each element.
+      #  Key: The id of the element.
+      #  Value: A tuple of the weak reference and the value.
+      self._data = {}
+
+      for obj, value in ( items or [] ):
+         self[ obj ] = value
+
+   #-----------------------------------------------------------------------
+   @classmethod
+   def fromkeys( cls, objs, value = None ):
+      """: Create a new WeakIdDict with the same value for each element.
+
+      = INPUT VARIABLES
+      - objs    The elements to add.
+      - value   The value of each element.
+
+      = RETURN VALUE
+      - Returns the new WeakIdDict.
+      """
+      return cls( [ ( obj, value ) for obj in objs ] )
+
+   #-----------------------------------------------------------------------
+   def _entry( self, obj ):
+      """: Get the weak reference and value of an element.
+
+      = INPUT VARIABLES
+      - obj    The element to look for.
+
+      = RETURN VALUE
+      - Returns the tuple of the weak reference and the value, or None if the
+        element is not in this object.
+      """
+      entry = self._data.get( id( obj ) )
+
+      if ( entry is not None ) and ( entry[0]() is obj ):
+         return entry
+
+      return None
+
+   #-----------------------------------------------------------------------
+   def __setitem__( self, obj, value ):
+      """: Set the value of an element.
+
+      = INPUT VARIABLES
+      - obj     The element.
+      - value   The value of the element.
+      """
+      entry = self._entry( obj )
+
+      if entry is not None:
+         ref = entry[0]
+      else:
+         key = id( obj )
+         selfRef = weakref.ref( self )
+
+         def remove( ref ):
+            # Remove the entry, unless it was replaced by another element
+            # with the same id.
+            d = selfRef()
+            if d is None:
+               return
+
+            entry = d._data.get( key )
+            if ( entry is not None ) and ( entry[0] is ref ):
+               del d._data[ key ]
+
+         ref = weakref.ref( obj, remove )
+
+      self._data[ id( obj ) ] = ( ref, value )
+
+   #-----------------------------------------------------------------------
+   def __getitem__( self, obj ):
+      """: Get the value of an element.
+
+      = ERROR CONDITIONS
+      - Will throw a KeyError if the element is not in this object.
+
+      = INPUT VARIABLES
+      - obj     The element.
+
+      = RETURN VALUE
+      - Returns the value of the element.
+      """
+      entry = self._entry( obj )
+
+      if entry is None:
+         raise KeyError( obj )
+
+      return entry[1]
+
+   #-----------------------------------------------------------------------
+   def __delitem__( self, obj ):
+      """: Remove an element.
+
+      = ERROR CONDITIONS
+      - Will throw a KeyError if the element is not in this object.
+
+      = INPUT VARIABLES
+      - obj     The element to remove.
+      """
+      if self._entry( obj ) is None:
+         raise KeyError( obj )
+
+      del self._data[ id( obj ) ]
+
+   #-----------------------------------------------------------------------
+   def __contains__( self, obj ):
+      """: Check if an element is in this object.
+      """
+      return self._entry( obj ) is not None
+
+   #-----------------------------------------------------------------------
+   def __len__( self ):
+      """: Get the number of elements.
+      """
+      return len( self._data )
+
+   #-----------------------------------------------------------------------
+   def __iter__( self ):
+      """: Iterate over the elements.
+      """
+      return iter( self.keys() )
+
+   #-----------------------------------------------------------------------
+   def get( self, obj, default = None ):
+      """: Get the value of an element.
+
+      = INPUT VARIABLES
+      - obj       The element.
+      - default   The value to return if the element is not in this object.
+
+      = RETURN VALUE
+      - Returns the value of the element, or the default.
+      """
+      entry = self._entry( obj )
+
+      if entry is None:
+         return default
+
+      return entry[1]
+
+   #-----------------------------------------------------------------------
+   def pop( self, obj, default = None ):
+      """: Remove an element and get its value.
+
+      = INPUT VARIABLES
+      - obj       The element to remove.
+      - default   The value to return if the element is not in this object.
+
+      = RETURN VALUE
+      - Returns the value of the element, or the default.
+      """
+      entry = self._entry( obj )
+
+      if entry is None:
+         return default
+
+      del self._data[ id( obj ) ]
+      return entry[1]
+
+   #-----------------------------------------------------------------------
+   def keys( self ):
+      """: Get a list of the elements.
+      """
+      return [ obj for obj, value in self.items() ]
+
+   #-----------------------------------------------------------------------
+   def items( self ):
+      """: Get a list of the ( element, value ) pairs.
+
+      Elements that are being deleted are skipped.
+      """
+      result = []
+
+      for ref, value in self._data.values():
+         obj = ref()
+         if obj is not None:
+            result.append( ( obj, value ) )
+
+      return result
+
+   #-----------------------------------------------------------------------
+
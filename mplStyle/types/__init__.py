@@ -41,6 +41,7 @@ __version__ = "$Revision: #1 $"
 #===========================================================================
 from . import convert
 from .Data import Data
+from .Defaults import Defaults
 from . import property
 from .Style import Style
 from .StyleManager import StyleManager
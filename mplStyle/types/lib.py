@@ -42,6 +42,7 @@ __version__ = "$Revision: #1 $"
 import os
 import os.path as path
 
+from .Defaults import Defaults
 from .SubStyle import SubStyle
 #===========================================================================
 
@@ -113,21 +114,20 @@ def resolveDefaults( defaults, subNames = [], **kwargs ):
 
    What this funtion will do is:
 
-      1) Make a duplicate of the default dictionary to be modified and
-         returned.
+      1) Use the given defaults as the base of the Defaults to be returned.
 
       2) For each keyword-value parameter that is not set to None, that value
-         will be set in the dictionary to be returned.  If the value is itself
-         a dictionary, then it will be "merged" into the return dictionary.
+         will be set in the Defaults to be returned.  If the value is itself
+         a dictionary, then it will be "merged" into the returned Defaults.
 
       3) For each of the names specified by subNames that exists in the default
-         dictionary, its values will be set in the dictionary to be returned.
+         dictionary, its values will be set in the Defaults to be returned.
          If the value is itself a dictionary, then it will be "merged" into the
-         return dictionary.  It is important to note that the order of the
+         returned Defaults.  It is important to note that the order of the
          names specified in 'subNames' is important as that is the order
          in which they are resolved.
 
-      4) Returns the return dictionary.
+      4) Returns the Defaults.
 
    When a dictionary 'A' is "merged" into another dictionary 'B', this is much
    like the built-in dictionary 'update' method ( 'B.update( A )' ).  The
@@ -135,6 +135,10 @@ def resolveDefaults( defaults, subNames = [], **kwargs ):
    in 'B' and for any values that are themselves dictionaries, then they will
    be "merged".
 
+   = NOTE
+   The result is a new layer on top of the given defaults (see Defaults), so
+   neither the defaults nor any of the dictionaries are copied.
+
    = INPUT VARIABLES
    - defaults  The current set of default values to resolve with.
    - subNames  A list of names of sub-properties to resolve (in the order
@@ -142,48 +146,32 @@ def resolveDefaults( defaults, subNames = [], **kwargs ):
    - kwargs    Optional keyword arguments to also resolve.
 
    = RETURN VALUE
-   - Return a new dictionary of default values.
+   - Return a new Defaults of default values.
    """
-   # First duplicate the given defaults
-   subDefaults = {}
-   subDefaults.update( defaults )
-
-   # Next add in any keyword arguments
-   for key in kwargs:
-      value = kwargs[ key ]
-
-      # If the kw value is not set, then ignore
-      if value is None:
-         continue
+   if not isinstance( defaults, Defaults ):
+      defaults = Defaults( defaults )
 
-      # We have a kw value and nothing has been set yet.
-      if isinstance( value, SubStyle ):
-         value = value.kwargs()
+   subDefaults = defaults
 
-      if isinstance( value, dict ) and ( key in subDefaults ):
-         other = subDefaults[ key ]
-         if isinstance( other, SubStyle ):
-            other = other.kwargs()
-
-         value = mergeDicts( other, value )
+   # First add in any keyword arguments that are set
+   values = {}
+   for key in kwargs:
+      if kwargs[ key ] is not None:
+         values[ key ] = kwargs[ key ]
 
-      # Store the value
-      subDefaults[ key ] = value
+   if values:
+      subDefaults = subDefaults.layer( values )
 
    for name in subNames:
-      if name in defaults:
-         tmp = defaults[ name ]
+      tmp = defaults.get( name )
 
-         if tmp is None:
-            continue
-
-         if isinstance( tmp, SubStyle ):
-            tmp = tmp.kwargs()
+      if tmp is None:
+         continue
 
-         if isinstance( tmp, dict ):
-            subDefaults = mergeDicts( subDefaults, tmp )
-         else:
-            subDefaults[ name ] = tmp
+      if Defaults.isMapping( tmp ):
+         subDefaults = subDefaults.layer( tmp )
+      else:
+         subDefaults = subDefaults.layer( { name : tmp } )
 
    return subDefaults
 
@@ -67,8 +67,52 @@ class Alias( StyleProperty ):
       self.isProperty = isProperty
       self.typeName = "Unknown"
 
+      # The compiled alias path.  This is set by 'compile'.
+      self._parentNames = None
+      self._leafName = None
+
       StyleProperty.__init__( self, None, doc = doc )
 
+   #-----------------------------------------------------------------------
+   def compile( self ):
+      """: Compile the alias path.
+
+      This splits the alias path once, so that getting and setting the alias
+      does not need to do it again.  This is called when the SubStyle class
+      that owns this property is created.
+      """
+      objectNames = self.alias.split( '.' )
+
+      self._parentNames = tuple( objectNames[ :-1 ] )
+      self._leafName = objectNames[ -1 ]
+
+   #-----------------------------------------------------------------------
+   def _getParent( self, instance ):
+      """: Get the parent of the aliased property of an instance.
+
+      This follows the compiled alias path directly.  If that fails, then
+      this falls back to _getParentOfProperty for its error handling.
+
+      = INPUT VARIABLES
+      - instance   The instance of the class this is a property in.
+
+      = RETURN VALUES
+      - Returns the parent object that has the property and the single name of
+        the property without any parent objects.
+      """
+      if self._parentNames is None:
+         self.compile()
+
+      currentObject = instance
+
+      try:
+         for name in self._parentNames:
+            currentObject = getattr( currentObject, name )
+      except AttributeError:
+         return self._getParentOfProperty( instance )
+
+      return currentObject, self._leafName
+
    #-----------------------------------------------------------------------
    def _getParentOfProperty( self, instance ):
       """: Get the parent of the specified property.
@@ -130,7 +174,7 @@ class Alias( StyleProperty ):
       this is a 'descriptor' class.  This allows us to control how 
       instances of this class act when being get and/or set.
 
-      The actual value is stored in the instance's __dict__
+      The actual value is stored in the aliased property.
 
       = INPUT VARIABLES
       - instance    The class (or container) instance that owns an instance
@@ -145,7 +189,7 @@ class Alias( StyleProperty ):
       """
       if instance:
          # Get the parent object and the property name
-         parent, name = self._getParentOfProperty( instance )
+         parent, name = self._getParent( instance )
 
          if parent is None:
             value = None
@@ -168,9 +212,6 @@ class Alias( StyleProperty ):
             else:
                value = subProperty
 
-         # we set the value in the local dictionary to help with introspection
-         instance.__dict__[ self.name ] = value
-
          # return the value
          return value
       else:
@@ -203,7 +244,7 @@ class Alias( StyleProperty ):
       from ..SubStyle import SubStyle
 
       # Get the parent object and the property name
-      parent, name = self._getParentOfProperty( instance )
+      parent, name = self._getParent( instance )
       if parent:
          if self.isProperty:
             setattr( parent, name, value )
@@ -224,6 +265,10 @@ class Alias( StyleProperty ):
                subProperty._name = self.name
                subProperty.__set__( parent, value )
 
+               if parent is instance:
+                  # The validated value is already stored locally
+                  return
+
                # Get the validated value, so we can store it locally
                value = subProperty.__get__( parent, None )
             else:
@@ -39,8 +39,10 @@ __version__ = "$Revision: #1 $"
 
 #===========================================================================
 from ..StyleProperty import StyleProperty
+from ..SubStyle import _UNSET
 from copy import copy
 from .. import convert as cvt
+import weakref
 #===========================================================================
 
 __all__ = [ 'SubStyle' ]
@@ -73,8 +75,28 @@ class SubStyle( StyleProperty ):
       self.kwargs = kwargs
       style = self.styleClass( **self.kwargs )
 
+      # Whether the default has any property set.  This is set the first
+      # time it is needed (see 'isDefaultSet').
+      self._defaultSet = None
+
       StyleProperty.__init__( self, style, validator, doc )
 
+   #-----------------------------------------------------------------------
+   def isDefaultSet( self ):
+      """: Determine if the default value has any property set.
+
+      = NOTE
+      - The result is cached, so the default value should not be changed
+        after this is called.
+
+      = RETURN VALUE
+      - Returns True if the default value has any property set.
+      """
+      if self._defaultSet is None:
+         self._defaultSet = self.default.hasAnySet()
+
+      return self._defaultSet
+
    #-----------------------------------------------------------------------
    def validate( self, value ):
       """: Validate and return a valid value
@@ -98,6 +120,71 @@ class SubStyle( StyleProperty ):
       # Now validate as before
       return StyleProperty.validate( self, value )
 
+   #-----------------------------------------------------------------------
+   def initialize( self, instance, memberName, kwargs ):
+      """: Set the named property to the default value.
+
+      The SubStyle instance is not created until it is used (see __get__).
+
+      = INPUT VARIABLES
+      - instance    The class instance that contains the property to be set.
+      - memberName  The name of the member to be set to the default value.
+      - kwargs      A dictionary of possible initial values to search for an
+                    initial value to use for this property.  If a value is
+                    found for this property, it will be removed from the
+                    dictionary.
+      """
+      if memberName in kwargs:
+         setattr( instance, memberName, kwargs.pop( memberName ) )
+      else:
+         instance.__dict__[ memberName ] = _UNSET
+
+   #-----------------------------------------------------------------------
+   def __get__( self, instance, owner ):
+      """: Get the value stored for the instance of this class.
+
+      If the SubStyle instance has not been created yet, then this returns a
+      new copy of the default value.  The copy is only stored in the instance
+      once one of its properties is set, so reading an unset SubStyle does
+      not make the instance any larger.  Until then, getting the value again
+      returns the same copy as long as it is in use.
+
+      = INPUT VARIABLES
+      - instance    The class (or container) instance that owns an instance
+                    of this class.
+      - owner       The class type of the instance that owns an instance of
+                    this class.
+
+      = RETURN VALUE
+      - Returns the value for this stype type instance.
+      """
+      if instance:
+         value = instance.__dict__[ self.name ]
+
+         if value is _UNSET:
+            value = None
+         elif isinstance( value, weakref.ref ):
+            value = value()
+         else:
+            return value
+
+         if value is None:
+            if self.isDefaultSet():
+               value = copy( self.default )
+            else:
+               # A new instance is the same as a copy of a default that has
+               # nothing set, and is much faster to make.
+               value = self.default.__class__()
+
+            object.__setattr__( value, '_pendingOwner', ( instance, self.name ) )
+            instance.__dict__[ self.name ] = weakref.ref( value )
+
+         return value
+      else:
+         # We are getting the value from the class and not from the
+         # class instance.
+         return self
+
    #-----------------------------------------------------------------------
    def __str__( self ):
       """: Get a string representation of this instance.
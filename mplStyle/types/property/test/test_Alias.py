@@ -257,5 +257,36 @@ class TestAlias( unittest.TestCase ):
       self.assertEqual( None, MySubStyle.prop.getType(),
                msg = "Invalid type for aliased member data" )
 
+   #-----------------------------------------------------------------------
+   def testCompile( self ):
+      """Test compiled Alias paths."""
+      self.assertEqual( ( '_subSubValue', ), MySubStyle.ssprop._parentNames,
+               msg = "Alias path was not compiled with the class" )
+      self.assertEqual( 'value', MySubStyle.ssprop._leafName,
+               msg = "Alias name was not compiled with the class" )
+
+      style = MySubStyle()
+      style._subSubValue.value = 2.5
+      self.assertEqual( 2.5, style.ssprop,
+               msg = "Invalid value for compiled alias 'ssprop'" )
+      self.assertEqual( None, style.__dict__[ 'ssprop' ],
+               msg = "Getting an alias changed the instance" )
+
+      style.ssprop = 3.5
+      self.assertEqual( 3.5, style._subSubValue.value,
+               msg = "Failed to set compiled alias 'ssprop'" )
+      self.assertEqual( 3.5, style.__dict__[ 'ssprop' ],
+               msg = "Failed to store the alias value locally" )
+
+      style.prop = 4.0
+      self.assertEqual( 4.0, style.prop,
+               msg = "Invalid value for compiled alias 'prop'" )
+
+      # An alias that is not part of a class is compiled when used
+      prop = S.property.Alias( '_subSubValue.value' )
+      prop._name = 'free'
+      self.assertEqual( 3.5, prop.__get__( style, MySubStyle ),
+               msg = "Invalid value for a free alias" )
+
 #=======================================================================
 
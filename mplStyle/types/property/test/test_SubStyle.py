@@ -132,5 +132,91 @@ class TestSubStyle( unittest.TestCase ):
       self.assertEqual( s, str(prop),
                msg = "Incorrect standalone string value" )
 
+   #-----------------------------------------------------------------------
+   def testCopy( self ):
+      """Test copying SubStyle style properties."""
+      self.assertEqual( { 'value' : None }, MySubSubStyle._propertyTemplate,
+               msg = "Invalid property template" )
+      self.assertEqual( [], MySubStyle._propertyInitializers,
+               msg = "Invalid property initializers" )
+
+      style = MySubStyle()
+      style.prop.value = 5.0
+
+      newStyle = style.copy()
+      self.assertEqual( 5.0, newStyle.prop.value,
+               msg = "Invalid value for the copy" )
+      self.assertTrue( newStyle.prop is not style.prop,
+               msg = "Failed to copy the sub-style" )
+
+      newStyle.prop.value = 3.0
+      self.assertEqual( 5.0, style.prop.value,
+               msg = "Changing the copy changed the original" )
+
+      # Changes to the copy are reported to the copy
+      changes = []
+      newStyle._changed = changes.append
+      newStyle.prop.value = 4.0
+      self.assertEqual( [ 'prop.value' ], changes,
+               msg = "Copied sub-style did not report its changes" )
+
+      # Members that cannot be cloned use the constructor
+      object.__setattr__( style, 'extra', [] )
+      self.assertEqual( None, style._clone(),
+               msg = "Cloned an unknown member" )
+      self.assertEqual( 5.0, style.copy().prop.value,
+               msg = "Invalid value for the constructed copy" )
+
+   #-----------------------------------------------------------------------
+   def testLazy( self ):
+      """Test creating SubStyle style properties when they are used."""
+      style = MySubStyle()
+      self.assertEqual( True, style._isUnset( 'prop' ),
+               msg = "Created the sub-style before it was used" )
+      self.assertEqual( False, style.hasAnySet(),
+               msg = "Invalid 'hasAnySet' for an unset sub-style" )
+      self.assertEqual( {}, style.kwargs(),
+               msg = "Invalid 'kwargs' for an unset sub-style" )
+
+      # Reading does not store the sub-style
+      prop = style.prop
+      self.assertEqual( None, prop.value,
+               msg = "Invalid value for an unset sub-style" )
+      self.assertEqual( True, prop is style.prop,
+               msg = "Reading the sub-style twice gave different values" )
+      self.assertEqual( True, style._isUnset( 'prop' ),
+               msg = "Reading the sub-style stored it" )
+      self.assertEqual( True, style.copy()._isUnset( 'prop' ),
+               msg = "Copying created the unset sub-style" )
+
+      # Writing stores the sub-style
+      changes = []
+      style._changed = changes.append
+      prop.value = 2.0
+      self.assertEqual( False, style._isUnset( 'prop' ),
+               msg = "Writing the sub-style did not store it" )
+      self.assertEqual( True, prop is style.prop,
+               msg = "Stored a different sub-style" )
+      self.assertEqual( [ 'prop.value' ], changes,
+               msg = "Stored sub-style did not report its changes" )
+
+      # Nested sub-styles that are only used in one expression
+      class MyOuterStyle( S.SubStyle ):
+         outer = S.property.SubStyle( MySubStyle )
+
+      style = MyOuterStyle()
+      style.outer.prop.value = 3.0
+      self.assertEqual( 3.0, style.outer.prop.value,
+               msg = "Failed to store nested sub-styles" )
+
+      # Update only creates the sub-styles that are set
+      newStyle = MyOuterStyle()
+      newStyle.update( MyOuterStyle() )
+      self.assertEqual( True, newStyle._isUnset( 'outer' ),
+               msg = "Update created an unset sub-style" )
+      newStyle.update( style )
+      self.assertEqual( 3.0, newStyle.outer.prop.value,
+               msg = "Invalid updated nested value" )
+
 #=======================================================================
 
@@ -0,0 +1,165 @@
+#===========================================================================
+#
+# Copyright (c) 2014, California Institute of Technology.
+# U.S. Government Sponsorship under NASA Contract NAS7-03001 is
+# acknowledged.  All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+# 1. Redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#===========================================================================
+
+
+"Unit test for the Defaults class."
+
+__version__ = "$Revision: #1 $"
+
+#===========================================================================
+# Required imports.  Do not modify these.
+
+import unittest
+
+#===========================================================================
+# Place all imports after here.
+#
+import mplStyle as S
+
+#
+# Place all imports before here.
+#===========================================================================
+
+#===========================================================================
+class MySubStyle( S.types.SubStyle ):
+   """A Sub-Classed Style."""
+
+   prop = S.types.StyleProperty( default = 0.0, validator = float )
+
+   value = S.types.StyleProperty( default = None )
+
+   #-----------------------------------------------------------------------
+
+#===========================================================================
+class TestDefaults( unittest.TestCase ):
+   """Test the Defaults class."""
+
+   #-----------------------------------------------------------------------
+   def setUp( self ):
+      """This method is called before any tests are run."""
+      pass
+
+   #-----------------------------------------------------------------------
+   def tearDown( self ):
+      """This method is called after all tests are run."""
+      pass
+
+   #=======================================================================
+   # Add tests methods below.
+   # Any method whose name begins with 'test' will be run by the framework.
+
+   #-----------------------------------------------------------------------
+   def testBasic( self ):
+      """A basic test of Defaults."""
+      base = S.types.Defaults( { 'a' : 1, 'b' : 2, 'c' : None } )
+
+      self.assertEqual( 1, base[ 'a' ], msg = "Invalid value." )
+      self.assertEqual( None, base.get( 'c', 5 ), msg = "Invalid None value." )
+      self.assertEqual( 5, base.get( 'd', 5 ), msg = "Invalid missing value." )
+      self.assertEqual( True, 'c' in base, msg = "Invalid contains." )
+      self.assertEqual( False, 'd' in base, msg = "Invalid not contains." )
+      self.assertRaises( KeyError, base.__getitem__, 'd' )
+
+      child = base.layer( { 'b' : 3, 'd' : 4 } )
+
+      self.assertEqual( { 'a' : 1, 'b' : 3, 'c' : None, 'd' : 4 }, child,
+                        msg = "Invalid layer values." )
+      self.assertEqual( [ 'a', 'b', 'c', 'd' ], sorted( child ),
+                        msg = "Invalid keys." )
+      self.assertEqual( 4, len( child ), msg = "Invalid length." )
+
+      # The parent is not changed
+      self.assertEqual( { 'a' : 1, 'b' : 2, 'c' : None }, base,
+                        msg = "Parent was changed by the layer." )
+      self.assertEqual( base, S.types.Defaults( { 'a' : 1, 'b' : 2,
+                                                  'c' : None } ),
+                        msg = "Failed to compare two Defaults." )
+
+   #-----------------------------------------------------------------------
+   def testNested( self ):
+      """Test merging nested values."""
+      nested = { 'prop' : 1.0, 'value' : { 1 : 'a' } }
+      base = S.types.Defaults( { 'value' : nested, 'prop' : 2.0 } )
+
+      child = base.layer( { 'value' : { 'value' : { 2 : 'b' } } } )
+
+      expected = { 'value' : { 'prop' : 1.0, 'value' : { 1 : 'a', 2 : 'b' } },
+                   'prop' : 2.0 }
+      self.assertEqual( expected, child, msg = "Invalid nested merge." )
+      self.assertEqual( True, child[ 'value' ] is child[ 'value' ],
+                        msg = "Nested value was not cached." )
+      self.assertEqual( { 'prop' : 1.0, 'value' : { 1 : 'a' } }, nested,
+                        msg = "Nested dictionary was changed." )
+
+      # SubStyles use the values that were set
+      style = MySubStyle( value = MySubStyle( prop = 3.0 ) )
+      child = base.layer( style )
+
+      expected = { 'value' : { 'prop' : 3.0, 'value' : { 1 : 'a' } },
+                   'prop' : 2.0 }
+      self.assertEqual( expected, child, msg = "Invalid SubStyle merge." )
+
+      # A value that cannot be merged replaces the parent value
+      child = base.layer( { 'value' : 'abc' } )
+      self.assertEqual( 'abc', child[ 'value' ], msg = "Invalid replace." )
+
+   #-----------------------------------------------------------------------
+   def testResolveDefaults( self ):
+      """Test the Defaults returned by lib.resolveDefaults."""
+      base = S.types.Defaults( { 'text' : { 'size' : 10 },
+                                 'labels' : { 'color' : 'red' } } )
+
+      result = S.types.lib.resolveDefaults( base, [ 'text', 'labels' ],
+                                            size = 12, color = None )
+
+      self.assertEqual( True, isinstance( result, S.types.Defaults ),
+                        msg = "Invalid result type." )
+      self.assertEqual( 10, result[ 'size' ], msg = "Invalid size." )
+      self.assertEqual( 'red', result[ 'color' ], msg = "Invalid color." )
+
+      # Each layer shares the values of the given defaults
+      layer = result
+      while layer._parent is not None:
+         layer = layer._parent
+
+      self.assertEqual( True, layer is base,
+                        msg = "The given defaults were not shared." )
+
+      result = S.types.lib.resolveDefaults( base )
+      self.assertEqual( True, result is base,
+                        msg = "Unchanged defaults were not shared." )
+
+   #-----------------------------------------------------------------------
+
@@ -482,6 +482,57 @@ class TestStyleManager( unittest.TestCase ):
       msg = "Failed to throw with invalid parent"
       self.assertRaises( Exception, mgr.create, 'Bad Parent', parent = "Bogus", msg = msg )
 
+   #-----------------------------------------------------------------------
+   def testElementRegistries( self ):
+      """Test tracking the tagged and styled elements."""
+      mgr = MyStyleManager()
+
+      style = MyStyle( 'Registry Style' )
+      style.figure.text.size = 12
+      mgr.add( style )
+
+      def newObj():
+         return S.types.Data( figureTextSize = None )
+
+      def sizes( objs ):
+         return [ obj.figureTextSize for obj in objs ]
+
+      objs = [ newObj() for i in range( 10 ) ]
+      mgr.tag( objs, 'registryTag' )
+      mgr.tag( objs, 'registryTag' )
+      self.assertEqual( 10, len( mgr._tags[ 'registryTag' ] ),
+               msg = "Tagged an element more than once." )
+
+      mgr.untag( objs[ :2 ], 'registryTag' )
+      self.assertEqual( 8, len( mgr._tags[ 'registryTag' ] ),
+               msg = "Failed to untag elements." )
+
+      # Deleted elements are no longer tracked
+      del objs[ 2:4 ]
+      self.assertEqual( 6, len( mgr._tags[ 'registryTag' ] ),
+               msg = "Failed to remove deleted tagged elements." )
+
+      mgr.apply( None, style, tag = 'registryTag' )
+      self.assertEqual( [ None, None ] + [ 12 ] * 6,
+                        sizes( objs ),
+               msg = "Invalid elements styled by tag." )
+
+      data = mgr._styles[ style.name ]
+      self.assertEqual( 6, len( data.elements ),
+               msg = "Invalid styled elements." )
+
+      del objs[ -1 ]
+      self.assertEqual( 5, len( data.elements ),
+               msg = "Failed to remove deleted styled elements." )
+
+      for i in range( len( objs ) ):
+         objs[ i ].figureTextSize = None
+
+      mgr.reapply()
+      self.assertEqual( [ None, None ] + [ 12 ] * 5,
+                        sizes( objs ),
+               msg = "Invalid elements re-styled." )
+
    #-----------------------------------------------------------------------
    def testPersistence( self ):
       """Test reading and writing functionality."""